@@ -18,6 +18,7 @@
     get_tools_for_provider,
     goal,
     identity_prompt,
+    invalidate_accounts_cache,
     list_connected_accounts,
     loop_config,
     nodes,
@@ -42,6 +43,7 @@
     "get_tools_for_provider",
     "goal",
     "identity_prompt",
+    "invalidate_accounts_cache",
     "list_connected_accounts",
     "loop_config",
     "nodes",
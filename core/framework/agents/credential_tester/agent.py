@@ -16,9 +16,22 @@
 
 from __future__ import annotations
 
+import atexit
+import functools
+import hashlib
+import logging
+import os
+import string
+import threading
+import time
+from collections.abc import Collection, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
 
+from framework.credentials.aden.client import AdenClientConfig, AdenCredentialClient
+from framework.credentials.local.registry import LocalCredentialRegistry
+from framework.credentials.storage import EncryptedFileStorage
 from framework.graph import Goal, NodeSpec, SuccessCriterion
 from framework.graph.checkpoint_config import CheckpointConfig
 from framework.graph.edge import GraphSpec
@@ -34,6 +47,10 @@
 if TYPE_CHECKING:
     from framework.runner import AgentRunner
 
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
 # ---------------------------------------------------------------------------
 # Goal
 # ---------------------------------------------------------------------------
@@ -59,92 +76,229 @@
 # ---------------------------------------------------------------------------
 
 
-def get_tools_for_provider(provider_name: str) -> list[str]:
+class _SpecIndexes(NamedTuple):
+    tools_by_provider: dict[str, tuple[str, ...]]
+    """credential_id / credential_group -> sorted, de-duplicated tool names."""
+
+    specs_by_group: dict[str, list[tuple[str, Any]]]
+    """credential_group -> ``(cred_name, spec)`` members of that group."""
+
+    specs_by_provider: dict[str, list[tuple[str, Any]]]
+    """credential_id / credential_group / spec name -> matching ``(cred_name, spec)``."""
+
+    testable_specs: tuple[tuple[str, Any], ...]
+    """``(cred_name, spec)`` for specs that take a direct API key and expose tools."""
+
+    direct_key_env_vars: tuple[str, ...]
+    """Env var of every spec that accepts a direct API key."""
+
+
+@functools.cache
+def _spec_indexes() -> _SpecIndexes:
+    """Build provider lookup tables over ``CREDENTIAL_SPECS`` once per process.
+
+    Turns every per-provider scan of ``CREDENTIAL_SPECS`` into a single dict
+    lookup.  The specs are static after import; call
+    ``_spec_indexes.cache_clear()`` if ``CREDENTIAL_SPECS`` is ever mutated.
+    """
+    from aden_tools.credentials import CREDENTIAL_SPECS
+
+    tools_by_provider: dict[str, set[str]] = {}
+    specs_by_group: dict[str, list[tuple[str, Any]]] = {}
+    specs_by_provider: dict[str, list[tuple[str, Any]]] = {}
+    testable_specs: list[tuple[str, Any]] = []
+    direct_key_env_vars: list[str] = []
+    for cred_name, spec in CREDENTIAL_SPECS.items():
+        entry = (cred_name, spec)
+        for key in {spec.credential_id, spec.credential_group} - {""}:
+            tools_by_provider.setdefault(key, set()).update(spec.tools)
+        if spec.credential_group:
+            specs_by_group.setdefault(spec.credential_group, []).append(entry)
+        for key in {cred_name, spec.credential_id, spec.credential_group} - {""}:
+            specs_by_provider.setdefault(key, []).append(entry)
+        if spec.direct_api_key_supported:
+            direct_key_env_vars.append(spec.env_var)
+            if spec.tools:
+                testable_specs.append(entry)
+
+    return _SpecIndexes(
+        tools_by_provider={key: tuple(sorted(tools)) for key, tools in tools_by_provider.items()},
+        specs_by_group=specs_by_group,
+        specs_by_provider=specs_by_provider,
+        testable_specs=tuple(testable_specs),
+        direct_key_env_vars=tuple(direct_key_env_vars),
+    )
+
+
+def get_tools_for_provider(provider_name: str) -> tuple[str, ...]:
     """Collect tool names for a credential by credential_id OR credential_group.
 
     Matches on both ``credential_id`` (e.g. "google" → Gmail tools) and
     ``credential_group`` (e.g. "google_custom_search" → all google search tools).
     """
-    from aden_tools.credentials import CREDENTIAL_SPECS
+    return _spec_indexes().tools_by_provider.get(provider_name, ())
 
-    tools: list[str] = []
-    for spec in CREDENTIAL_SPECS.values():
-        if spec.credential_id == provider_name or spec.credential_group == provider_name:
-            tools.extend(spec.tools)
-    return sorted(set(tools))
 
+def _with_account_info(tools: Sequence[str]) -> tuple[str, ...]:
+    """Add the Aden ``get_account_info`` tool to an already sorted, unique tool list."""
+    tools = tuple(tools)
+    return tools if "get_account_info" in tools else (*tools, "get_account_info")
 
-def _list_aden_accounts() -> list[dict]:
-    """List active accounts from the Aden platform (requires ADEN_API_KEY)."""
-    import os
 
+_aden_client: AdenCredentialClient | None = None
+_aden_client_lock = threading.Lock()
+
+
+def _get_aden_client(api_key: str, base_url: str) -> AdenCredentialClient:
+    """Return the process-wide Aden client, rebuilding it if the config changed.
+
+    Reusing one client keeps its HTTP connection alive across picker refreshes
+    instead of paying a new TCP+TLS handshake per listing.
+    """
+    global _aden_client
+    with _aden_client_lock:
+        client = _aden_client
+        if client is not None and (
+            client.config.api_key != api_key or client.config.base_url != base_url
+        ):
+            client.close()
+            client = None
+        if client is None:
+            client = AdenCredentialClient(AdenClientConfig(base_url=base_url, api_key=api_key))
+            _aden_client = client
+        return client
+
+
+@atexit.register
+def _close_aden_client() -> None:
+    global _aden_client
+    with _aden_client_lock:
+        if _aden_client is not None:
+            _aden_client.close()
+            _aden_client = None
+
+
+def _fetch_aden_accounts() -> list[dict]:
+    """Active accounts from the Aden platform; errors propagate to the caller."""
     api_key = os.environ.get("ADEN_API_KEY")
     if not api_key:
         return []
 
-    try:
-        from framework.credentials.aden.client import AdenClientConfig, AdenCredentialClient
+    client = _get_aden_client(api_key, os.environ.get("ADEN_API_URL", "https://api.adenhq.com"))
+    return [
+        {
+            "provider": c.provider,
+            "alias": c.alias,
+            "identity": {"email": c.email} if c.email else {},
+            "integration_id": c.integration_id,
+            "source": "aden",
+        }
+        for c in client.list_integrations()
+        if c.status == "active"
+    ]
 
-        client = AdenCredentialClient(
-            AdenClientConfig(
-                base_url=os.environ.get("ADEN_API_URL", "https://api.adenhq.com"),
-            )
-        )
-        try:
-            integrations = client.list_integrations()
-        finally:
-            client.close()
 
-        return [
-            {
-                "provider": c.provider,
-                "alias": c.alias,
-                "identity": {"email": c.email} if c.email else {},
-                "integration_id": c.integration_id,
-                "source": "aden",
-            }
-            for c in integrations
-            if c.status == "active"
-        ]
+def _list_aden_accounts() -> list[dict]:
+    """List active accounts from the Aden platform (requires ADEN_API_KEY)."""
+    try:
+        return _fetch_aden_accounts()
     except Exception:
         return []
 
 
-def _list_local_accounts() -> list[dict]:
-    """List named local API key accounts from LocalCredentialRegistry."""
+def _open_flat_storage() -> EncryptedFileStorage | None:
+    """Open the default encrypted store, or None if it is unavailable."""
     try:
-        from framework.credentials.local.registry import LocalCredentialRegistry
+        return EncryptedFileStorage()
+    except Exception:
+        return None
+
+
+def _flat_store_index_path() -> Path:
+    """Index file of the default encrypted store (rewritten on every save/delete)."""
+    return Path(EncryptedFileStorage.DEFAULT_PATH).expanduser() / "metadata" / "index.json"
 
-        return [
-            info.to_account_dict() for info in LocalCredentialRegistry.default().list_accounts()
-        ]
+
+def _read_local_store(
+    storage: EncryptedFileStorage | None = None,
+) -> tuple[list[dict], set[str]]:
+    """Named local accounts plus legacy flat credential IDs from one index read.
+
+    Args:
+        storage: Encrypted store to read from. Opens the default store if None.
+
+    Returns:
+        (account dicts from LocalCredentialRegistry, un-aliased storage IDs)
+
+    Raises:
+        Exception: Whatever the registry raises while reading the store.
+    """
+    registry = LocalCredentialRegistry(storage) if storage else LocalCredentialRegistry.default()
+    infos, flat_ids = registry.list_all_with_flats()
+    return [info.to_account_dict() for info in infos], flat_ids
+
+
+def _scan_local_store(
+    storage: EncryptedFileStorage | None = None,
+) -> tuple[list[dict], set[str]]:
+    """Like ``_read_local_store`` but returns empty results on any error."""
+    try:
+        return _read_local_store(storage)
     except Exception:
-        return []
+        return [], set()
+
+
+def _list_local_accounts(storage: EncryptedFileStorage | None = None) -> list[dict]:
+    """List named local API key accounts from LocalCredentialRegistry.
+
+    Args:
+        storage: Encrypted store to read from. Opens the default store if None.
+    """
+    accounts, _ = _scan_local_store(storage)
+    return accounts
 
 
-def _list_env_fallback_accounts() -> list[dict]:
+def _list_env_fallback_accounts(
+    encrypted_ids: set[str] | None = None,
+    skip_providers: Collection[str] = frozenset(),
+    env: Mapping[str, str] | None = None,
+) -> list[dict]:
     """Surface configured-but-unregistered credentials as testable entries.
 
     Detects credentials available via env vars OR stored in the encrypted
     store in the old flat format (e.g. ``brave_search`` with no alias).
     These are users who haven't yet run ``save_account()`` but have a working key.
     Shows with alias="default" and status="unknown".
+
+    Args:
+        encrypted_ids: IDs already listed from the encrypted store. Read from
+            the default store if None.
+        skip_providers: Providers to leave out (e.g. already in the named registry).
+        env: Environment snapshot to check. Snapshots ``os.environ`` if None.
     """
-    import os
+    if env is None:
+        env = dict(os.environ)
 
-    from aden_tools.credentials import CREDENTIAL_SPECS
+    indexes = _spec_indexes()
 
-    # Collect IDs in encrypted store (includes old flat entries like "brave_search")
-    try:
-        from framework.credentials.storage import EncryptedFileStorage
-
-        encrypted_ids: set[str] = set(EncryptedFileStorage().list_all())
-    except Exception:
+    # Collect IDs in encrypted store (includes old flat entries like "brave_search").
+    # A missing index file means nothing was ever stored — skip opening the store.
+    if encrypted_ids is None:
         encrypted_ids = set()
+        if _flat_store_index_path().exists():
+            try:
+                storage = _open_flat_storage()
+                encrypted_ids = set(storage.list_all()) if storage else set()
+            except Exception:
+                pass
+
+    # Nothing stored and no testable env var set — no fallbacks to surface
+    if not encrypted_ids and not any(env.get(spec.env_var) for _, spec in indexes.testable_specs):
+        return []
 
     def _is_configured(cred_name: str, spec) -> bool:
         # 1. Env var present
-        if os.environ.get(spec.env_var):
+        if env.get(spec.env_var):
             return True
         # 2. Old flat encrypted entry (no slash — new entries have {x}/{y})
         if cred_name in encrypted_ids:
@@ -154,24 +308,19 @@ def _is_configured(cred_name: str, spec) -> bool:
     seen_groups: set[str] = set()
     accounts: list[dict] = []
 
-    for cred_name, spec in CREDENTIAL_SPECS.items():
-        if not spec.direct_api_key_supported or not spec.tools:
-            continue
-
+    for cred_name, spec in indexes.testable_specs:
         if spec.credential_group:
-            if spec.credential_group in seen_groups:
+            if spec.credential_group in seen_groups or spec.credential_group in skip_providers:
                 continue
             group_available = all(
-                _is_configured(n, s)
-                for n, s in CREDENTIAL_SPECS.items()
-                if s.credential_group == spec.credential_group
+                _is_configured(n, s) for n, s in indexes.specs_by_group[spec.credential_group]
             )
             if not group_available:
                 continue
             seen_groups.add(spec.credential_group)
             provider = spec.credential_group
         else:
-            if not _is_configured(cred_name, spec):
+            if cred_name in skip_providers or not _is_configured(cred_name, spec):
                 continue
             provider = cred_name
 
@@ -189,18 +338,117 @@ def _is_configured(cred_name: str, spec) -> bool:
     return accounts
 
 
+_ACCOUNTS_CACHE_TTL = 30.0
+"""Seconds a ``list_connected_accounts()`` result is reused for an unchanged environment."""
+
+_ACCOUNT_SOURCE_TIMEOUT = 5.0
+"""Seconds one listing waits for the Aden and registry sources together.
+
+A source still running at the deadline is skipped with a warning."""
+
+_accounts_cache: tuple[float, bytes, list[dict]] | None = None
+
+
+def _accounts_cache_key(env: Mapping[str, str]) -> bytes:
+    """Fingerprint everything ``list_connected_accounts()`` reads.
+
+    Covers the Aden connection settings, which direct-API-key env vars are set,
+    and the mtime of the encrypted store index (bumped by every save/delete).
+    """
+    try:
+        index_mtime = _flat_store_index_path().stat().st_mtime_ns
+    except OSError:
+        index_mtime = 0
+
+    env_bits = "".join(
+        "1" if env.get(env_var) else "0" for env_var in _spec_indexes().direct_key_env_vars
+    )
+
+    h = hashlib.blake2b(digest_size=16)
+    for part in (
+        env.get("ADEN_API_KEY", ""),
+        env.get("ADEN_API_URL", ""),
+        env_bits,
+        str(index_mtime),
+    ):
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.digest()
+
+
+def invalidate_accounts_cache() -> None:
+    """Drop the memoized ``list_connected_accounts()`` result."""
+    global _accounts_cache
+    _accounts_cache = None
+
+
+def _result_or_default(
+    future: Future[_T], default: _T, source: str, deadline: float
+) -> tuple[_T, bool]:
+    """Wait for one account source until the listing's shared ``deadline``.
+
+    Returns:
+        (result, True) if the source returned, else (default, False) after
+        warning that the source's accounts were skipped.
+    """
+    try:
+        return future.result(timeout=max(0.0, deadline - time.monotonic())), True
+    except FutureTimeoutError:
+        logger.warning(
+            "Skipped %s accounts: no response within %.0fs", source, _ACCOUNT_SOURCE_TIMEOUT
+        )
+    except Exception as exc:
+        logger.warning("Skipped %s accounts: %s", source, exc)
+    return default, False
+
+
 def list_connected_accounts() -> list[dict]:
-    """List all testable accounts: Aden-synced + named local + env-var fallbacks."""
-    aden = _list_aden_accounts()
-    local = _list_local_accounts()
-
-    # Show env-var fallbacks only for credentials not already in the named registry
-    local_providers = {a["provider"] for a in local}
-    env_fallbacks = [
-        a for a in _list_env_fallback_accounts() if a["provider"] not in local_providers
-    ]
+    """List all testable accounts: Aden-synced + named local + env-var fallbacks.
+
+    Results are memoized for ``_ACCOUNTS_CACHE_TTL`` seconds and keyed on the
+    environment and local store state, so repeated picker refreshes skip the
+    Aden round-trip and registry decryption.  Both sources share one
+    ``_ACCOUNT_SOURCE_TIMEOUT`` deadline; a listing where either source timed
+    out or failed is returned but not memoized.  Call
+    ``invalidate_accounts_cache()`` to force a fresh listing.
+    """
+    global _accounts_cache
+
+    # One snapshot of the environment for the whole listing
+    env = dict(os.environ)
+    key = _accounts_cache_key(env)
+    cached = _accounts_cache
+    if cached is not None:
+        cached_at, cached_key, accounts = cached
+        if cached_key == key and time.monotonic() - cached_at < _ACCOUNTS_CACHE_TTL:
+            return list(accounts)
+
+    # The Aden round-trip and registry decryption are independent I/O — run them
+    # concurrently so the picker waits for the slowest, not the sum.
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="list-accounts")
+    try:
+        deadline = time.monotonic() + _ACCOUNT_SOURCE_TIMEOUT
+        aden_future = executor.submit(_fetch_aden_accounts)
+        # One index read yields both the named accounts and the flat IDs
+        # the env-fallback scan needs.
+        local_future = executor.submit(_read_local_store, _open_flat_storage())
+        (local, flat_ids), local_ok = _result_or_default(
+            local_future, ([], set()), "local", deadline
+        )
+        # Show env-var fallbacks only for credentials not already in the named
+        # registry. This is an in-memory scan, so it runs while Aden is in flight.
+        env_fallbacks = _list_env_fallback_accounts(
+            flat_ids, skip_providers={a["provider"] for a in local}, env=env
+        )
+        aden, aden_ok = _result_or_default(aden_future, [], "Aden", deadline)
+    finally:
+        # Don't let a stalled source block the caller past its timeout
+        executor.shutdown(wait=False, cancel_futures=True)
 
-    return aden + local + env_fallbacks
+    accounts = aden + local + env_fallbacks
+    if aden_ok and local_ok:
+        _accounts_cache = (time.monotonic(), key, accounts)
+    return list(accounts)
 
 
 # ---------------------------------------------------------------------------
@@ -230,7 +478,7 @@ def configure_for_account(runner: AgentRunner, account: dict) -> None:
     tools = get_tools_for_provider(provider)
 
     if source == "aden":
-        tools.append("get_account_info")
+        tools = _with_account_info(tools)
         email = identity.get("email", "")
         detail = f" (email: {email})" if email else ""
         _configure_aden_node(runner, provider, alias, detail, tools)
@@ -248,38 +496,23 @@ def _activate_local_account(credential_id: str, alias: str) -> None:
     2. Old flat credential in EncryptedFileStorage (id == credential_id, no alias)
     3. Env var already set — skip injection (nothing to do)
     """
-    import os
-
-    from aden_tools.credentials import CREDENTIAL_SPECS
-
-    # Collect specs for this credential (handles grouped credentials too)
-    group_specs = [
-        (cred_name, spec)
-        for cred_name, spec in CREDENTIAL_SPECS.items()
-        if spec.credential_group == credential_id
-        or spec.credential_id == credential_id
-        or cred_name == credential_id
-    ]
-    # Deduplicate — credential_id and credential_group may both match the same spec
-    seen_env_vars: set[str] = set()
+    # Collect specs for this credential (handles grouped credentials too),
+    # keyed by env var — credential_id and credential_group may both match the
+    # same spec — and skipping env vars that are already set. Reads go through
+    # one snapshot; injected keys are still written to os.environ below.
+    env = dict(os.environ)
+    pending: dict[str, Any] = {}
+    for _cred_name, spec in _spec_indexes().specs_by_provider.get(credential_id, []):
+        if not env.get(spec.env_var):
+            pending.setdefault(spec.env_var, spec)
+    if not pending:
+        return
 
     try:
-        from framework.credentials.local.registry import LocalCredentialRegistry
-        from framework.credentials.storage import EncryptedFileStorage
-
-        registry = LocalCredentialRegistry.default()
         flat_storage = EncryptedFileStorage()
+        registry = LocalCredentialRegistry(flat_storage)
 
-        for _cred_name, spec in group_specs:
-            if spec.env_var in seen_env_vars:
-                continue
-            # If env var is already set, nothing to do for this one
-            if os.environ.get(spec.env_var):
-                seen_env_vars.add(spec.env_var)
-                continue
-
-            seen_env_vars.add(spec.env_var)
-
+        for spec in pending.values():
             # Determine key name based on spec
             key_name = "api_key"
             if spec.credential_group and "cse" in spec.env_var.lower():
@@ -306,18 +539,8 @@ def _activate_local_account(credential_id: str, alias: str) -> None:
         pass
 
 
-def _configure_aden_node(
-    runner: AgentRunner,
-    provider: str,
-    alias: str,
-    detail: str,
-    tools: list[str],
-) -> None:
-    for node in runner.graph.nodes:
-        if node.id == "tester":
-            node.tools = sorted(set(tools))
-            node.system_prompt = f"""\
-You are a credential tester for the account: {provider}/{alias}{detail}
+_ADEN_TESTER_PROMPT = string.Template("""\
+You are a credential tester for the account: ${provider}/${alias}${detail}
 
 # Instructions
 
@@ -329,7 +552,7 @@ def _configure_aden_node(
 
 # Account routing
 
-IMPORTANT: Always pass `account="{alias}"` when calling any tool. \
+IMPORTANT: Always pass `account="${alias}"` when calling any tool. \
 This routes the API call to the correct credential. Never use the email \
 or any other identifier — always use the alias exactly as shown.
 
@@ -339,8 +562,43 @@ def _configure_aden_node(
 - Always confirm with the user before performing write operations.
 - If a call fails, report the exact error — this helps diagnose credential issues.
 - Be concise. No emojis.
-"""
-            break
+""")
+
+_LOCAL_TESTER_PROMPT = string.Template("""\
+You are a credential tester for the local API key: ${provider}/${alias}${detail}${status_note}
+
+# Instructions
+
+1. Suggest a simple test call to verify the credential works \
+(e.g. search for "test", list items, get profile info).
+2. Execute the call when the user agrees.
+3. Report the result: success (with sample data) or failure (with error).
+4. Let the user request additional API calls to further test the credential.
+
+# Rules
+
+- Do NOT pass an `account` parameter — this credential is injected \
+directly into the session environment and tools read it automatically.
+- Start with read-only operations before write operations.
+- Always confirm with the user before performing write operations.
+- If a call fails, report the exact error — this helps diagnose credential issues.
+- Be concise. No emojis.
+""")
+
+
+def _configure_aden_node(
+    runner: AgentRunner,
+    provider: str,
+    alias: str,
+    detail: str,
+    tools: Sequence[str],
+) -> None:
+    node = runner.graph.get_node("tester")
+    if node is not None:
+        node.tools = list(tools)
+        node.system_prompt = _ADEN_TESTER_PROMPT.substitute(
+            provider=provider, alias=alias, detail=detail
+        )
 
     runner.intro_message = (
         f"Testing {provider}/{alias}{detail} — "
@@ -354,37 +612,19 @@ def _configure_local_node(
     provider: str,
     alias: str,
     identity: dict,
-    tools: list[str],
+    tools: Sequence[str],
     status: str,
 ) -> None:
     identity_parts = [f"{k}: {v}" for k, v in identity.items() if v]
     detail = f" ({', '.join(identity_parts)})" if identity_parts else ""
     status_note = " [key not yet validated]" if status == "unknown" else ""
 
-    for node in runner.graph.nodes:
-        if node.id == "tester":
-            node.tools = sorted(set(tools))
-            node.system_prompt = f"""\
-You are a credential tester for the local API key: {provider}/{alias}{detail}{status_note}
-
-# Instructions
-
-1. Suggest a simple test call to verify the credential works \
-(e.g. search for "test", list items, get profile info).
-2. Execute the call when the user agrees.
-3. Report the result: success (with sample data) or failure (with error).
-4. Let the user request additional API calls to further test the credential.
-
-# Rules
-
-- Do NOT pass an `account` parameter — this credential is injected \
-directly into the session environment and tools read it automatically.
-- Start with read-only operations before write operations.
-- Always confirm with the user before performing write operations.
-- If a call fails, report the exact error — this helps diagnose credential issues.
-- Be concise. No emojis.
-"""
-            break
+    node = runner.graph.get_node("tester")
+    if node is not None:
+        node.tools = list(tools)
+        node.system_prompt = _LOCAL_TESTER_PROMPT.substitute(
+            provider=provider, alias=alias, detail=detail, status_note=status_note
+        )
 
     runner.intro_message = (
         f"Testing {provider}/{alias}{detail} — "
@@ -518,7 +758,7 @@ def _build_graph(self) -> GraphSpec:
         if source == "local":
             _activate_local_account(provider, alias)
         elif source == "aden":
-            tools.append("get_account_info")
+            tools = _with_account_info(tools)
 
         tester_node = build_tester_node(
             provider=provider,
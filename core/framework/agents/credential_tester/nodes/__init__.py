@@ -1,12 +1,66 @@
 """Node definitions for Credential Tester agent."""
 
+import functools
+import string
+from collections.abc import Sequence
+
 from framework.graph import NodeSpec
 
+_ADEN_ROUTING_SECTION = string.Template("""\
+# Account routing
+
+IMPORTANT: Always pass `account="${alias}"` when calling any tool. \
+This routes the API call to the correct credential. Never use the email \
+or any other identifier — always use the alias exactly as shown.
+""")
+
+_LOCAL_ROUTING_SECTION = """\
+# Credential routing
+
+This is a local API key credential — do NOT pass an `account` parameter. \
+The key is pre-injected into the session environment and tools read it automatically.
+"""
+
+_TESTER_PROMPT = string.Template("""\
+You are a credential tester for the ${account_label}: ${provider}/${alias}${detail}
+
+Your job is to help the user verify that this credential works by making \
+real API calls using the available tools.
+
+${routing_section}
+# Instructions
+
+1. Start by greeting the user and confirming which account you're testing.
+2. Suggest a simple, safe, read-only API call to verify the credential works \
+(e.g. list messages, list channels, list contacts, search for "test").
+3. Execute the call when the user agrees.
+4. Report the result clearly: success (with sample data) or failure (with error).
+5. Let the user request additional API calls to further test the credential.
+
+# Available tools
+
+You have access to ${tool_count} tools for ${provider}:
+${tool_list}
+
+# Rules
+
+- Start with read-only operations (list, get) before write operations (create, update, delete).
+- Always confirm with the user before performing write operations.
+- If a call fails, report the exact error — this helps diagnose credential issues.
+- Be concise. No emojis.
+""")
+
+
+@functools.lru_cache(maxsize=64)
+def _tool_bullets(tools: tuple[str, ...]) -> str:
+    """Render the "Available tools" bullet list (cached per tool set)."""
+    return "\n".join("- " + t for t in tools)
+
 
 def build_tester_node(
     provider: str,
     alias: str,
-    tools: list[str],
+    tools: Sequence[str],
     identity: dict[str, str],
     source: str = "aden",
 ) -> NodeSpec:
@@ -23,20 +77,9 @@ def build_tester_node(
     detail = f" ({', '.join(detail_parts)})" if detail_parts else ""
 
     if source == "aden":
-        routing_section = f"""\
-# Account routing
-
-IMPORTANT: Always pass `account="{alias}"` when calling any tool. \
-This routes the API call to the correct credential. Never use the email \
-or any other identifier — always use the alias exactly as shown.
-"""
+        routing_section = _ADEN_ROUTING_SECTION.substitute(alias=alias)
     else:
-        routing_section = """\
-# Credential routing
-
-This is a local API key credential — do NOT pass an `account` parameter. \
-The key is pre-injected into the session environment and tools read it automatically.
-"""
+        routing_section = _LOCAL_ROUTING_SECTION
 
     account_label = "account" if source == "aden" else "local API key"
 
@@ -52,33 +95,14 @@ def build_tester_node(
         max_node_visits=0,
         input_keys=[],
         output_keys=[],
-        tools=tools,
-        system_prompt=f"""\
-You are a credential tester for the {account_label}: {provider}/{alias}{detail}
-
-Your job is to help the user verify that this credential works by making \
-real API calls using the available tools.
-
-{routing_section}
-# Instructions
-
-1. Start by greeting the user and confirming which account you're testing.
-2. Suggest a simple, safe, read-only API call to verify the credential works \
-(e.g. list messages, list channels, list contacts, search for "test").
-3. Execute the call when the user agrees.
-4. Report the result clearly: success (with sample data) or failure (with error).
-5. Let the user request additional API calls to further test the credential.
-
-# Available tools
-
-You have access to {len(tools)} tools for {provider}:
-{chr(10).join(f"- {t}" for t in tools)}
-
-# Rules
-
-- Start with read-only operations (list, get) before write operations (create, update, delete).
-- Always confirm with the user before performing write operations.
-- If a call fails, report the exact error — this helps diagnose credential issues.
-- Be concise. No emojis.
-""",
+        tools=list(tools),
+        system_prompt=_TESTER_PROMPT.substitute(
+            account_label=account_label,
+            provider=provider,
+            alias=alias,
+            detail=detail,
+            routing_section=routing_section,
+            tool_count=len(tools),
+            tool_list=_tool_bullets(tuple(tools)),
+        ),
     )
@@ -32,6 +32,7 @@
 
 import logging
 import os
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -254,14 +255,24 @@ class AdenCredentialClient:
         headers = {"Authorization": f"Bearer {cred.access_token}"}
 
         client.close()
+
+    A single instance is safe to share between threads: the underlying
+    ``httpx.Client`` is created once under a lock and keeps its connections
+    alive across calls.
     """
 
     def __init__(self, config: AdenClientConfig):
         self.config = config
         self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
 
     def _get_client(self) -> httpx.Client:
-        if self._client is None:
+        client = self._client
+        if client is not None:
+            return client
+        with self._client_lock:
+            if self._client is not None:
+                return self._client
             headers = {
                 "Authorization": f"Bearer {self.config.api_key}",
                 "Content-Type": "application/json",
@@ -275,7 +286,7 @@ def _get_client(self) -> httpx.Client:
                 timeout=self.config.timeout,
                 headers=headers,
             )
-        return self._client
+            return self._client
 
     def _request_with_retry(
         self,
@@ -423,9 +434,10 @@ def health_check(self) -> dict[str, Any]:
             return {"status": "unhealthy", "error": str(e)}
 
     def close(self) -> None:
-        if self._client:
-            self._client.close()
-            self._client = None
+        with self._client_lock:
+            if self._client:
+                self._client.close()
+                self._client = None
 
     def __enter__(self) -> AdenCredentialClient:
         return self
@@ -8,12 +8,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
 
 from framework.credentials.models import CredentialIdentity
 
 
-@dataclass
+def _utc_now() -> datetime:
+    """Get current UTC time as timezone-aware datetime."""
+    return datetime.now(UTC)
+
+
+@dataclass(slots=True)
 class LocalAccountInfo:
     """
     A locally-stored named credential account.
@@ -35,7 +40,7 @@ class LocalAccountInfo:
     status: str = "unknown"
     identity: CredentialIdentity = field(default_factory=CredentialIdentity)
     last_validated: datetime | None = None
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_utc_now)
 
     @property
     def storage_id(self) -> str:
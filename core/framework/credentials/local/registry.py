@@ -12,6 +12,12 @@
                                    _status: "active",
                                    _identity_username: "acme", ... }
 
+Listing metadata (alias, status, identity, timestamps — never secrets) is
+mirrored to an unencrypted sidecar at metadata/local_accounts.json so
+list_accounts() doesn't have to decrypt every account. Each entry records
+the credential file's mtime; an entry whose file has since been rewritten
+(by another process or a direct storage write) is decrypted again.
+
 Usage:
     registry = LocalCredentialRegistry.default()
 
@@ -32,9 +38,18 @@
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
+from types import ModuleType
 from typing import TYPE_CHECKING, Any
 
 from framework.credentials.models import CredentialIdentity, CredentialObject
@@ -48,6 +63,23 @@
 logger = logging.getLogger(__name__)
 
 _SEPARATOR = "/"
+_MAX_LOAD_WORKERS = 8
+_MAX_VALIDATE_WORKERS = 16
+_SIDECAR_FILENAME = "local_accounts.json"
+_IDENTITY_FIELDS: frozenset[str] = frozenset(CredentialIdentity.model_fields)
+
+
+def _storage_id(credential_id: str, alias: str) -> str:
+    """Canonical storage/cache key for a named account: '{credential_id}/{alias}'."""
+    return credential_id + _SEPARATOR + alias
+
+
+@functools.cache
+def _health_check() -> ModuleType:
+    """Import aden_tools' health_check module on first use and keep it."""
+    from aden_tools.credentials import health_check
+
+    return health_check
 
 
 class LocalCredentialRegistry:
@@ -58,9 +90,42 @@ class LocalCredentialRegistry:
     client, but for locally-stored API keys.
     """
 
-    def __init__(self, storage: EncryptedFileStorage) -> None:
+    def __init__(
+        self,
+        storage: EncryptedFileStorage,
+        cache_ttl_seconds: float = 5.0,
+        health_ttl_seconds: float = 5.0,
+        preload: bool = False,
+    ) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            storage: Encrypted storage holding the ``{credential_id}/{alias}`` entries.
+            cache_ttl_seconds: How long decrypted credentials are kept in memory.
+                Writes through this registry invalidate the affected entry.
+            health_ttl_seconds: How long a validate_account() result is reused
+                before the live API is hit again.
+            preload: Decrypt every named account into the cache up front. Pair
+                with a long cache_ttl_seconds for a long-lived process that
+                reads keys repeatedly.
+        """
         self._storage = storage
 
+        # Cache: storage_id -> (CredentialObject, cached_at monotonic seconds)
+        self._cache: dict[str, tuple[CredentialObject, float]] = {}
+        self._cache_ttl = cache_ttl_seconds
+        self._lock = threading.RLock()
+
+        # Health results: storage_id -> (HealthCheckResult, checked_at monotonic seconds).
+        # Per-account locks make concurrent validations share one live call.
+        self._health_cache: dict[str, tuple[HealthCheckResult, float]] = {}
+        self._health_locks: defaultdict[str, threading.Lock] = defaultdict(threading.Lock)
+        self._health_ttl = health_ttl_seconds
+
+        if preload:
+            self.preload()
+
     # ------------------------------------------------------------------
     # Listing
     # ------------------------------------------------------------------
@@ -75,32 +140,106 @@ def list_accounts(self, credential_id: str | None = None) -> list[LocalAccountIn
         Returns:
             List of LocalAccountInfo sorted by credential_id then alias.
         """
+        return self._load_accounts(self._ids_for(credential_id), credential_id)
+
+    def iter_accounts(self, credential_id: str | None = None) -> Iterator[LocalAccountInfo]:
+        """
+        Yield stored local accounts lazily, in no particular order.
+
+        Accounts mirrored in the metadata sidecar come first; the rest are
+        decrypted one at a time as the caller advances, so stopping early
+        (e.g. once a matching alias is found) skips the remaining decryptions.
+
+        Args:
+            credential_id: If given, filter to this credential type only.
+        """
+        accounts, missing_ids = self._split_by_sidecar(self._ids_for(credential_id), credential_id)
+        yield from accounts
+
+        backfill: dict[str, LocalAccountInfo | None] = {}
+        try:
+            for storage_id in missing_ids:
+                info = self._backfill_info(self._load_or_none(storage_id), backfill)
+                if info is not None and (not credential_id or info.credential_id == credential_id):
+                    yield info
+        finally:
+            if backfill:
+                self._update_sidecar(backfill)
+
+    def list_all_with_flats(self) -> tuple[list[LocalAccountInfo], set[str]]:
+        """
+        List named accounts and legacy un-aliased IDs from a single index read.
+
+        Returns:
+            (named accounts sorted by credential_id then alias,
+             set of flat storage IDs such as "brave_search")
+        """
         all_ids = self._storage.list_all()
+        flat_ids = {storage_id for storage_id in all_ids if _SEPARATOR not in storage_id}
+        return self._load_accounts(all_ids), flat_ids
+
+    def _ids_for(self, credential_id: str | None) -> list[str]:
+        if credential_id:
+            # Only entries of this type need reading, not every stored account
+            return self._storage.list_prefix(_storage_id(credential_id, ""))
+        return self._storage.list_all()
+
+    def _load_accounts(
+        self, all_ids: list[str], credential_id: str | None = None
+    ) -> list[LocalAccountInfo]:
+        """
+        Build account infos for the named (``{credential_id}/{alias}``) entries.
+
+        Entries mirrored in the metadata sidecar are read from it directly; only
+        the rest are decrypted, and those are then backfilled into the sidecar.
+        """
+        accounts, missing_ids = self._split_by_sidecar(all_ids, credential_id)
+
+        backfill: dict[str, LocalAccountInfo | None] = {}
+        for cred_obj in self._load_many(missing_ids):
+            info = self._backfill_info(cred_obj, backfill)
+            if info is not None and (not credential_id or info.credential_id == credential_id):
+                accounts.append(info)
+
+        if backfill:
+            self._update_sidecar(backfill)
+
+        return sorted(accounts, key=lambda a: (a.credential_id, a.alias))
+
+    def _split_by_sidecar(
+        self, all_ids: list[str], credential_id: str | None
+    ) -> tuple[list[LocalAccountInfo], list[str]]:
+        """Return (infos served by the sidecar, named IDs that must be decrypted)."""
         accounts: list[LocalAccountInfo] = []
+        missing_ids: list[str] = []
+        sidecar = self._read_sidecar()
 
         for storage_id in all_ids:
             if _SEPARATOR not in storage_id:
                 continue  # Skip legacy un-aliased entries
-
-            try:
-                cred_obj = self._storage.load(storage_id)
-            except Exception as exc:
-                logger.debug("Skipping unreadable credential %s: %s", storage_id, exc)
-                continue
-
-            if cred_obj is None:
-                continue
-
-            info = self._to_account_info(cred_obj)
+            entry = sidecar.get(storage_id)
+            # A file rewritten since the entry was recorded may hold a different status
+            fresh = isinstance(entry, dict) and entry.get("mtime_ns") == self._storage.modified_ns(
+                storage_id
+            )
+            info = _entry_to_info(entry) if fresh else None
             if info is None:
-                continue
+                missing_ids.append(storage_id)
+            elif not credential_id or info.credential_id == credential_id:
+                accounts.append(info)
 
-            if credential_id and info.credential_id != credential_id:
-                continue
+        return accounts, missing_ids
 
-            accounts.append(info)
-
-        return sorted(accounts, key=lambda a: (a.credential_id, a.alias))
+    def _backfill_info(
+        self, cred_obj: CredentialObject | None, backfill: dict[str, LocalAccountInfo | None]
+    ) -> LocalAccountInfo | None:
+        """Convert a decrypted credential and record it for the sidecar."""
+        if cred_obj is None:
+            return None
+        info = self._to_account_info(cred_obj)
+        if info is not None:
+            backfill[cred_obj.id] = info
+        return info
 
     # ------------------------------------------------------------------
     # Save / add
@@ -130,6 +269,61 @@ def save_account(
         Returns:
             (LocalAccountInfo, HealthCheckResult | None)
         """
+        cred_obj, account_info, health_result = self._build_account(
+            credential_id, alias, api_key, run_health_check, extra_keys
+        )
+        self._storage.save(cred_obj)
+        self._after_save({cred_obj.id: account_info})
+        return account_info, health_result
+
+    def save_accounts_bulk(
+        self,
+        items: Iterable[tuple[str, str, str, dict[str, str] | None]],
+        run_health_check: bool = True,
+    ) -> list[tuple[LocalAccountInfo, HealthCheckResult | None]]:
+        """
+        Store several named accounts at once (e.g. an import).
+
+        Health checks run concurrently, and the encrypted store's index and
+        the listing metadata are each rewritten once rather than per account.
+
+        Args:
+            items: ``(credential_id, alias, api_key, extra_keys)`` tuples, with
+                the same meaning as the save_account() arguments.
+            run_health_check: Verify each key against its live API first.
+
+        Returns:
+            (LocalAccountInfo, HealthCheckResult | None) per item, in order.
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        def build(item: tuple[str, str, str, dict[str, str] | None]):
+            credential_id, alias, api_key, extra_keys = item
+            return self._build_account(credential_id, alias, api_key, run_health_check, extra_keys)
+
+        if run_health_check and len(items) > 1:
+            # Health checks are network-bound; run them side by side
+            workers = min(_MAX_LOAD_WORKERS, len(items))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                built = list(executor.map(build, items))
+        else:
+            built = [build(item) for item in items]
+
+        self._storage.save_many([cred_obj for cred_obj, _, _ in built])
+        self._after_save({cred_obj.id: info for cred_obj, info, _ in built})
+        return [(info, health_result) for _, info, health_result in built]
+
+    def _build_account(
+        self,
+        credential_id: str,
+        alias: str,
+        api_key: str,
+        run_health_check: bool,
+        extra_keys: dict[str, str] | None,
+    ) -> tuple[CredentialObject, LocalAccountInfo, HealthCheckResult | None]:
+        """Run the optional health check and assemble the unsaved credential."""
         alias = alias or "default"
         health_result: HealthCheckResult | None = None
         identity: dict[str, str] = {}
@@ -137,23 +331,24 @@ def save_account(
 
         if run_health_check:
             try:
-                from aden_tools.credentials.health_check import check_credential_health
-
                 kwargs: dict[str, Any] = {}
                 if extra_keys and "cse_id" in extra_keys:
                     kwargs["cse_id"] = extra_keys["cse_id"]
 
-                health_result = check_credential_health(credential_id, api_key, **kwargs)
+                health_check = _health_check()
+                health_result = health_check.check_credential_health(
+                    credential_id, api_key, **kwargs
+                )
                 status = "active" if health_result.valid else "failed"
                 identity = health_result.details.get("identity", {})
             except Exception as exc:
                 logger.warning("Health check failed for %s/%s: %s", credential_id, alias, exc)
                 status = "unknown"
 
-        storage_id = f"{credential_id}{_SEPARATOR}{alias}"
+        storage_id = _storage_id(credential_id, alias)
         now = datetime.now(UTC)
 
-        cred_obj = CredentialObject(id=storage_id)
+        cred_obj = CredentialObject(id=storage_id, created_at=now)
         cred_obj.set_key("api_key", api_key)
         cred_obj.set_key("_alias", alias)
         cred_obj.set_key("_integration_type", credential_id)
@@ -163,32 +358,41 @@ def save_account(
             for k, v in extra_keys.items():
                 cred_obj.set_key(k, v)
 
-        if identity:
-            valid_fields = set(CredentialIdentity.model_fields)
-            filtered = {k: v for k, v in identity.items() if k in valid_fields}
-            if filtered:
-                cred_obj.set_identity(**filtered)
+        # Same fields set_identity() persists: known names with non-empty values
+        identity_fields = {k: v for k, v in identity.items() if k in _IDENTITY_FIELDS and v}
+        if identity_fields:
+            cred_obj.set_identity(**identity_fields)
 
         cred_obj.last_refreshed = now if run_health_check else None
-        self._storage.save(cred_obj)
 
         account_info = LocalAccountInfo(
             credential_id=credential_id,
             alias=alias,
             status=status,
-            identity=cred_obj.identity,
+            identity=CredentialIdentity.model_construct(**identity_fields),
             last_validated=cred_obj.last_refreshed,
             created_at=cred_obj.created_at,
         )
-        return account_info, health_result
+        return cred_obj, account_info, health_result
+
+    def _after_save(self, saved: dict[str, LocalAccountInfo]) -> None:
+        """Drop stale cached state for freshly written accounts and mirror their metadata."""
+        for storage_id in saved:
+            self._remove_from_cache(storage_id)
+            self._health_cache.pop(storage_id, None)
+        self._update_sidecar(dict(saved))
 
     # ------------------------------------------------------------------
     # Get
     # ------------------------------------------------------------------
 
     def get_account(self, credential_id: str, alias: str) -> CredentialObject | None:
-        """Load the raw CredentialObject for a specific account."""
-        return self._storage.load(f"{credential_id}{_SEPARATOR}{alias}")
+        """Load the raw CredentialObject for a specific account.
+
+        Returns a copy, so changes made by the caller never reach the cache.
+        """
+        cred = self._load(_storage_id(credential_id, alias))
+        return cred.model_copy(deep=True) if cred is not None else None
 
     def get_key(self, credential_id: str, alias: str, key_name: str = "api_key") -> str | None:
         """
@@ -202,14 +406,23 @@ def get_key(self, credential_id: str, alias: str, key_name: str = "api_key") ->
         Returns:
             The secret value, or None if not found.
         """
-        cred = self.get_account(credential_id, alias)
-        if cred is None:
+        storage_id = _storage_id(credential_id, alias)
+        with self._lock:
+            cached = self._get_from_cache(storage_id)
+        if cached is not None:
+            return cached.get_key(key_name)
+
+        # Cache miss: read the one value from the decrypted payload rather than
+        # validating a whole CredentialObject
+        data = self._storage.load_raw(storage_id)
+        if data is None:
             return None
-        return cred.get_key(key_name)
+        key_data = data.get("keys", {}).get(key_name)
+        return key_data.get("value") if isinstance(key_data, dict) else None
 
     def get_account_info(self, credential_id: str, alias: str) -> LocalAccountInfo | None:
         """Load a LocalAccountInfo for a specific account."""
-        cred = self.get_account(credential_id, alias)
+        cred = self._load(_storage_id(credential_id, alias))
         if cred is None:
             return None
         return self._to_account_info(cred)
@@ -225,7 +438,11 @@ def delete_account(self, credential_id: str, alias: str) -> bool:
         Returns:
             True if the account existed and was deleted, False otherwise.
         """
-        return self._storage.delete(f"{credential_id}{_SEPARATOR}{alias}")
+        storage_id = _storage_id(credential_id, alias)
+        self._remove_from_cache(storage_id)
+        self._health_cache.pop(storage_id, None)
+        self._update_sidecar({storage_id: None})
+        return self._storage.delete(storage_id)
 
     # ------------------------------------------------------------------
     # Validate
@@ -239,21 +456,73 @@ def validate_account(self, credential_id: str, alias: str) -> HealthCheckResult:
             credential_id: Logical credential name.
             alias: Account alias.
 
+        Results are reused for ``health_ttl_seconds``, and concurrent calls for
+        the same account wait on a single live check.
+
         Returns:
             HealthCheckResult from the live API check.
 
         Raises:
             KeyError: If the account doesn't exist.
         """
-        from aden_tools.credentials.health_check import HealthCheckResult, check_credential_health
+        storage_id = _storage_id(credential_id, alias)
+        with self._lock:
+            account_lock = self._health_locks[storage_id]
+
+        with account_lock:
+            cached = self._health_cache.get(storage_id)
+            if cached is not None and time.monotonic() - cached[1] < self._health_ttl:
+                return cached[0]
+
+            result = self._run_validation(credential_id, alias)
+            self._health_cache[storage_id] = (result, time.monotonic())
+            return result
+
+    def validate_all(self, credential_id: str | None = None) -> dict[str, HealthCheckResult]:
+        """
+        Re-run health checks for every stored account concurrently.
+
+        Args:
+            credential_id: If given, only validate accounts of this type.
 
-        cred = self.get_account(credential_id, alias)
+        Returns:
+            HealthCheckResult keyed by storage ID ("{credential_id}/{alias}").
+            Accounts deleted while the checks ran are omitted.
+        """
+        accounts = self.list_accounts(credential_id)
+        if not accounts:
+            return {}
+
+        def validate(info: LocalAccountInfo) -> HealthCheckResult | None:
+            try:
+                return self.validate_account(info.credential_id, info.alias)
+            except KeyError:
+                return None
+
+        workers = min(_MAX_VALIDATE_WORKERS, len(accounts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(validate, accounts))
+
+        return {
+            info.storage_id: result
+            for info, result in zip(accounts, results, strict=True)
+            if result is not None
+        }
+
+    def _run_validation(self, credential_id: str, alias: str) -> HealthCheckResult:
+        """Run the live health check and persist the new status/identity."""
+        health_check = _health_check()
+
+        # The cached object itself: an unchanged check only bumps last_refreshed in memory
+        cred = self._load(_storage_id(credential_id, alias))
         if cred is None:
             raise KeyError(f"No local account found: {credential_id}/{alias}")
 
         api_key = cred.get_key("api_key")
         if not api_key:
-            return HealthCheckResult(valid=False, message="No api_key stored for this account")
+            return health_check.HealthCheckResult(
+                valid=False, message="No api_key stored for this account"
+            )
 
         try:
             kwargs: dict[str, Any] = {}
@@ -261,28 +530,39 @@ def validate_account(self, credential_id: str, alias: str) -> HealthCheckResult:
             if cse_id:
                 kwargs["cse_id"] = cse_id
 
-            result = check_credential_health(credential_id, api_key, **kwargs)
+            result = health_check.check_credential_health(credential_id, api_key, **kwargs)
         except Exception as exc:
-            result = HealthCheckResult(
+            result = health_check.HealthCheckResult(
                 valid=False,
                 message=f"Health check error: {exc}",
                 details={"error": str(exc)},
             )
 
-        # Update status and timestamp in-place
+        now = datetime.now(UTC)
         new_status = "active" if result.valid else "failed"
-        cred.set_key("_status", new_status)
-        cred.last_refreshed = datetime.now(UTC)
-
-        # Re-extract identity if available
         identity = result.details.get("identity", {})
-        if identity:
-            valid_fields = set(CredentialIdentity.model_fields)
-            filtered = {k: v for k, v in identity.items() if k in valid_fields}
+        filtered = {k: v for k, v in identity.items() if k in _IDENTITY_FIELDS and v}
+
+        # Re-encrypting the file is the expensive part; skip it when the check
+        # only confirmed what is already stored
+        changed = (
+            cred.last_refreshed is None
+            or cred.get_key("_status") != new_status
+            or any(cred.get_key(f"_identity_{k}") != v for k, v in filtered.items())
+        )
+        cred.last_refreshed = now
+
+        if changed:
+            cred.set_key("_status", new_status)
             if filtered:
                 cred.set_identity(**filtered)
+            cred.updated_at = now
+            self._storage.save(cred)
+            self._remove_from_cache(cred.id)
 
-        self._storage.save(cred)
+        # Unchanged credentials stay cached with the new last_refreshed, and the
+        # listing metadata always reflects the latest check
+        self._update_sidecar({cred.id: self._to_account_info(cred)})
         return result
 
     # ------------------------------------------------------------------
@@ -290,37 +570,194 @@ def validate_account(self, credential_id: str, alias: str) -> HealthCheckResult:
     # ------------------------------------------------------------------
 
     @classmethod
-    def default(cls) -> LocalCredentialRegistry:
-        """Create a registry using the default encrypted storage at ~/.hive/credentials."""
-        return cls(EncryptedFileStorage())
+    def default(
+        cls, preload: bool = False, cache_ttl_seconds: float = 5.0
+    ) -> LocalCredentialRegistry:
+        """Create a registry using the default encrypted storage at ~/.hive/credentials.
+
+        Pass a long ``cache_ttl_seconds`` with ``preload=True`` so the preloaded
+        keys outlive the default five-second cache.
+        """
+        return cls(EncryptedFileStorage(), cache_ttl_seconds=cache_ttl_seconds, preload=preload)
 
     @classmethod
     def at_path(cls, path: str | Path) -> LocalCredentialRegistry:
         """Create a registry using a custom storage path."""
         return cls(EncryptedFileStorage(base_path=path))
 
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    def preload(self) -> int:
+        """
+        Decrypt every named account into the cache in one batch.
+
+        Returns:
+            Number of credentials loaded.
+        """
+        named_ids = [sid for sid in self._storage.list_all() if _SEPARATOR in sid]
+        return sum(cred_obj is not None for cred_obj in self._load_many(named_ids))
+
+    def clear_cache(self) -> None:
+        """Drop all decrypted credentials held in memory."""
+        with self._lock:
+            self._cache.clear()
+
+    def _load(self, storage_id: str) -> CredentialObject | None:
+        """Load a credential, serving repeat reads within the TTL from memory."""
+        with self._lock:
+            cached = self._get_from_cache(storage_id)
+            if cached is not None:
+                return cached
+
+        cred_obj = self._storage.load(storage_id)
+        if cred_obj is not None:
+            with self._lock:
+                self._cache[storage_id] = (cred_obj, time.monotonic())
+        return cred_obj
+
+    def _load_many(self, storage_ids: list[str]) -> list[CredentialObject | None]:
+        """Load several credentials, treating unreadable entries as missing."""
+        return [self._load_or_none(storage_id) for storage_id in storage_ids]
+
+    def _load_or_none(self, storage_id: str) -> CredentialObject | None:
+        """Load a credential for listing, treating unreadable entries as missing."""
+        with self._lock:
+            cached = self._get_from_cache(storage_id)
+        if cached is not None:
+            return cached
+
+        try:
+            return self._load(storage_id)
+        except Exception as exc:
+            logger.debug("Skipping unreadable credential %s: %s", storage_id, exc)
+            return None
+
+    def _get_from_cache(self, storage_id: str) -> CredentialObject | None:
+        """Get credential from cache if not expired."""
+        entry = self._cache.get(storage_id)
+        if entry is None:
+            return None
+        cred_obj, cached_at = entry
+        if time.monotonic() - cached_at > self._cache_ttl:
+            del self._cache[storage_id]
+            return None
+        return cred_obj
+
+    def _remove_from_cache(self, storage_id: str) -> None:
+        """Remove credential from cache."""
+        with self._lock:
+            self._cache.pop(storage_id, None)
+
+    # ------------------------------------------------------------------
+    # Metadata sidecar
+    # ------------------------------------------------------------------
+
+    def _sidecar_path(self) -> Path:
+        return self._storage.base_path / "metadata" / _SIDECAR_FILENAME
+
+    def _read_sidecar(self) -> dict[str, Any]:
+        """Read listing metadata keyed by storage ID; empty if missing or unreadable."""
+        try:
+            with open(self._sidecar_path()) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            logger.debug("Ignoring unreadable account metadata: %s", exc)
+            return {}
+        accounts = data.get("accounts") if isinstance(data, dict) else None
+        return accounts if isinstance(accounts, dict) else {}
+
+    def _update_sidecar(self, updates: dict[str, LocalAccountInfo | None]) -> None:
+        """Upsert (or, for None, remove) sidecar entries and rewrite the file atomically."""
+        path = self._sidecar_path()
+        with self._lock:
+            accounts = self._read_sidecar()
+            for storage_id, info in updates.items():
+                if info is None:
+                    accounts.pop(storage_id, None)
+                else:
+                    accounts[storage_id] = _info_to_entry(
+                        info, self._storage.modified_ns(storage_id)
+                    )
+
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(".tmp")
+                with open(tmp_path, "w") as f:
+                    json.dump({"accounts": accounts, "version": "1.0"}, f, indent=2)
+                os.replace(tmp_path, path)
+            except OSError as exc:
+                # The sidecar is only an accelerator; listing falls back to decryption
+                logger.debug("Failed to write account metadata: %s", exc)
+
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
 
     def _to_account_info(self, cred_obj: CredentialObject) -> LocalAccountInfo | None:
         """Build LocalAccountInfo from a CredentialObject."""
-        cred_type_key = cred_obj.keys.get("_integration_type")
+        keys = cred_obj.keys
+        cred_type_key = keys.get("_integration_type")
         if cred_type_key is None:
             return None
-        cred_id = cred_type_key.get_secret_value()
-
-        alias_key = cred_obj.keys.get("_alias")
-        alias = alias_key.get_secret_value() if alias_key else cred_obj.id.split(_SEPARATOR, 1)[-1]
-
-        status_key = cred_obj.keys.get("_status")
-        status = status_key.get_secret_value() if status_key else "unknown"
-
+        alias_key = keys.get("_alias")
+        status_key = keys.get("_status")
+
+        # Named entries always contain the separator, so partition() never
+        # falls through to an empty alias here
+        if alias_key is not None:
+            alias = alias_key.value.get_secret_value()
+        else:
+            alias = cred_obj.id.partition(_SEPARATOR)[2]
         return LocalAccountInfo(
-            credential_id=cred_id,
+            credential_id=cred_type_key.value.get_secret_value(),
             alias=alias,
-            status=status,
+            status=status_key.value.get_secret_value() if status_key else "unknown",
             identity=cred_obj.identity,
             last_validated=cred_obj.last_refreshed,
             created_at=cred_obj.created_at,
         )
+
+
+def _info_to_entry(info: LocalAccountInfo, mtime_ns: int | None) -> dict[str, Any]:
+    """Serialize the listing-safe fields of an account (no secrets).
+
+    ``mtime_ns`` is the credential file's modification time the entry was
+    built from; listing ignores the entry once the file changes.
+    """
+    return {
+        "credential_id": info.credential_id,
+        "alias": info.alias,
+        "status": info.status,
+        "identity": info.identity.to_dict(),
+        "last_validated": info.last_validated.isoformat() if info.last_validated else None,
+        "created_at": info.created_at.isoformat(),
+        "mtime_ns": mtime_ns,
+    }
+
+
+def _entry_to_info(entry: Any) -> LocalAccountInfo | None:
+    """Rebuild LocalAccountInfo from a sidecar entry, or None if it is malformed."""
+    if not isinstance(entry, dict):
+        return None
+    try:
+        last_validated = entry.get("last_validated")
+        # Runs once per listed account; values are checked here instead of by Pydantic
+        identity = {
+            k: v for k, v in entry.get("identity", {}).items() if k in _IDENTITY_FIELDS and v
+        }
+        if not all(isinstance(v, str) for v in identity.values()):
+            return None
+        return LocalAccountInfo(
+            credential_id=entry["credential_id"],
+            alias=entry["alias"],
+            status=entry.get("status", "unknown"),
+            identity=CredentialIdentity.model_construct(**identity),
+            last_validated=datetime.fromisoformat(last_validated) if last_validated else None,
+            created_at=datetime.fromisoformat(entry["created_at"]),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
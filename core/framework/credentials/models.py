@@ -90,7 +90,11 @@ def is_known(self) -> bool:
 
     def to_dict(self) -> dict[str, str]:
         """Return only non-None identity fields."""
-        return {k: v for k, v in self.model_dump().items() if v is not None}
+        # Direct attribute reads — avoids a full model_dump() per call
+        return {k: v for k in _IDENTITY_FIELDS if (v := getattr(self, k)) is not None}
+
+
+_IDENTITY_FIELDS: tuple[str, ...] = tuple(CredentialIdentity.model_fields)
 
 
 class CredentialObject(BaseModel):
@@ -234,7 +238,8 @@ def identity(self) -> CredentialIdentity:
                 field_name = key_name[len("_identity_") :]
                 if field_name in CredentialIdentity.model_fields:
                     fields[field_name] = key_obj.value.get_secret_value()
-        return CredentialIdentity(**fields)
+        # Values are already strings from SecretStr; skip re-validation
+        return CredentialIdentity.model_construct(**fields)
 
     @property
     def provider_type(self) -> str | None:
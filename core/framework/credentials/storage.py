@@ -13,6 +13,7 @@
 import json
 import logging
 import os
+import threading
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime
 from pathlib import Path
@@ -79,6 +80,35 @@ def list_all(self) -> list[str]:
         """
         pass
 
+    def save_many(self, credentials: list[CredentialObject]) -> None:
+        """
+        Save several credentials.
+
+        Backends that keep an index can override this to update it once;
+        the default saves one at a time.
+
+        Args:
+            credentials: The credential objects to save
+        """
+        for credential in credentials:
+            self.save(credential)
+
+    def list_prefix(self, prefix: str) -> list[str]:
+        """
+        List credential IDs that start with ``prefix``.
+
+        Backends with an index can override this; the default filters list_all().
+
+        Args:
+            prefix: ID prefix to match (e.g. "brave_search/")
+
+        Returns:
+            List of matching credential IDs
+        """
+        return [
+            credential_id for credential_id in self.list_all() if credential_id.startswith(prefix)
+        ]
+
     @abstractmethod
     def exists(self, credential_id: str) -> bool:
         """
@@ -143,6 +173,8 @@ def __init__(
         self.base_path = Path(base_path or self.DEFAULT_PATH).expanduser()
         self._ensure_dirs()
         self._key_env_var = key_env_var
+        # Serializes read-modify-write cycles on metadata/index.json
+        self._index_lock = threading.Lock()
 
         # Get or generate encryption key
         if encryption_key:
@@ -172,8 +204,40 @@ def _cred_path(self, credential_id: str) -> Path:
         safe_id = credential_id.replace("/", "_").replace("\\", "_").replace("..", "_")
         return self.base_path / "credentials" / f"{safe_id}.enc"
 
+    def modified_ns(self, credential_id: str) -> int | None:
+        """Modification time of a credential's file in nanoseconds, or None if missing."""
+        try:
+            return self._cred_path(credential_id).stat().st_mtime_ns
+        except OSError:
+            return None
+
     def save(self, credential: CredentialObject) -> None:
         """Encrypt and save credential."""
+        self._write_encrypted(credential)
+
+        # Update index
+        self._update_index(credential.id, "save", credential.credential_type.value)
+        logger.debug(f"Saved encrypted credential '{credential.id}'")
+
+    def save_many(self, credentials: list[CredentialObject]) -> None:
+        """Encrypt and save several credentials with a single index rewrite."""
+        for credential in credentials:
+            self._write_encrypted(credential)
+
+        with self._index_lock:
+            index = self._read_index()
+            now = datetime.now(UTC).isoformat()
+            for credential in credentials:
+                index["credentials"][credential.id] = {
+                    "updated_at": now,
+                    "type": credential.credential_type.value,
+                }
+            index["last_modified"] = now
+            self._write_index(index)
+        logger.debug(f"Saved {len(credentials)} encrypted credentials")
+
+    def _write_encrypted(self, credential: CredentialObject) -> None:
+        """Serialize, encrypt and write one credential file (index untouched)."""
         # Serialize credential
         data = self._serialize_credential(credential)
         json_bytes = json.dumps(data, default=str).encode()
@@ -186,12 +250,26 @@ def save(self, credential: CredentialObject) -> None:
         with open(cred_path, "wb") as f:
             f.write(encrypted)
 
-        # Update index
-        self._update_index(credential.id, "save", credential.credential_type.value)
-        logger.debug(f"Saved encrypted credential '{credential.id}'")
-
     def load(self, credential_id: str) -> CredentialObject | None:
         """Load and decrypt credential."""
+        data = self.load_raw(credential_id)
+        if data is None:
+            return None
+
+        # Deserialize
+        return self._deserialize_credential(data)
+
+    def load_raw(self, credential_id: str) -> dict[str, Any] | None:
+        """
+        Load and decrypt a credential without building a CredentialObject.
+
+        Key values are plain strings under ``data["keys"][name]["value"]``;
+        use this when only a few fields are needed and Pydantic validation
+        of the whole object would be wasted.
+
+        Returns:
+            The decrypted JSON payload, or None if the credential doesn't exist
+        """
         cred_path = self._cred_path(credential_id)
         if not cred_path.exists():
             return None
@@ -209,8 +287,7 @@ def load(self, credential_id: str) -> CredentialObject | None:
                 f"Failed to decrypt credential '{credential_id}': {e}"
             ) from e
 
-        # Deserialize
-        return self._deserialize_credential(data)
+        return data
 
     def delete(self, credential_id: str) -> bool:
         """Delete a credential file."""
@@ -265,26 +342,34 @@ def _update_index(
         credential_type: str | None = None,
     ) -> None:
         """Update the metadata index."""
-        index_path = self.base_path / "metadata" / "index.json"
+        with self._index_lock:
+            index = self._read_index()
 
-        if index_path.exists():
-            with open(index_path) as f:
-                index = json.load(f)
-        else:
-            index = {"credentials": {}, "version": "1.0"}
+            if operation == "save":
+                index["credentials"][credential_id] = {
+                    "updated_at": datetime.now(UTC).isoformat(),
+                    "type": credential_type,
+                }
+            elif operation == "delete":
+                index["credentials"].pop(credential_id, None)
 
-        if operation == "save":
-            index["credentials"][credential_id] = {
-                "updated_at": datetime.now(UTC).isoformat(),
-                "type": credential_type,
-            }
-        elif operation == "delete":
-            index["credentials"].pop(credential_id, None)
+            index["last_modified"] = datetime.now(UTC).isoformat()
+            self._write_index(index)
 
-        index["last_modified"] = datetime.now(UTC).isoformat()
+    def _read_index(self) -> dict[str, Any]:
+        index_path = self.base_path / "metadata" / "index.json"
+        if index_path.exists():
+            with open(index_path) as f:
+                return json.load(f)
+        return {"credentials": {}, "version": "1.0"}
 
-        with open(index_path, "w") as f:
+    def _write_index(self, index: dict[str, Any]) -> None:
+        # Write-then-rename so concurrent list_all() readers never see a partial file
+        index_path = self.base_path / "metadata" / "index.json"
+        tmp_path = index_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
             json.dump(index, f, indent=2)
+        os.replace(tmp_path, index_path)
 
 
 class EnvVarStorage(CredentialStorage):
@@ -19,6 +19,7 @@
 import pytest
 from core.framework.credentials import (
     CompositeStorage,
+    CredentialDecryptionError,
     CredentialKey,
     CredentialKeyNotFoundError,
     CredentialNotFoundError,
@@ -205,6 +206,15 @@ def test_list_all(self):
         assert "a" in ids
         assert "b" in ids
 
+    def test_list_prefix(self):
+        """Test listing credentials by ID prefix."""
+        storage = InMemoryStorage()
+        storage.save(CredentialObject(id="github/work", keys={}))
+        storage.save(CredentialObject(id="github/home", keys={}))
+        storage.save(CredentialObject(id="github_oauth", keys={}))
+
+        assert sorted(storage.list_prefix("github/")) == ["github/home", "github/work"]
+
     def test_exists(self):
         """Test checking if credential exists."""
         storage = InMemoryStorage()
@@ -323,6 +333,12 @@ def test_delete(self, storage):
         assert storage.delete("test")
         assert storage.load("test") is None
 
+    def test_load_rejects_non_fernet_file(self, storage):
+        """Test that a malformed file raises a decryption error."""
+        storage._cred_path("corrupt").write_bytes(b"not a fernet token")
+        with pytest.raises(CredentialDecryptionError):
+            storage.load("corrupt")
+
 
 class TestCompositeStorage:
     """Tests for CompositeStorage."""
@@ -27,7 +27,7 @@
 from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from framework.graph.safe_eval import safe_eval
 
@@ -470,12 +470,22 @@ def _resolve_max_tokens(cls, values: Any) -> Any:
             values["max_tokens"] = get_max_tokens()
         return values
 
+    # node_id -> position in ``nodes``; rebuilt lazily when ``nodes`` changes
+    _node_positions: dict[str, int] = PrivateAttr(default_factory=dict)
+
     def get_node(self, node_id: str) -> Any | None:
         """Get a node by ID."""
-        for node in self.nodes:
-            if node.id == node_id:
-                return node
-        return None
+        pos = self._node_positions.get(node_id)
+        if pos is not None and pos < len(self.nodes) and self.nodes[pos].id == node_id:
+            return self.nodes[pos]
+
+        # Missing or stale (nodes appended, removed or reordered) — reindex
+        positions: dict[str, int] = {}
+        for i, node in enumerate(self.nodes):
+            positions.setdefault(node.id, i)
+        self._node_positions = positions
+        pos = positions.get(node_id)
+        return self.nodes[pos] if pos is not None else None
 
     def has_async_entry_points(self) -> bool:
         """Check if this graph uses async entry points (multi-stream execution)."""
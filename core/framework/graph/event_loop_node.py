@@ -2436,17 +2436,17 @@ async def _write_cursor(
     async def _drain_injection_queue(self, conversation: NodeConversation) -> int:
         """Drain all pending injected events as user messages. Returns count."""
         count = 0
-        while not self._injection_queue.empty():
+        while True:
             try:
                 content = self._injection_queue.get_nowait()
-                logger.info(
-                    "[drain] injected message: %s",
-                    content[:200] if content else "(empty)",
-                )
-                await conversation.add_user_message(f"[External event]: {content}")
-                count += 1
             except asyncio.QueueEmpty:
                 break
+            logger.info(
+                "[drain] injected message: %s",
+                content[:200] if content else "(empty)",
+            )
+            await conversation.add_user_message(f"[External event]: {content}")
+            count += 1
         return count
 
     async def _check_pause(
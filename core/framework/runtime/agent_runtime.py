@@ -1083,7 +1083,7 @@ def subscribe_to_events(
 
         Args:
             event_types: Types of events to receive
-            handler: Async function to call when event occurs
+            handler: Function to call when event occurs (async, or sync if non-blocking)
             filter_stream: Only receive events from this stream
             filter_graph: Only receive events from this graph
 
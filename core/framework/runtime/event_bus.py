@@ -8,6 +8,7 @@
 """
 
 import asyncio
+import inspect
 import logging
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
@@ -114,8 +115,8 @@ def to_dict(self) -> dict:
         }
 
 
-# Type for event handlers
-EventHandler = Callable[[AgentEvent], Awaitable[None]]
+# Type for event handlers (async, or sync for cheap non-blocking handlers)
+EventHandler = Callable[[AgentEvent], Awaitable[None] | None]
 
 
 @dataclass
@@ -195,7 +196,8 @@ def subscribe(
 
         Args:
             event_types: Types of events to receive
-            handler: Async function to call when event occurs
+            handler: Function to call when event occurs; async, or sync if it
+                never blocks
             filter_stream: Only receive events from this stream
             filter_node: Only receive events from this node
             filter_execution: Only receive events from this execution
@@ -296,7 +298,9 @@ async def _execute_handlers(
         async def run_handler(handler: EventHandler) -> None:
             async with self._semaphore:
                 try:
-                    await handler(event)
+                    result = handler(event)
+                    if inspect.isawaitable(result):
+                        await result
                 except Exception as e:
                     logger.error(f"Handler error for {event.type}: {e}")
 
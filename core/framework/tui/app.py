@@ -1,20 +1,103 @@
+import asyncio
+import dataclasses
+import functools
 import logging
 import platform
 import subprocess
 import threading
 import time
+from collections import ChainMap, deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from datetime import datetime
+from pathlib import Path
 
 from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal
+from textual.timer import Timer
 from textual.widgets import Footer, Label
 
 from framework.runtime.event_bus import AgentEvent, EventType
 from framework.tui.widgets.selectable_rich_log import SelectableRichLog
 
 # AgentRuntime imported lazily where needed to support runtime=None startup.
-# ChatRepl and GraphOverview are imported lazily in _mount_agent_widgets.
+# ChatRepl, GraphOverview, AgentRunner and CredentialError are imported once in
+# AdenTUI._init_deferred_imports.
+
+_HIVE_CODER_PATH = Path(__file__).resolve().parent.parent / "agents" / "hive_coder"
+
+_events_logger = logging.getLogger("tui.events")
+
+# Enum members compared inline in _route_event; bound once so checks are plain `is`
+_CLIENT_INPUT_REQUESTED = EventType.CLIENT_INPUT_REQUESTED
+_EXECUTION_COMPLETED = EventType.EXECUTION_COMPLETED
+_EXECUTION_FAILED = EventType.EXECUTION_FAILED
+
+# Background-graph events that still surface as a notification; others are dropped
+_CROSS_GRAPH_NOTIFY_TYPES = frozenset(
+    {_CLIENT_INPUT_REQUESTED, _EXECUTION_COMPLETED, _EXECUTION_FAILED}
+)
+
+# Streaming token events; only the latest snapshot per batch needs rendering
+_DELTA_TYPES = frozenset({EventType.LLM_TEXT_DELTA, EventType.CLIENT_OUTPUT_DELTA})
+
+# Every event type except those the TUI has no use for; new types are
+# subscribed (and shown in the log pane) unless listed here.
+_UNSUBSCRIBED_EVENTS = frozenset(
+    {
+        EventType.STATE_CONFLICT,
+        EventType.STREAM_STARTED,
+        EventType.STREAM_STOPPED,
+        EventType.LLM_REASONING_DELTA,
+        EventType.NODE_TOOL_DOOM_LOOP,
+        EventType.WEBHOOK_RECEIVED,
+        EventType.CUSTOM,
+    }
+)
+
+_EVENT_TYPES = frozenset(EventType) - _UNSUBSCRIBED_EVENTS
+
+# Everything subscribed except streaming deltas is echoed inline as a log line
+_LOG_PANE_EVENTS = _EVENT_TYPES - _DELTA_TYPES
+
+_EventHandler = Callable[[AgentEvent], None]
+# Per-event handlers for (chat, graph view, status bar) plus whether to echo to the log pane
+_EventRoute = tuple[_EventHandler | None, _EventHandler | None, _EventHandler | None, bool]
+
+
+# Status bar detail text for events that only need a field or two from event.data,
+# as (template, defaults for fields missing from the event)
+_STATUS_TEMPLATES: dict[EventType, tuple[str, dict[str, str]]] = {
+    EventType.NODE_LOOP_ITERATION: ("step {iteration}", {"iteration": "?"}),
+    EventType.TOOL_CALL_STARTED: ("{tool_name}...", {"tool_name": ""}),
+    EventType.TOOL_CALL_COMPLETED: ("thinking...", {}),
+    EventType.NODE_STALLED: ("stalled: {reason}", {"reason": ""}),
+    EventType.CONTEXT_COMPACTED: (
+        "compacted: {usage_before}% \u2192 {usage_after}%",
+        {"usage_before": "?", "usage_after": "?"},
+    ),
+    EventType.JUDGE_VERDICT: ("judge: {action}", {"action": "?"}),
+    EventType.OUTPUT_KEY_SET: ("set: {key}", {"key": "?"}),
+    EventType.NODE_RETRY: (
+        "retry {retry_count}/{max_retries}",
+        {"retry_count": "?", "max_retries": "?"},
+    ),
+    EventType.EXECUTION_PAUSED: ("paused", {}),
+    EventType.EXECUTION_RESUMED: ("resumed", {}),
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_elapsed(total: int) -> str:
+    """Elapsed-time markup for the status bar, memoized per whole second."""
+    hours, remainder = divmod(total, 3600)
+    mins, secs = divmod(remainder, 60)
+    if hours:
+        return f"[dim]{hours}:{mins:02d}:{secs:02d}[/dim]"
+    return f"[dim]{mins}:{secs:02d}[/dim]"
 
 
 class StatusBar(Container):
@@ -33,6 +116,16 @@ class StatusBar(Container):
     }
     """
 
+    # Setters arriving within this window share one re-render
+    _REFRESH_DELAY = 0.05
+
+    _STATE_MARKUP = {
+        "idle": "[dim]○ idle[/dim]",
+        "running": "[bold green]● running[/bold green]",
+        "completed": "[green]✓ done[/green]",
+        "failed": "[bold red]✗ failed[/bold red]",
+    }
+
     def __init__(self, graph_id: str = ""):
         super().__init__()
         self._graph_id = graph_id
@@ -41,57 +134,75 @@ def __init__(self, graph_id: str = ""):
         self._node_detail: str = ""
         self._start_time: float | None = None
         self._final_elapsed: float | None = None
+        # Markup for the parts that only change in setters, built there once
+        self._graph_id_markup = f"[bold]{graph_id}[/bold]" if graph_id else ""
+        self._node_markup = ""
+        self._refresh_pending = False
+        self._last_sig: tuple | None = None
+        self._clock_timer: Timer | None = None
+        self._label: Label | None = None
 
     def compose(self) -> ComposeResult:
-        yield Label(id="status-content")
+        self._label = Label(id="status-content")
+        yield self._label
 
     def on_mount(self) -> None:
         self._refresh()
-        self.set_interval(1.0, self._refresh)
+        # The 1 Hz tick only drives the elapsed clock, so it runs only while running
+        self._clock_timer = self.set_interval(1.0, self._refresh, pause=self._state != "running")
+
+    def _schedule_refresh(self) -> None:
+        """Coalesce bursts of setter calls into a single deferred refresh."""
+        if self._clock_timer is not None:
+            if self._state == "running":
+                self._clock_timer.resume()
+            else:
+                self._clock_timer.pause()
 
-    def _format_elapsed(self, seconds: float) -> str:
-        total = int(seconds)
-        hours, remainder = divmod(total, 3600)
-        mins, secs = divmod(remainder, 60)
-        if hours:
-            return f"{hours}:{mins:02d}:{secs:02d}"
-        return f"{mins}:{secs:02d}"
+        if self._refresh_pending or not self.is_mounted:
+            return  # on_mount renders the initial state
+        self._refresh_pending = True
+        self.set_timer(self._REFRESH_DELAY, self._do_refresh)
 
-    def _refresh(self) -> None:
-        parts: list[str] = []
-
-        if self._graph_id:
-            parts.append(f"[bold]{self._graph_id}[/bold]")
-
-        if self._state == "idle":
-            parts.append("[dim]○ idle[/dim]")
-        elif self._state == "running":
-            parts.append("[bold green]● running[/bold green]")
-        elif self._state == "completed":
-            parts.append("[green]✓ done[/green]")
-        elif self._state == "failed":
-            parts.append("[bold red]✗ failed[/bold red]")
-
-        if self._active_node:
-            node_str = f"[cyan]{self._active_node}[/cyan]"
-            if self._node_detail:
-                node_str += f" [dim]({self._node_detail})[/dim]"
-            parts.append(node_str)
+    def _do_refresh(self) -> None:
+        self._refresh_pending = False
+        self._refresh()
 
+    def _update_node_markup(self) -> None:
+        if not self._active_node:
+            self._node_markup = ""
+        elif self._node_detail:
+            self._node_markup = f"[cyan]{self._active_node}[/cyan] [dim]({self._node_detail})[/dim]"
+        else:
+            self._node_markup = f"[cyan]{self._active_node}[/cyan]"
+
+    def _refresh(self) -> None:
+        if self._label is None:
+            return
+        seconds: int | None = None
         if self._state == "running" and self._start_time:
-            parts.append(f"[dim]{self._format_elapsed(time.time() - self._start_time)}[/dim]")
+            seconds = int(time.time() - self._start_time)
         elif self._final_elapsed is not None:
-            parts.append(f"[dim]{self._format_elapsed(self._final_elapsed)}[/dim]")
+            seconds = int(self._final_elapsed)
 
-        try:
-            label = self.query_one("#status-content", Label)
-            label.update(" │ ".join(parts))
-        except Exception:
-            pass
+        # Skip all string work when nothing visible has changed
+        sig = (self._graph_id_markup, self._state, self._node_markup, seconds)
+        if sig == self._last_sig:
+            return
+        self._last_sig = sig
+
+        parts = (
+            self._graph_id_markup,
+            self._STATE_MARKUP.get(self._state, ""),
+            self._node_markup,
+            _format_elapsed(seconds) if seconds is not None else "",
+        )
+        self._label.update(" │ ".join([part for part in parts if part]))
 
     def set_graph_id(self, graph_id: str) -> None:
         self._graph_id = graph_id
-        self._refresh()
+        self._graph_id_markup = f"[bold]{graph_id}[/bold]" if graph_id else ""
+        self._schedule_refresh()
 
     def set_running(self, entry_node: str = "") -> None:
         self._state = "running"
@@ -99,7 +210,8 @@ def set_running(self, entry_node: str = "") -> None:
         self._node_detail = ""
         self._start_time = time.time()
         self._final_elapsed = None
-        self._refresh()
+        self._update_node_markup()
+        self._schedule_refresh()
 
     def set_completed(self) -> None:
         self._state = "completed"
@@ -108,7 +220,8 @@ def set_completed(self) -> None:
         self._active_node = None
         self._node_detail = ""
         self._start_time = None
-        self._refresh()
+        self._update_node_markup()
+        self._schedule_refresh()
 
     def set_failed(self, error: str = "") -> None:
         self._state = "failed"
@@ -116,16 +229,56 @@ def set_failed(self, error: str = "") -> None:
             self._final_elapsed = time.time() - self._start_time
         self._node_detail = error[:40] if error else ""
         self._start_time = None
-        self._refresh()
+        self._update_node_markup()
+        self._schedule_refresh()
 
     def set_active_node(self, node_id: str, detail: str = "") -> None:
         self._active_node = node_id
         self._node_detail = detail
-        self._refresh()
+        self._update_node_markup()
+        self._schedule_refresh()
 
     def set_node_detail(self, detail: str) -> None:
+        if detail == self._node_detail:
+            return  # Bursts of the same tool/step detail are no-ops
         self._node_detail = detail
-        self._refresh()
+        self._update_node_markup()
+        self._schedule_refresh()
+
+
+class TuiLogHandler(logging.Handler):
+    """Push log records onto the app's event loop in batches.
+
+    Records can be emitted from worker threads (e.g. ``AgentRunner.load`` in
+    an executor), so delivery is always scheduled on the app loop rather than
+    touching widgets from the calling thread. Records emitted before the
+    scheduled flush runs are delivered together in one write.
+    """
+
+    def __init__(self, app: "AdenTUI") -> None:
+        super().__init__()
+        self.app = app
+        self._batch: list[logging.LogRecord] = []
+        self._batch_lock = threading.Lock()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        loop = self.app._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            with self._batch_lock:
+                self._batch.append(record)
+                if len(self._batch) > 1:
+                    return  # A flush is already scheduled
+            # Non-blocking: a logging thread never waits on the UI
+            loop.call_soon_threadsafe(self._flush)
+        except Exception:
+            self.handleError(record)
+
+    def _flush(self) -> None:
+        with self._batch_lock:
+            records, self._batch = self._batch, []
+        self.app._deliver_logs(records)
 
 
 class AdenTUI(App):
@@ -235,21 +388,98 @@ def __init__(
         self._resume_session = resume_session
         self._resume_checkpoint = resume_checkpoint
         self._runner = None  # AgentRunner — needed for cleanup on swap
+        self._runner_path = ""  # self._runner.agent_path, resolved once when attached
+        # Bounded pool for blocking loads/discovery so repeated actions can't pile up threads
+        self._io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="aden-io")
 
         # Escalation stack: stores worker state when coder is in foreground
         self._escalation_stack: list[dict] = []
 
+        # (timestamp, agents) from the last discover_agents() walk
+        self._agents_cache: tuple[float, dict] | None = None
+
         # Widgets are created lazily when runtime is available
         self.graph_view = None
         self.chat_repl = None
         self.status_bar = StatusBar(graph_id=runtime.graph.id if runtime else "")
         self.is_ready = False
 
+        # Cross-thread text deltas waiting for one scheduled flush, keyed by
+        # (graph_id, event type); None when no flush is pending
+        self._delta_batch: dict[tuple, list[AgentEvent]] | None = None
+        self._delta_lock = threading.Lock()
+
+        # Graph view / status bar updates queued for one drain per refresh
+        self._pending_gv_ops: list[tuple[Callable[[AgentEvent], None], AgentEvent]] = []
+        self._pending_sb_ops: list[tuple[Callable[[AgentEvent], None], AgentEvent]] = []
+        self._widget_ops_scheduled = False
+
+        # (active graph id, node id) -> display name for the status bar
+        self._node_name_cache: dict[tuple[str | None, str], str] = {}
+
+        # Bound once: both are hit for every runtime event in _handle_event
+        self._get_ident = threading.get_ident
+        self._call_from_thread = self.call_from_thread
+
+        # Per-widget handlers, merged below into a single routing table
+        chat_handlers = {
+            EventType.LLM_TEXT_DELTA: self._chat_text_delta,
+            EventType.CLIENT_OUTPUT_DELTA: self._chat_text_delta,
+            EventType.TOOL_CALL_STARTED: self._chat_tool_started,
+            EventType.TOOL_CALL_COMPLETED: self._chat_tool_completed,
+            EventType.EXECUTION_COMPLETED: self._chat_execution_completed,
+            EventType.EXECUTION_FAILED: self._chat_execution_failed,
+            EventType.CLIENT_INPUT_REQUESTED: self._chat_input_requested,
+            EventType.ESCALATION_REQUESTED: self._chat_escalation_requested,
+            EventType.NODE_LOOP_STARTED: self._chat_node_started,
+            EventType.NODE_LOOP_ITERATION: self._chat_loop_iteration,
+            EventType.NODE_LOOP_COMPLETED: self._chat_node_completed,
+            EventType.NODE_INTERNAL_OUTPUT: self._chat_internal_output,
+            EventType.EXECUTION_PAUSED: self._chat_execution_paused,
+            EventType.EXECUTION_RESUMED: self._chat_execution_resumed,
+            EventType.GOAL_ACHIEVED: self._chat_goal_achieved,
+            EventType.CONSTRAINT_VIOLATION: self._chat_constraint_violation,
+        }
+        graphview_handlers = {
+            EventType.EXECUTION_STARTED: self._gv_update_execution,
+            EventType.EXECUTION_COMPLETED: self._gv_update_execution,
+            EventType.EXECUTION_FAILED: self._gv_update_execution,
+            EventType.NODE_LOOP_STARTED: self._gv_node_loop_started,
+            EventType.NODE_LOOP_ITERATION: self._gv_node_loop_iteration,
+            EventType.NODE_LOOP_COMPLETED: self._gv_node_loop_completed,
+            EventType.NODE_STALLED: self._gv_stalled,
+            EventType.TOOL_CALL_STARTED: self._gv_tool_started,
+            EventType.TOOL_CALL_COMPLETED: self._gv_tool_completed,
+            EventType.EDGE_TRAVERSED: self._gv_edge_traversed,
+        }
+        statusbar_handlers = {
+            EventType.EXECUTION_STARTED: self._sb_execution_started,
+            EventType.EXECUTION_COMPLETED: self._sb_execution_completed,
+            EventType.EXECUTION_FAILED: self._sb_execution_failed,
+            EventType.NODE_LOOP_STARTED: self._sb_node_loop_started,
+            **dict.fromkeys(_STATUS_TEMPLATES, self._sb_node_detail),
+        }
+        # EventType -> (chat, graph view, status bar, echo to log pane): one lookup per event
+        self._event_routes: dict[EventType, _EventRoute] = {
+            et: (
+                chat_handlers.get(et),
+                graphview_handlers.get(et),
+                statusbar_handlers.get(et),
+                et in _LOG_PANE_EVENTS,
+            )
+            for et in _EVENT_TYPES
+        }
+
     def open_url(self, url: str, *, new_tab: bool = True) -> None:
         """Override to use native `open` for file:// URLs on macOS."""
         if url.startswith("file://") and platform.system() == "Darwin":
             path = url.removeprefix("file://")
-            subprocess.Popen(["open", path])
+            # fork/exec can take tens of ms; keep it off the event loop
+            self.run_worker(
+                lambda: subprocess.Popen(["open", path]),
+                thread=True,
+                exclusive=False,
+            )
         else:
             super().open_url(url, new_tab=new_tab)
 
@@ -273,8 +503,9 @@ def compose(self) -> ComposeResult:
     async def on_mount(self) -> None:
         """Called when app starts."""
         self.title = "Aden TUI Dashboard"
-        self._setup_logging_queue()
+        self._setup_logging()
         self.is_ready = True
+        self._init_deferred_imports()
 
         if self.runtime is not None:
             # Direct launch with agent already loaded
@@ -290,62 +521,72 @@ def write_initial_logs():
             # No agent — show picker
             self.call_later(self._show_agent_picker_initial)
 
-    # -- Agent widget lifecycle --
+    @classmethod
+    def _init_deferred_imports(cls) -> None:
+        """Import heavy framework modules once, after the UI is up.
 
-    def _mount_agent_widgets(self) -> None:
-        """Mount ChatRepl and GraphOverview into #agent-workspace."""
+        Kept off module import so TUI startup stays fast; stashed on the class so
+        repeated agent swaps, escalations and screenshots skip the import machinery.
+        """
+        if "_ChatRepl" in cls.__dict__:
+            return
+
+        from framework.credentials.models import CredentialError
+        from framework.runner import AgentRunner
         from framework.tui.widgets.chat_repl import ChatRepl
         from framework.tui.widgets.graph_view import GraphOverview
 
-        workspace = self.query_one("#agent-workspace", Horizontal)
+        cls._ChatRepl = ChatRepl
+        cls._GraphOverview = GraphOverview
+        cls._AgentRunner = AgentRunner
+        cls._CredentialError = CredentialError
+
+    # -- Agent widget lifecycle --
 
-        # Remove empty-state placeholder if present
-        for child in list(workspace.children):
-            child.remove()
+    def _mount_agent_widgets(self) -> None:
+        """Mount ChatRepl and GraphOverview into #agent-workspace."""
+        workspace = self.query_one("#agent-workspace", Horizontal)
 
-        self.graph_view = GraphOverview(self.runtime)
-        self.chat_repl = ChatRepl(
+        self.graph_view = self._GraphOverview(self.runtime)
+        self.chat_repl = self._ChatRepl(
             self.runtime,
             self._resume_session,
             self._resume_checkpoint,
         )
-        workspace.mount(self.graph_view)
-        workspace.mount(self.chat_repl)
+        # One compositor update for the swap instead of one per child
+        with self.batch_update():
+            # Remove empty-state placeholder if present
+            workspace.remove_children()
+            workspace.mount(self.graph_view)
+            workspace.mount(self.chat_repl)
         self.status_bar.set_graph_id(self.runtime.graph.id)
+        self._node_name_cache.clear()  # new runtime, possibly reusing graph ids
+        self._flush_pending_logs()
 
     def _unmount_agent_widgets(self) -> None:
         """Remove ChatRepl and GraphOverview from #agent-workspace."""
         # Unsubscribe from events
         if hasattr(self, "_subscription_id"):
-            try:
+            with suppress(Exception):
                 self.runtime.unsubscribe_from_events(self._subscription_id)
-            except Exception:
-                pass
             del self._subscription_id
 
         workspace = self.query_one("#agent-workspace", Horizontal)
-        for child in list(workspace.children):
-            child.remove()
+        workspace.remove_children()
 
         self.graph_view = None
         self.chat_repl = None
 
     async def _load_and_switch_agent(self, agent_path: str) -> None:
         """Load an agent and replace the current one in the TUI."""
-        from pathlib import Path
-
-        from framework.credentials.models import CredentialError
-        from framework.runner import AgentRunner
-
         # 1. Tear down old agent
         if self.runtime is not None:
             self._unmount_agent_widgets()
             if self._runner is not None:
-                try:
+                with suppress(Exception):
                     await self._runner.cleanup_async()
-                except Exception:
-                    pass
                 self._runner = None
+                self._runner_path = ""
             self.runtime = None
 
         # 2. Show loading state
@@ -354,19 +595,17 @@ async def _load_and_switch_agent(self, agent_path: str) -> None:
         self.notify(f"Loading agent: {agent_name}...", timeout=3)
 
         # 3. Load new agent (run blocking I/O in thread to avoid freezing the TUI)
-        import asyncio
-        import functools
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
             load_fn = functools.partial(
-                AgentRunner.load,
+                self._AgentRunner.load,
                 agent_path,
                 model=self._model,
                 interactive=False,
             )
-            runner = await loop.run_in_executor(None, load_fn)
-        except CredentialError as e:
+            runner = await loop.run_in_executor(self._io_executor, load_fn)
+        except self._CredentialError as e:
             self.status_bar.set_graph_id("")
             self._show_credential_setup(
                 str(agent_path),
@@ -382,7 +621,7 @@ async def _load_and_switch_agent(self, agent_path: str) -> None:
         if runner.requires_account_selection and runner._configure_for_account:
             try:
                 if runner._list_accounts:
-                    accounts = await loop.run_in_executor(None, runner._list_accounts)
+                    accounts = await loop.run_in_executor(self._io_executor, runner._list_accounts)
                 else:
                     accounts = []
             except Exception as e:
@@ -397,12 +636,10 @@ async def _load_and_switch_agent(self, agent_path: str) -> None:
 
     async def _finish_agent_load(self, runner) -> None:
         """Complete agent setup, guardian attach, and widget mount."""
-        import asyncio
-
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
             if runner._agent_runtime is None:
-                await loop.run_in_executor(None, runner._setup)
+                await loop.run_in_executor(self._io_executor, runner._setup)
 
             if not self._no_guardian and not runner.skip_guardian and runner._agent_runtime:
                 from framework.agents.hive_coder.guardian import attach_guardian
@@ -414,6 +651,11 @@ async def _finish_agent_load(self, runner) -> None:
 
             self._runner = runner
             self.runtime = runner._agent_runtime
+            self._runner_path = ""
+            if hasattr(runner, "agent_path"):
+                # resolve() stats every path component; keep it off the event loop
+                resolved = await loop.run_in_executor(self._io_executor, runner.agent_path.resolve)
+                self._runner_path = str(resolved)
         except Exception as e:
             self.status_bar.set_graph_id("")
             self.notify(f"Failed to load agent: {e}", severity="error", timeout=10)
@@ -520,11 +762,28 @@ def _on_result(result: bool | None) -> None:
 
     # -- Agent picker --
 
-    def _show_agent_picker_initial(self) -> None:
+    # Reuse a discovery walk for this long (repeated Ctrl+A presses)
+    _AGENTS_CACHE_TTL = 2.0
+
+    async def _get_agents(self) -> dict:
+        """Return discovered agents, walking the filesystem off the event loop."""
+        from framework.tui.screens.agent_picker import discover_agents
+
+        cached = self._agents_cache
+        if cached is not None and time.monotonic() - cached[0] < self._AGENTS_CACHE_TTL:
+            return cached[1]
+        agents = await asyncio.get_running_loop().run_in_executor(
+            self._io_executor, discover_agents
+        )
+        self._agents_cache = (time.monotonic(), agents)
+        return agents
+
+    @work(exclusive=True, group="agent-picker")
+    async def _show_agent_picker_initial(self) -> None:
         """Show the agent picker on initial startup (no agent loaded)."""
-        from framework.tui.screens.agent_picker import AgentPickerScreen, discover_agents
+        from framework.tui.screens.agent_picker import AgentPickerScreen
 
-        agents = discover_agents()
+        agents = await self._get_agents()
         if not agents:
             self.notify("No agents found in exports/ or examples/", severity="error", timeout=5)
             self.set_timer(2.0, self.exit)
@@ -559,11 +818,12 @@ def _handle_picker_result(self, result: str) -> None:
             # Regular agent path - load it
             self._do_load_agent(result)
 
-    def _show_agent_picker_tab(self, tab_id: str) -> None:
+    @work(exclusive=True, group="agent-picker")
+    async def _show_agent_picker_tab(self, tab_id: str) -> None:
         """Show the agent picker focused on a specific tab (no Get Started)."""
-        from framework.tui.screens.agent_picker import AgentPickerScreen, discover_agents
+        from framework.tui.screens.agent_picker import AgentPickerScreen
 
-        agents = discover_agents()
+        agents = await self._get_agents()
         if not agents:
             self.notify("No agents found", severity="error", timeout=5)
             return
@@ -603,11 +863,11 @@ def _show_build_edit_message(self) -> None:
         # Re-show picker so user can still select an agent
         self._show_agent_picker_initial()
 
-    def action_show_agent_picker(self) -> None:
+    async def action_show_agent_picker(self) -> None:
         """Open the agent picker (Ctrl+A or /agents)."""
-        from framework.tui.screens.agent_picker import AgentPickerScreen, discover_agents
+        from framework.tui.screens.agent_picker import AgentPickerScreen
 
-        agents = discover_agents()
+        agents = await self._get_agents()
         if not agents:
             self.notify("No agents found", severity="error", timeout=5)
             return
@@ -633,10 +893,6 @@ async def _do_escalate_to_coder(
         node_id: str = "",
     ) -> None:
         """Push current agent onto stack and load hive_coder."""
-        from pathlib import Path
-
-        from framework.credentials.models import CredentialError
-        from framework.runner import AgentRunner
         from framework.tools.session_graph_tools import register_graph_tools
 
         if self.runtime is None:
@@ -646,6 +902,7 @@ async def _do_escalate_to_coder(
         # 1. Save current state (do NOT cleanup — worker stays alive)
         saved = {
             "runner": self._runner,
+            "runner_path": self._runner_path,
             "runtime": self.runtime,
             "blocked_node_id": node_id,
         }
@@ -653,21 +910,16 @@ async def _do_escalate_to_coder(
 
         # Unsubscribe from worker events
         if hasattr(self, "_subscription_id"):
-            try:
+            with suppress(Exception):
                 self.runtime.unsubscribe_from_events(self._subscription_id)
-            except Exception:
-                pass
             del self._subscription_id
 
         # Remember worker agent path for coder context
-        worker_path = ""
-        if self._runner and hasattr(self._runner, "agent_path"):
-            worker_path = str(self._runner.agent_path.resolve())
+        worker_path = self._runner_path
 
         # 2. Remove worker widgets (they get destroyed)
         workspace = self.query_one("#agent-workspace", Horizontal)
-        for child in list(workspace.children):
-            child.remove()
+        await workspace.remove_children()
         self.graph_view = None
         self.chat_repl = None
 
@@ -676,23 +928,17 @@ async def _do_escalate_to_coder(
         self.notify("Escalating to Hive Coder...", timeout=3)
 
         # 4. Load hive_coder
-        framework_agents_dir = Path(__file__).resolve().parent.parent / "agents"
-        hive_coder_path = framework_agents_dir / "hive_coder"
-
-        import asyncio
-        import functools
-
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
             load_fn = functools.partial(
-                AgentRunner.load,
-                str(hive_coder_path),
+                self._AgentRunner.load,
+                str(_HIVE_CODER_PATH),
                 model=self._model,
                 interactive=False,
             )
-            runner = await loop.run_in_executor(None, load_fn)
+            runner = await loop.run_in_executor(self._io_executor, load_fn)
             if runner._agent_runtime is None:
-                await loop.run_in_executor(None, runner._setup)
+                await loop.run_in_executor(self._io_executor, runner._setup)
 
             coder_runtime = runner._agent_runtime
             coder_runtime._graph_id = "hive_coder"
@@ -707,11 +953,12 @@ async def _do_escalate_to_coder(
                 await coder_runtime.start()
 
             self._runner = runner
+            self._runner_path = str(_HIVE_CODER_PATH)
             self.runtime = coder_runtime
-        except CredentialError as e:
+        except self._CredentialError as e:
             self.status_bar.set_graph_id("")
             self._show_credential_setup(
-                str(hive_coder_path),
+                str(_HIVE_CODER_PATH),
                 on_cancel=self._restore_from_escalation_stack,
                 credential_error=e,
             )
@@ -731,8 +978,6 @@ async def _do_escalate_to_coder(
         # 6. Auto-trigger coder with escalation context
         escalation_input = self._build_escalation_input(reason, context, worker_path)
         try:
-            import asyncio
-
             entry_points = self.runtime.get_entry_points()
             if entry_points:
                 ep = entry_points[0]
@@ -780,14 +1025,13 @@ async def _return_from_escalation(self, summary: str = "") -> None:
         # 1. Tear down coder
         self._unmount_agent_widgets()
         if self._runner is not None:
-            try:
+            with suppress(Exception):
                 await self._runner.cleanup_async()
-            except Exception:
-                pass
 
         # 2. Restore worker
         saved = self._escalation_stack.pop()
         self._runner = saved["runner"]
+        self._runner_path = saved["runner_path"]
         self.runtime = saved["runtime"]
 
         # 3. Mount fresh widgets for the worker runtime
@@ -802,8 +1046,6 @@ async def _return_from_escalation(self, summary: str = "") -> None:
         return_msg = summary or "Coder session completed. Continuing."
         if blocked_node_id:
             try:
-                import asyncio
-
                 future = asyncio.run_coroutine_threadsafe(
                     self.runtime.inject_input(blocked_node_id, return_msg),
                     self.chat_repl._agent_loop,
@@ -833,21 +1075,21 @@ def _restore_from_escalation_stack(self) -> None:
             return
         saved = self._escalation_stack.pop()
         self._runner = saved["runner"]
+        self._runner_path = saved["runner_path"]
         self.runtime = saved["runtime"]
         self._mount_agent_widgets()
         self.call_later(self._init_runtime_connection)
 
     # -- Logging --
 
-    def _setup_logging_queue(self) -> None:
-        """Setup a thread-safe queue for logs."""
-        try:
-            import queue
-            from logging.handlers import QueueHandler
+    _SUPPRESSED_LOGGERS = ("textual", "LiteLLM", "litellm")
 
-            self.log_queue = queue.Queue()
-            self.queue_handler = QueueHandler(self.log_queue)
-            self.queue_handler.setLevel(logging.INFO)
+    def _setup_logging(self) -> None:
+        """Route Python logging into the chat pane via a push handler."""
+        try:
+            self._pending_logs: deque[logging.LogRecord] = deque(maxlen=1000)
+            self.log_handler = TuiLogHandler(self)
+            self.log_handler.setLevel(logging.INFO)
 
             # Get root logger
             root_logger = logging.getLogger()
@@ -857,83 +1099,51 @@ def _setup_logging_queue(self) -> None:
             for handler in root_logger.handlers[:]:
                 root_logger.removeHandler(handler)
 
-            # Add ONLY our queue handler
-            root_logger.addHandler(self.queue_handler)
+            # Add ONLY our TUI handler
+            root_logger.addHandler(self.log_handler)
             root_logger.setLevel(logging.INFO)
 
             # Suppress LiteLLM logging completely
             litellm_logger = logging.getLogger("LiteLLM")
             litellm_logger.setLevel(logging.CRITICAL)  # Only show critical errors
             litellm_logger.propagate = False  # Don't propagate to root logger
-
-            # Start polling
-            self.set_interval(0.1, self._poll_logs)
         except Exception:
             pass
 
-    def _poll_logs(self) -> None:
-        """Poll the log queue and update UI."""
+    def _deliver_logs(self, records: list[logging.LogRecord]) -> None:
+        """Write a batch of log records to the chat pane (runs on the app loop)."""
+        # Filter out framework/library logs
+        records = [r for r in records if not r.name.startswith(self._SUPPRESSED_LOGGERS)]
+        if not records:
+            return
         if not self.is_ready or self.chat_repl is None:
+            # Hold until an agent's ChatRepl is mounted
+            self._pending_logs.extend(records)
             return
-
         try:
-            while not self.log_queue.empty():
-                record = self.log_queue.get_nowait()
-                # Filter out framework/library logs
-                if record.name.startswith(("textual", "LiteLLM", "litellm")):
-                    continue
-
-                self.chat_repl.write_python_log(record)
+            self.chat_repl.write_python_logs(records)
         except Exception:
             pass
 
-    # -- Runtime event routing --
-
-    _EVENT_TYPES = [
-        EventType.LLM_TEXT_DELTA,
-        EventType.CLIENT_OUTPUT_DELTA,
-        EventType.TOOL_CALL_STARTED,
-        EventType.TOOL_CALL_COMPLETED,
-        EventType.EXECUTION_STARTED,
-        EventType.EXECUTION_COMPLETED,
-        EventType.EXECUTION_FAILED,
-        EventType.NODE_LOOP_STARTED,
-        EventType.NODE_LOOP_ITERATION,
-        EventType.NODE_LOOP_COMPLETED,
-        EventType.CLIENT_INPUT_REQUESTED,
-        EventType.NODE_STALLED,
-        EventType.GOAL_PROGRESS,
-        EventType.GOAL_ACHIEVED,
-        EventType.CONSTRAINT_VIOLATION,
-        EventType.STATE_CHANGED,
-        EventType.NODE_INPUT_BLOCKED,
-        EventType.CONTEXT_COMPACTED,
-        EventType.NODE_INTERNAL_OUTPUT,
-        EventType.JUDGE_VERDICT,
-        EventType.OUTPUT_KEY_SET,
-        EventType.NODE_RETRY,
-        EventType.EDGE_TRAVERSED,
-        EventType.EXECUTION_PAUSED,
-        EventType.EXECUTION_RESUMED,
-        EventType.ESCALATION_REQUESTED,
-    ]
+    def _flush_pending_logs(self) -> None:
+        """Write records that arrived before the ChatRepl existed."""
+        pending = getattr(self, "_pending_logs", None)
+        if pending and self.is_ready and self.chat_repl is not None:
+            records = list(pending)
+            pending.clear()
+            self._deliver_logs(records)
 
-    _LOG_PANE_EVENTS = frozenset(_EVENT_TYPES) - {
-        EventType.LLM_TEXT_DELTA,
-        EventType.CLIENT_OUTPUT_DELTA,
-    }
+    # -- Runtime event routing --
 
     async def _init_runtime_connection(self) -> None:
-        """Subscribe to runtime events with an async handler."""
-        try:
+        """Subscribe to runtime events with a sync (coroutine-free) handler."""
+        with suppress(Exception):
             self._subscription_id = self.runtime.subscribe_to_events(
-                event_types=self._EVENT_TYPES,
+                event_types=list(_EVENT_TYPES),
                 handler=self._handle_event,
             )
-        except Exception:
-            pass
 
-    async def _handle_event(self, event: AgentEvent) -> None:
+    def _handle_event(self, event: AgentEvent) -> None:
         """Bridge events to Textual's main thread for UI updates.
 
         Events may arrive from the agent-execution thread (normal LLM/tool
@@ -942,204 +1152,125 @@ async def _handle_event(self, event: AgentEvent) -> None:
         which thread we're on and act accordingly.
         """
         try:
-            if threading.get_ident() == self._thread_id:
+            # Drop background-graph noise here, before paying for a thread hop
+            runtime = self.runtime
+            if (
+                event.graph_id is not None
+                and runtime is not None
+                and event.graph_id != runtime.active_graph_id
+                and event.type not in _CROSS_GRAPH_NOTIFY_TYPES
+            ):
+                return
+
+            if self._get_ident() == self._thread_id:
                 # Already on Textual's thread — call directly.
                 self._route_event(event)
+            elif event.type in _DELTA_TYPES and self._loop is not None:
+                self._buffer_delta(event)
             else:
+                # Deltas buffered before this event are already scheduled ahead
+                # of it; later ones must start a new batch to keep ordering.
+                with self._delta_lock:
+                    self._delta_batch = None
                 # On a different thread — bridge via call_from_thread.
-                self.call_from_thread(self._route_event, event)
+                self._call_from_thread(self._route_event, event)
         except Exception as e:
-            logging.getLogger("tui.events").error(
+            _events_logger.error(
                 "call_from_thread failed for %s (node=%s): %s",
                 event.type.value,
                 event.node_id or "?",
                 e,
             )
 
+    def _buffer_delta(self, event: AgentEvent) -> None:
+        """Queue a text delta from a worker thread, scheduling at most one flush."""
+        with self._delta_lock:
+            batch = self._delta_batch
+            schedule = batch is None
+            if schedule:
+                batch = self._delta_batch = {}
+            batch.setdefault((event.graph_id, event.type), []).append(event)
+        if schedule:
+            # Non-blocking hop: the producer keeps streaming while the UI is busy
+            self._loop.call_soon_threadsafe(self._flush_deltas, batch)
+
+    def _flush_deltas(self, batch: dict[tuple, list[AgentEvent]]) -> None:
+        """Route one combined delta per stream for everything buffered."""
+        with self._delta_lock:
+            if self._delta_batch is batch:
+                self._delta_batch = None
+        for events in batch.values():
+            event = events[-1]
+            if len(events) > 1:
+                # Snapshots are cumulative; contents are concatenated
+                content = "".join([e.data.get("content", "") for e in events])
+                event = dataclasses.replace(event, data={**event.data, "content": content})
+            self._route_event(event)
+
     def _route_event(self, event: AgentEvent) -> None:
         """Route incoming events to widgets. Runs on Textual's main thread."""
-        if not self.is_ready or self.chat_repl is None:
+        chat = self.chat_repl
+        if not self.is_ready or chat is None:
             return
 
-        try:
-            et = event.type
+        # --- Multi-graph filtering ---
+        # If the event has a graph_id and it's not the active graph,
+        # show a notification for important events and drop the rest.
+        if event.graph_id is not None and event.graph_id != self.runtime.active_graph_id:
+            self._safe_handle(self._notify_background_event, event)
+            return
 
-            # --- Multi-graph filtering ---
-            # If the event has a graph_id and it's not the active graph,
-            # show a notification for important events and drop the rest.
-            if event.graph_id is not None and event.graph_id != self.runtime.active_graph_id:
-                if et == EventType.CLIENT_INPUT_REQUESTED:
-                    self.notify(
-                        f"[bold]{event.graph_id}[/bold] is waiting for input",
-                        severity="warning",
-                        timeout=10,
-                    )
-                elif et == EventType.EXECUTION_FAILED:
-                    error = event.data.get("error", "Unknown error")[:60]
-                    self.notify(
-                        f"[bold red]{event.graph_id}[/bold red] failed: {error}",
-                        severity="error",
-                        timeout=10,
-                    )
-                elif et == EventType.EXECUTION_COMPLETED:
-                    self.notify(
-                        f"[bold green]{event.graph_id}[/bold green] completed",
-                        severity="information",
-                        timeout=5,
-                    )
-                # All other background events are silently dropped (visible in logs)
-                return
+        route = self._event_routes.get(event.type)
+        if route is None:
+            return
+        chat_handler, gv_handler, sb_handler, to_log_pane = route
 
-            # --- Chat REPL events ---
-            if et in (EventType.LLM_TEXT_DELTA, EventType.CLIENT_OUTPUT_DELTA):
-                self.chat_repl.handle_text_delta(
-                    event.data.get("content", ""),
-                    event.data.get("snapshot", ""),
-                )
-            elif et == EventType.TOOL_CALL_STARTED:
-                self.chat_repl.handle_tool_started(
-                    event.data.get("tool_name", "unknown"),
-                    event.data.get("tool_input", {}),
-                )
-            elif et == EventType.TOOL_CALL_COMPLETED:
-                self.chat_repl.handle_tool_completed(
-                    event.data.get("tool_name", "unknown"),
-                    event.data.get("result", ""),
-                    event.data.get("is_error", False),
-                )
-            elif et == EventType.EXECUTION_COMPLETED:
-                self.chat_repl.handle_execution_completed(event.data.get("output", {}))
-            elif et == EventType.EXECUTION_FAILED:
-                self.chat_repl.handle_execution_failed(event.data.get("error", "Unknown error"))
-            elif et == EventType.CLIENT_INPUT_REQUESTED:
-                self.chat_repl.handle_input_requested(
-                    event.node_id or event.data.get("node_id", ""),
-                    graph_id=event.graph_id,
-                )
-            elif et == EventType.ESCALATION_REQUESTED:
-                self.chat_repl.handle_escalation_requested(event.data)
-                self._do_escalate_to_coder(
-                    reason=event.data.get("reason", ""),
-                    context=event.data.get("context", ""),
-                    node_id=event.node_id or "",
-                )
-            elif et == EventType.NODE_LOOP_STARTED:
-                self.chat_repl.handle_node_started(event.node_id or "")
-            elif et == EventType.NODE_LOOP_ITERATION:
-                self.chat_repl.handle_loop_iteration(event.data.get("iteration", 0))
-            elif et == EventType.NODE_LOOP_COMPLETED:
-                self.chat_repl.handle_node_completed(event.node_id or "")
-
-            # Non-client-facing node output → chat repl
-            if et == EventType.NODE_INTERNAL_OUTPUT:
-                content = event.data.get("content", "")
-                if content.strip():
-                    self.chat_repl.handle_internal_output(event.node_id or "", content)
-
-            # Execution paused/resumed → chat repl
-            if et == EventType.EXECUTION_PAUSED:
-                reason = event.data.get("reason", "")
-                self.chat_repl.handle_execution_paused(event.node_id or "", reason)
-            elif et == EventType.EXECUTION_RESUMED:
-                self.chat_repl.handle_execution_resumed(event.node_id or "")
-
-            # Goal achieved / constraint violation → chat repl
-            if et == EventType.GOAL_ACHIEVED:
-                self.chat_repl.handle_goal_achieved(event.data)
-            elif et == EventType.CONSTRAINT_VIOLATION:
-                self.chat_repl.handle_constraint_violation(event.data)
-
-            # --- Graph view events ---
-            if self.graph_view is not None:
-                if et in (
-                    EventType.EXECUTION_STARTED,
-                    EventType.EXECUTION_COMPLETED,
-                    EventType.EXECUTION_FAILED,
-                ):
-                    self.graph_view.update_execution(event)
-
-                if et == EventType.NODE_LOOP_STARTED:
-                    self.graph_view.handle_node_loop_started(event.node_id or "")
-                elif et == EventType.NODE_LOOP_ITERATION:
-                    self.graph_view.handle_node_loop_iteration(
-                        event.node_id or "",
-                        event.data.get("iteration", 0),
-                    )
-                elif et == EventType.NODE_LOOP_COMPLETED:
-                    self.graph_view.handle_node_loop_completed(event.node_id or "")
-                elif et == EventType.NODE_STALLED:
-                    self.graph_view.handle_stalled(
-                        event.node_id or "",
-                        event.data.get("reason", ""),
-                    )
+        # --- Chat REPL events ---
+        if chat_handler is not None:
+            self._safe_handle(chat_handler, event)
 
-                if et == EventType.TOOL_CALL_STARTED:
-                    self.graph_view.handle_tool_call(
-                        event.node_id or "",
-                        event.data.get("tool_name", "unknown"),
-                        started=True,
-                    )
-                elif et == EventType.TOOL_CALL_COMPLETED:
-                    self.graph_view.handle_tool_call(
-                        event.node_id or "",
-                        event.data.get("tool_name", "unknown"),
-                        started=False,
-                    )
+        # --- Graph view events (batched) ---
+        if gv_handler is not None and self.graph_view is not None:
+            self._queue_widget_op(self._pending_gv_ops, gv_handler, event)
 
-                # Edge traversal → graph view
-                if et == EventType.EDGE_TRAVERSED:
-                    self.graph_view.handle_edge_traversed(
-                        event.data.get("source_node", ""),
-                        event.data.get("target_node", ""),
-                    )
+        # --- Status bar events (batched) ---
+        if sb_handler is not None:
+            self._queue_widget_op(self._pending_sb_ops, sb_handler, event)
 
-            # --- Status bar events ---
-            if et == EventType.EXECUTION_STARTED:
-                entry_node = event.data.get("entry_node") or (
-                    self.runtime.graph.entry_node if self.runtime else ""
-                )
-                self.status_bar.set_running(entry_node)
-            elif et == EventType.EXECUTION_COMPLETED:
-                self.status_bar.set_completed()
-            elif et == EventType.EXECUTION_FAILED:
-                self.status_bar.set_failed(event.data.get("error", ""))
-            elif et == EventType.NODE_LOOP_STARTED:
-                nid = event.node_id or ""
-                node = self.runtime.graph.get_node(nid)
-                name = node.name if node else nid
-                self.status_bar.set_active_node(name, "thinking...")
-            elif et == EventType.NODE_LOOP_ITERATION:
-                self.status_bar.set_node_detail(f"step {event.data.get('iteration', '?')}")
-            elif et == EventType.TOOL_CALL_STARTED:
-                self.status_bar.set_node_detail(f"{event.data.get('tool_name', '')}...")
-            elif et == EventType.TOOL_CALL_COMPLETED:
-                self.status_bar.set_node_detail("thinking...")
-            elif et == EventType.NODE_STALLED:
-                self.status_bar.set_node_detail(f"stalled: {event.data.get('reason', '')}")
-            elif et == EventType.CONTEXT_COMPACTED:
-                before = event.data.get("usage_before", "?")
-                after = event.data.get("usage_after", "?")
-                self.status_bar.set_node_detail(f"compacted: {before}% \u2192 {after}%")
-            elif et == EventType.JUDGE_VERDICT:
-                action = event.data.get("action", "?")
-                self.status_bar.set_node_detail(f"judge: {action}")
-            elif et == EventType.OUTPUT_KEY_SET:
-                key = event.data.get("key", "?")
-                self.status_bar.set_node_detail(f"set: {key}")
-            elif et == EventType.NODE_RETRY:
-                retry = event.data.get("retry_count", "?")
-                max_r = event.data.get("max_retries", "?")
-                self.status_bar.set_node_detail(f"retry {retry}/{max_r}")
-            elif et == EventType.EXECUTION_PAUSED:
-                self.status_bar.set_node_detail("paused")
-            elif et == EventType.EXECUTION_RESUMED:
-                self.status_bar.set_node_detail("resumed")
-
-            # --- Log events (inline in chat) ---
-            if et in self._LOG_PANE_EVENTS:
-                self.chat_repl.write_log_event(event)
+        # --- Log events (inline in chat) ---
+        if to_log_pane:
+            self._safe_handle(chat.write_log_event, event)
+
+    def _queue_widget_op(
+        self,
+        ops: list[tuple[Callable[[AgentEvent], None], AgentEvent]],
+        handler: Callable[[AgentEvent], None],
+        event: AgentEvent,
+    ) -> None:
+        """Defer a graph view / status bar update to the next post-refresh drain."""
+        ops.append((handler, event))
+        if not self._widget_ops_scheduled:
+            self._widget_ops_scheduled = self.call_after_refresh(self._drain_widget_ops)
+
+    def _drain_widget_ops(self) -> None:
+        """Apply every queued widget update under a single compositor update."""
+        gv_ops, self._pending_gv_ops = self._pending_gv_ops, []
+        sb_ops, self._pending_sb_ops = self._pending_sb_ops, []
+        self._widget_ops_scheduled = False
+        if self.graph_view is None:
+            gv_ops = []  # Widgets were torn down (agent swap) before the drain
+        with self.batch_update():
+            for handler, event in gv_ops:
+                self._safe_handle(handler, event)
+            for handler, event in sb_ops:
+                self._safe_handle(handler, event)
+
+    def _safe_handle(self, handler: Callable[[AgentEvent], None], event: AgentEvent) -> None:
+        """Run one event handler; a failure is logged without affecting the others."""
+        try:
+            handler(event)
         except Exception as e:
-            logging.getLogger("tui.events").error(
+            _events_logger.error(
                 "Route failed for %s (node=%s): %s",
                 event.type.value,
                 event.node_id or "?",
@@ -1147,6 +1278,174 @@ def _route_event(self, event: AgentEvent) -> None:
                 exc_info=True,
             )
 
+    def _notify_background_event(self, event: AgentEvent) -> None:
+        et = event.type
+        if et is _CLIENT_INPUT_REQUESTED:
+            self.notify(
+                f"[bold]{event.graph_id}[/bold] is waiting for input",
+                severity="warning",
+                timeout=10,
+            )
+        elif et is _EXECUTION_FAILED:
+            error = event.data.get("error", "Unknown error")[:60]
+            self.notify(
+                f"[bold red]{event.graph_id}[/bold red] failed: {error}",
+                severity="error",
+                timeout=10,
+            )
+        elif et is _EXECUTION_COMPLETED:
+            self.notify(
+                f"[bold green]{event.graph_id}[/bold green] completed",
+                severity="information",
+                timeout=5,
+            )
+        # All other background events are silently dropped (visible in logs)
+
+    # -- Chat REPL event handlers --
+
+    def _chat_text_delta(self, event: AgentEvent) -> None:
+        data = event.data
+        self.chat_repl.handle_text_delta(
+            data.get("content", ""),
+            data.get("snapshot", ""),
+        )
+
+    def _chat_tool_started(self, event: AgentEvent) -> None:
+        data = event.data
+        self.chat_repl.handle_tool_started(
+            data.get("tool_name", "unknown"),
+            data.get("tool_input", {}),
+        )
+
+    def _chat_tool_completed(self, event: AgentEvent) -> None:
+        data = event.data
+        self.chat_repl.handle_tool_completed(
+            data.get("tool_name", "unknown"),
+            data.get("result", ""),
+            data.get("is_error", False),
+        )
+
+    def _chat_execution_completed(self, event: AgentEvent) -> None:
+        self.chat_repl.handle_execution_completed(event.data.get("output", {}))
+
+    def _chat_execution_failed(self, event: AgentEvent) -> None:
+        self.chat_repl.handle_execution_failed(event.data.get("error", "Unknown error"))
+
+    def _chat_input_requested(self, event: AgentEvent) -> None:
+        self.chat_repl.handle_input_requested(
+            event.node_id or event.data.get("node_id", ""),
+            graph_id=event.graph_id,
+        )
+
+    def _chat_escalation_requested(self, event: AgentEvent) -> None:
+        data = event.data
+        self.chat_repl.handle_escalation_requested(data)
+        self._do_escalate_to_coder(
+            reason=data.get("reason", ""),
+            context=data.get("context", ""),
+            node_id=event.node_id or "",
+        )
+
+    def _chat_node_started(self, event: AgentEvent) -> None:
+        self.chat_repl.handle_node_started(event.node_id or "")
+
+    def _chat_loop_iteration(self, event: AgentEvent) -> None:
+        self.chat_repl.handle_loop_iteration(event.data.get("iteration", 0))
+
+    def _chat_node_completed(self, event: AgentEvent) -> None:
+        self.chat_repl.handle_node_completed(event.node_id or "")
+
+    def _chat_internal_output(self, event: AgentEvent) -> None:
+        # Non-client-facing node output
+        content = event.data.get("content", "")
+        # isspace() stops at the first non-blank char; strip() copies the string
+        if content and not content.isspace():
+            self.chat_repl.handle_internal_output(event.node_id or "", content)
+
+    def _chat_execution_paused(self, event: AgentEvent) -> None:
+        reason = event.data.get("reason", "")
+        self.chat_repl.handle_execution_paused(event.node_id or "", reason)
+
+    def _chat_execution_resumed(self, event: AgentEvent) -> None:
+        self.chat_repl.handle_execution_resumed(event.node_id or "")
+
+    def _chat_goal_achieved(self, event: AgentEvent) -> None:
+        self.chat_repl.handle_goal_achieved(event.data)
+
+    def _chat_constraint_violation(self, event: AgentEvent) -> None:
+        self.chat_repl.handle_constraint_violation(event.data)
+
+    # -- Graph view event handlers --
+
+    def _gv_update_execution(self, event: AgentEvent) -> None:
+        self.graph_view.update_execution(event)
+
+    def _gv_node_loop_started(self, event: AgentEvent) -> None:
+        self.graph_view.handle_node_loop_started(event.node_id or "")
+
+    def _gv_node_loop_iteration(self, event: AgentEvent) -> None:
+        self.graph_view.handle_node_loop_iteration(
+            event.node_id or "",
+            event.data.get("iteration", 0),
+        )
+
+    def _gv_node_loop_completed(self, event: AgentEvent) -> None:
+        self.graph_view.handle_node_loop_completed(event.node_id or "")
+
+    def _gv_stalled(self, event: AgentEvent) -> None:
+        self.graph_view.handle_stalled(
+            event.node_id or "",
+            event.data.get("reason", ""),
+        )
+
+    def _gv_tool_started(self, event: AgentEvent) -> None:
+        self.graph_view.handle_tool_call(
+            event.node_id or "",
+            event.data.get("tool_name", "unknown"),
+            started=True,
+        )
+
+    def _gv_tool_completed(self, event: AgentEvent) -> None:
+        self.graph_view.handle_tool_call(
+            event.node_id or "",
+            event.data.get("tool_name", "unknown"),
+            started=False,
+        )
+
+    def _gv_edge_traversed(self, event: AgentEvent) -> None:
+        data = event.data
+        self.graph_view.handle_edge_traversed(
+            data.get("source_node", ""),
+            data.get("target_node", ""),
+        )
+
+    # -- Status bar event handlers --
+
+    def _sb_execution_started(self, event: AgentEvent) -> None:
+        entry_node = event.data.get("entry_node") or (
+            self.runtime.graph.entry_node if self.runtime else ""
+        )
+        self.status_bar.set_running(entry_node)
+
+    def _sb_execution_completed(self, event: AgentEvent) -> None:
+        self.status_bar.set_completed()
+
+    def _sb_execution_failed(self, event: AgentEvent) -> None:
+        self.status_bar.set_failed(event.data.get("error", ""))
+
+    def _sb_node_loop_started(self, event: AgentEvent) -> None:
+        nid = event.node_id or ""
+        key = (self.runtime.active_graph_id, nid)
+        name = self._node_name_cache.get(key)
+        if name is None:
+            node = self.runtime.graph.get_node(nid)
+            name = self._node_name_cache[key] = node.name if node else nid
+        self.status_bar.set_active_node(name, "thinking...")
+
+    def _sb_node_detail(self, event: AgentEvent) -> None:
+        template, defaults = _STATUS_TEMPLATES[event.type]
+        self.status_bar.set_node_detail(template.format_map(ChainMap(event.data, defaults)))
+
     # -- Actions --
 
     def action_switch_graph(self, graph_id: str) -> None:
@@ -1161,6 +1460,7 @@ def action_switch_graph(self, graph_id: str) -> None:
 
         # Update status bar
         self.status_bar.set_graph_id(graph_id)
+        self._node_name_cache.clear()
 
         # Update graph view
         reg = self.runtime.get_graph_registration(graph_id)
@@ -1175,9 +1475,6 @@ def action_switch_graph(self, graph_id: str) -> None:
 
     def save_screenshot(self, filename: str | None = None) -> str:
         """Save a screenshot of the current screen as SVG (viewable in browsers)."""
-        from datetime import datetime
-        from pathlib import Path
-
         screenshots_dir = Path("screenshots")
         screenshots_dir.mkdir(exist_ok=True)
 
@@ -1190,10 +1487,10 @@ def save_screenshot(self, filename: str | None = None) -> str:
 
         filepath = screenshots_dir / filename
 
-        from framework.tui.widgets.chat_repl import ChatRepl
-
+        # Harnesses may screenshot an app that never ran on_mount
+        self._init_deferred_imports()
         try:
-            chat_widget = self.query_one(ChatRepl)
+            chat_widget = self.query_one(self._ChatRepl)
         except Exception:
             # No ChatRepl mounted yet
             svg_data = self.export_screenshot()
@@ -1239,12 +1536,27 @@ def action_toggle_logs(self) -> None:
         mode = "ON" if self.chat_repl._show_logs else "OFF"
         self.notify(f"Logs {mode}", severity="information", timeout=2)
 
+    def _streams_active_first(self) -> Iterator:
+        """Yield execution streams, the active graph's first, without building a list."""
+        runtime = self.runtime
+        active_id = runtime.active_graph_id
+        active_reg = runtime.get_graph_registration(active_id)
+        if active_reg:
+            yield from active_reg.streams.values()
+        for gid in runtime.list_graphs():
+            if gid == active_id:
+                continue
+            reg = runtime.get_graph_registration(gid)
+            if reg:
+                yield from reg.streams.values()
+
     def action_pause_execution(self) -> None:
         """Immediately pause execution by cancelling task (bound to Ctrl+Z)."""
         if self.chat_repl is None or self.runtime is None:
             return
         try:
-            if not self.chat_repl._current_exec_id:
+            exec_id = self.chat_repl._current_exec_id
+            if not exec_id:
                 self.notify(
                     "No active execution to pause",
                     severity="information",
@@ -1252,32 +1564,17 @@ def action_pause_execution(self) -> None:
                 )
                 return
 
-            task_cancelled = False
-            all_streams = []
-            active_reg = self.runtime.get_graph_registration(self.runtime.active_graph_id)
-            if active_reg:
-                all_streams.extend(active_reg.streams.values())
-            for gid in self.runtime.list_graphs():
-                if gid == self.runtime.active_graph_id:
-                    continue
-                reg = self.runtime.get_graph_registration(gid)
-                if reg:
-                    all_streams.extend(reg.streams.values())
-
-            for stream in all_streams:
-                exec_id = self.chat_repl._current_exec_id
+            for stream in self._streams_active_first():
                 task = stream._execution_tasks.get(exec_id)
                 if task and not task.done():
                     task.cancel()
-                    task_cancelled = True
                     self.notify(
                         "Execution paused - state saved",
                         severity="information",
                         timeout=3,
                     )
                     break
-
-            if not task_cancelled:
+            else:
                 self.notify(
                     "Execution already completed",
                     severity="information",
@@ -1333,9 +1630,7 @@ async def on_unmount(self) -> None:
         self.is_ready = False
 
         # Cancel any active execution
-        try:
-            import asyncio
-
+        with suppress(Exception):
             if self.chat_repl and self.chat_repl._current_exec_id and self.runtime:
                 all_streams = []
                 for gid in self.runtime.list_graphs():
@@ -1347,23 +1642,14 @@ async def on_unmount(self) -> None:
                     task = stream._execution_tasks.get(exec_id)
                     if task and not task.done():
                         task.cancel()
-                        try:
+                        with suppress(Exception, asyncio.CancelledError):
                             await asyncio.wait_for(task, timeout=5.0)
-                        except (TimeoutError, asyncio.CancelledError):
-                            pass
-                        except Exception:
-                            pass
                         break
-        except Exception:
-            pass
 
-        try:
+        with suppress(Exception):
             if hasattr(self, "_subscription_id") and self.runtime:
                 self.runtime.unsubscribe_from_events(self._subscription_id)
-        except Exception:
-            pass
-        try:
-            if hasattr(self, "queue_handler"):
-                logging.getLogger().removeHandler(self.queue_handler)
-        except Exception:
-            pass
+        with suppress(Exception):
+            if hasattr(self, "log_handler"):
+                logging.getLogger().removeHandler(self.log_handler)
+        self._io_executor.shutdown(wait=False, cancel_futures=True)
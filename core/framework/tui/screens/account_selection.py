@@ -55,7 +55,12 @@ class AccountSelectionScreen(ModalScreen[dict | None]):
 
     def __init__(self, accounts: list[dict]) -> None:
         super().__init__()
-        self._accounts = accounts
+        # Group: Aden accounts first, then local (one pass, done before mount)
+        aden: list[dict] = []
+        local: list[dict] = []
+        for acct in accounts:
+            (local if acct.get("source") == "local" else aden).append(acct)
+        self._accounts = aden + local
 
     def compose(self) -> ComposeResult:
         n = len(self._accounts)
@@ -66,11 +71,7 @@ def compose(self) -> ComposeResult:
                 id="acct-subtitle",
             )
             option_list = OptionList(id="acct-list")
-            # Group: Aden accounts first, then local
-            aden = [a for a in self._accounts if a.get("source") != "local"]
-            local = [a for a in self._accounts if a.get("source") == "local"]
-            ordered = aden + local
-            for i, acct in enumerate(ordered):
+            for i, acct in enumerate(self._accounts):
                 provider = acct.get("provider", "unknown")
                 alias = acct.get("alias", "unknown")
                 identity = acct.get("identity", {})
@@ -90,8 +91,6 @@ def compose(self) -> ComposeResult:
                 if identity_label:
                     label.append(f"  ({identity_label})", style="dim")
                 option_list.add_option(Option(label, id=f"acct-{i}"))
-            # Keep ordered list for index lookups
-            self._accounts = ordered
             yield option_list
             yield Label(
                 "[dim]Enter[/dim] Select  [dim]Esc[/dim] Cancel",
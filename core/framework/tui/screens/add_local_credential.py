@@ -2,14 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+
+from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical, VerticalScroll
+from textual.reactive import reactive
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Label, OptionList
 from textual.widgets._option_list import Option
 
 
+@functools.lru_cache(maxsize=1)
+def _direct_api_key_specs() -> tuple[tuple[str, str, str], ...]:
+    """(credential_id, description, option prompt) for direct-API-key credentials.
+
+    CREDENTIAL_SPECS is fixed once aden_tools is imported, so the filter and the
+    option markup run once per process instead of on every modal open.
+    """
+    try:
+        from aden_tools.credentials import CREDENTIAL_SPECS
+    except Exception:
+        return ()
+    specs = []
+    for cid, spec in CREDENTIAL_SPECS.items():
+        if spec.direct_api_key_supported:
+            description = spec.description
+            specs.append((cid, description, f"{cid}  [dim]{description}[/dim]"))
+    return tuple(specs)
+
+
 class AddLocalCredentialScreen(ModalScreen[dict | None]):
     """Modal screen for adding a named local API key credential.
 
@@ -81,28 +105,27 @@ class AddLocalCredentialScreen(ModalScreen[dict | None]):
     }
     """
 
+    # Label text is driven by these; the watchers repaint only the bound label
+    subtitle_text: reactive[str] = reactive("", init=False)
+    status_text: reactive[str] = reactive("", init=False)
+
     def __init__(self) -> None:
         super().__init__()
         # Load credential specs that support direct API keys
-        self._specs: list[tuple[str, object]] = self._load_specs()
-        # Selected credential spec (set in phase 2)
+        self._specs: list[tuple[str, str, str]] = self._load_specs()
+        # The form only needs the description, so no spec object is held per selection
+        self._descriptions: dict[str, str] = {
+            cid: description or cid for cid, description, _ in self._specs
+        }
+        # Selected credential type (set in phase 2)
         self._selected_id: str = ""
-        self._selected_spec: object = None
+        self._selected_description: str = ""
         self._phase: int = 1  # 1 = type selection, 2 = form
 
     @staticmethod
-    def _load_specs() -> list[tuple[str, object]]:
-        """Return (credential_id, spec) pairs for direct-API-key credentials."""
-        try:
-            from aden_tools.credentials import CREDENTIAL_SPECS
-
-            return [
-                (cid, spec)
-                for cid, spec in CREDENTIAL_SPECS.items()
-                if getattr(spec, "direct_api_key_supported", False)
-            ]
-        except Exception:
-            return []
+    def _load_specs() -> list[tuple[str, str, str]]:
+        """Return (credential_id, description, prompt) for direct-API-key credentials."""
+        return list(_direct_api_key_specs())
 
     # ------------------------------------------------------------------
     # Compose
@@ -113,11 +136,9 @@ def compose(self) -> ComposeResult:
             yield Label("Add Local Credential", id="alc-title")
             yield Label("[dim]Store a named API key account[/dim]", id="alc-subtitle")
             # Phase 1: type selection
-            option_list = OptionList(id="alc-type-list")
-            for cid, spec in self._specs:
-                description = getattr(spec, "description", cid)
-                option_list.add_option(Option(f"{cid}  [dim]{description}[/dim]", id=f"type-{cid}"))
-            yield option_list
+            # Built up front so the list is laid out once, not once per add_option
+            options = [Option(prompt, id=f"type-{cid}") for cid, _, prompt in self._specs]
+            yield OptionList(*options, id="alc-type-list")
             # Phase 2: form (hidden initially)
             with VerticalScroll(id="alc-form"):
                 with Vertical(classes="alc-field"):
@@ -136,6 +157,12 @@ def compose(self) -> ComposeResult:
             )
 
     def on_mount(self) -> None:
+        # Queried once; phase switches and status updates reuse these
+        self._type_list = self.query_one("#alc-type-list", OptionList)
+        self._form = self.query_one("#alc-form", VerticalScroll)
+        self._subtitle = self.query_one("#alc-subtitle", Label)
+        self._status = self.query_one("#alc-status", Label)
+        self._alias_input = self.query_one("#alc-alias", Input)
         self._show_phase(1)
 
     # ------------------------------------------------------------------
@@ -144,25 +171,25 @@ def on_mount(self) -> None:
 
     def _show_phase(self, phase: int) -> None:
         self._phase = phase
-        type_list = self.query_one("#alc-type-list", OptionList)
-        form = self.query_one("#alc-form", VerticalScroll)
-        if phase == 1:
-            type_list.display = True
-            form.display = False
-            subtitle = self.query_one("#alc-subtitle", Label)
-            subtitle.update("[dim]Select the credential type to add[/dim]")
-        else:
-            type_list.display = False
-            form.display = True
-            spec = self._selected_spec
-            description = (
-                getattr(spec, "description", self._selected_id) if spec else self._selected_id
-            )
-            subtitle = self.query_one("#alc-subtitle", Label)
-            subtitle.update(f"[dim]{self._selected_id}[/dim]  {description}")
-            self._clear_status()
-            # Focus the alias input
-            self.query_one("#alc-alias", Input).focus()
+        # One repaint for the display toggles, subtitle and status together
+        with self.app.batch_update():
+            if phase == 1:
+                self._type_list.display = True
+                self._form.display = False
+                self.subtitle_text = "[dim]Select the credential type to add[/dim]"
+            else:
+                self._type_list.display = False
+                self._form.display = True
+                self.subtitle_text = f"[dim]{self._selected_id}[/dim]  {self._selected_description}"
+                self.status_text = ""
+                # Focus the alias input
+                self._alias_input.focus()
+
+    def watch_subtitle_text(self, markup: str) -> None:
+        self._subtitle.update(markup)
+
+    def watch_status_text(self, markup: str) -> None:
+        self._status.update(markup)
 
     # ------------------------------------------------------------------
     # Event handlers
@@ -172,13 +199,12 @@ def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> No
         if self._phase != 1:
             return
         option_id = event.option.id or ""
-        if option_id.startswith("type-"):
-            cid = option_id[5:]  # strip "type-" prefix
-            self._selected_id = cid
-            self._selected_spec = next(
-                (spec for spec_id, spec in self._specs if spec_id == cid), None
-            )
-            self._show_phase(2)
+        cid = option_id.removeprefix("type-")
+        if cid == option_id:
+            return  # Not a credential type option
+        self._selected_id = cid
+        self._selected_description = self._descriptions.get(cid, cid)
+        self._show_phase(2)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "btn-save":
@@ -190,15 +216,16 @@ def on_button_pressed(self, event: Button.Pressed) -> None:
     # Save logic
     # ------------------------------------------------------------------
 
-    def _do_save(self) -> None:
-        alias = self.query_one("#alc-alias", Input).value.strip() or "default"
+    @work(exclusive=True)
+    async def _do_save(self) -> None:
+        alias = self._alias_input.value.strip() or "default"
         api_key = self.query_one("#alc-key", Input).value.strip()
 
         if not api_key:
-            self._set_status("[red]API key cannot be empty.[/red]")
+            self.status_text = "[red]API key cannot be empty.[/red]"
             return
 
-        self._set_status("[dim]Running health check...[/dim]")
+        self.status_text = "[dim]Running health check...[/dim]"
         # Disable save button while running
         btn = self.query_one("#btn-save", Button)
         btn.disabled = True
@@ -207,15 +234,21 @@ def _do_save(self) -> None:
             from framework.credentials.local.registry import LocalCredentialRegistry
 
             registry = LocalCredentialRegistry.default()
-            info, health_result = registry.save_account(
+            # The health check is a network round-trip; keep it off the UI thread
+            info, health_result = await asyncio.to_thread(
+                registry.save_account,
                 credential_id=self._selected_id,
                 alias=alias,
                 api_key=api_key,
                 run_health_check=True,
             )
+            # The account picker memoizes its listing; drop it so the new account shows
+            from framework.agents.credential_tester import invalidate_accounts_cache
+
+            invalidate_accounts_cache()
 
             if health_result is not None and not health_result.valid:
-                self._set_status(
+                self.status_text = (
                     f"[yellow]Saved with failed health check:[/yellow] {health_result.message}\n"
                     "[dim]You can re-validate later via validate_credential().[/dim]"
                 )
@@ -225,20 +258,14 @@ def _do_save(self) -> None:
                 if identity:
                     parts = [f"{k}: {v}" for k, v in identity.items() if v]
                     identity_str = "  " + ", ".join(parts) if parts else ""
-                self._set_status(f"[green]Saved:[/green] {info.storage_id}{identity_str}")
+                self.status_text = f"[green]Saved:[/green] {info.storage_id}{identity_str}"
                 # Dismiss with result so callers can react
                 self.set_timer(1.0, lambda: self.dismiss(info.to_account_dict()))
                 return
         except Exception as e:
-            self._set_status(f"[red]Error:[/red] {e}")
+            self.status_text = f"[red]Error:[/red] {e}"
         finally:
             btn.disabled = False
 
-    def _set_status(self, markup: str) -> None:
-        self.query_one("#alc-status", Label).update(markup)
-
-    def _clear_status(self) -> None:
-        self.query_one("#alc-status", Label).update("")
-
     def action_dismiss_screen(self) -> None:
         self.dismiss(None)
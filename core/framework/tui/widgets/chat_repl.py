@@ -262,6 +262,13 @@ def write_python_log(self, record: logging.LogRecord) -> None:
         if self._show_logs:
             self._write_history(formatted)
 
+    def write_python_logs(self, records: list[logging.LogRecord]) -> None:
+        """Buffer several log records and display them with a single write."""
+        formatted = [format_python_log(record) for record in records]
+        self._log_buffer.extend(formatted)
+        if self._show_logs and formatted:
+            self._write_history("\n".join(formatted))
+
     async def _handle_command(self, command: str) -> None:
         """Handle slash commands for session and checkpoint operations."""
         parts = command.split(maxsplit=2)
@@ -0,0 +1,137 @@
+"""Tests for the credential tester agent's account listing helpers."""
+
+import threading
+import time
+
+import pytest
+
+from framework.agents.credential_tester import agent
+
+
+@pytest.fixture(autouse=True)
+def _isolated_home(tmp_path, monkeypatch):
+    """Point the encrypted store at a temp dir and start with a cold cache."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("ADEN_API_KEY", raising=False)
+    agent.invalidate_accounts_cache()
+    yield
+    agent.invalidate_accounts_cache()
+
+
+class TestSpecIndexes:
+    def test_tools_by_credential_group(self):
+        assert agent.get_tools_for_provider("google_custom_search") == ("google_search",)
+
+    def test_unknown_provider_has_no_tools(self):
+        assert agent.get_tools_for_provider("does-not-exist") == ()
+
+    def test_returns_cached_tuple(self):
+        tools = agent.get_tools_for_provider("razorpay")
+        assert tools is agent.get_tools_for_provider("razorpay")
+        assert list(tools) == sorted(set(tools))
+
+    def test_with_account_info_does_not_mutate(self):
+        tools = agent.get_tools_for_provider("razorpay")
+        extended = agent._with_account_info(tools)
+        assert extended[-1] == "get_account_info"
+        assert "get_account_info" not in agent.get_tools_for_provider("razorpay")
+
+    def test_group_members_indexed(self):
+        members = [name for name, _ in agent._spec_indexes().specs_by_group["razorpay"]]
+        assert members == ["razorpay", "razorpay_secret"]
+
+
+class TestListConnectedAccountsCache:
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        calls = []
+
+        def fake_aden():
+            calls.append("aden")
+            return [{"provider": "slack", "alias": "work", "source": "aden"}]
+
+        monkeypatch.setattr(agent, "_fetch_aden_accounts", fake_aden)
+        monkeypatch.setattr(agent, "_read_local_store", lambda *_, **__: ([], set()))
+        monkeypatch.setattr(agent, "_list_env_fallback_accounts", lambda *_, **__: [])
+        return calls
+
+    def test_second_call_served_from_cache(self, calls):
+        first = agent.list_connected_accounts()
+        second = agent.list_connected_accounts()
+        assert first == second
+        assert calls == ["aden"]
+
+    def test_env_change_invalidates(self, calls, monkeypatch):
+        agent.list_connected_accounts()
+        monkeypatch.setenv("ADEN_API_URL", "https://example.invalid")
+        agent.list_connected_accounts()
+        assert calls == ["aden", "aden"]
+
+    def test_ttl_expiry_invalidates(self, calls, monkeypatch):
+        agent.list_connected_accounts()
+        monkeypatch.setattr(agent, "_ACCOUNTS_CACHE_TTL", 0.0)
+        agent.list_connected_accounts()
+        assert calls == ["aden", "aden"]
+
+    def test_failed_source_not_cached(self, calls, monkeypatch):
+        def broken_store(*_, **__):
+            raise OSError("store unreadable")
+
+        monkeypatch.setattr(agent, "_read_local_store", broken_store)
+        assert agent.list_connected_accounts()[0]["provider"] == "slack"
+        agent.list_connected_accounts()
+        assert calls == ["aden", "aden"]
+
+    def test_sources_share_one_deadline(self, calls, monkeypatch, caplog):
+        release = threading.Event()
+
+        def slow_local(*_, **__):
+            time.sleep(0.25)
+            return [], set()
+
+        def stalled_aden():
+            release.wait(5)
+            return []
+
+        monkeypatch.setattr(agent, "_ACCOUNT_SOURCE_TIMEOUT", 0.3)
+        monkeypatch.setattr(agent, "_read_local_store", slow_local)
+        monkeypatch.setattr(agent, "_fetch_aden_accounts", stalled_aden)
+        try:
+            started = time.monotonic()
+            assert agent.list_connected_accounts() == []
+            assert time.monotonic() - started < 0.45
+        finally:
+            release.set()
+        assert "Skipped Aden accounts" in caplog.text
+
+    def test_explicit_invalidate(self, calls):
+        agent.list_connected_accounts()
+        agent.invalidate_accounts_cache()
+        agent.list_connected_accounts()
+        assert calls == ["aden", "aden"]
+
+
+class TestEnvFallbackAccounts:
+    @pytest.fixture(autouse=True)
+    def _clear_env(self, monkeypatch):
+        for _, spec in agent._spec_indexes().testable_specs:
+            monkeypatch.delenv(spec.env_var, raising=False)
+
+    def test_single_credential_from_env(self, monkeypatch):
+        monkeypatch.setenv("BRAVE_SEARCH_API_KEY", "test-key")
+        providers = [a["provider"] for a in agent._list_env_fallback_accounts()]
+        assert providers == ["brave_search"]
+
+    def test_group_requires_every_member(self, monkeypatch):
+        monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+        providers = [a["provider"] for a in agent._list_env_fallback_accounts()]
+        assert "google_custom_search" not in providers
+
+        monkeypatch.setenv("GOOGLE_CSE_ID", "test-cse")
+        providers = [a["provider"] for a in agent._list_env_fallback_accounts()]
+        assert providers.count("google_custom_search") == 1
+
+    def test_skip_providers(self, monkeypatch):
+        monkeypatch.setenv("BRAVE_SEARCH_API_KEY", "test-key")
+        accounts = agent._list_env_fallback_accounts(skip_providers={"brave_search"})
+        assert accounts == []
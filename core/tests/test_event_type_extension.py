@@ -549,6 +549,17 @@ async def handler(event):
         assert received[0].node_id == "node-A"
         assert received[0].data["content"] == "hello"
 
+    @pytest.mark.asyncio
+    async def test_sync_handler_receives_events(self, bus):
+        """A plain (non-async) handler is called without being awaited."""
+        received = []
+
+        bus.subscribe(event_types=[EventType.LLM_TEXT_DELTA], handler=received.append)
+
+        await bus.emit_llm_text_delta(stream_id="s1", node_id="n", content="x", snapshot="x")
+
+        assert [e.data["content"] for e in received] == ["x"]
+
     @pytest.mark.asyncio
     async def test_filter_node_rejects_non_matching_events(self, bus):
         """Subscriber with filter_node='node-B' does NOT receive node-A events."""
@@ -241,3 +241,27 @@ async def test_executor_no_events_without_event_bus():
     result = await executor.execute(graph=graph, goal=goal)
 
     assert result.success is True
+
+
+def test_graph_get_node_tracks_node_list_changes():
+    def _node(node_id):
+        return NodeSpec(id=node_id, name=node_id, description="test node", node_type="event_loop")
+
+    graph = GraphSpec(
+        id="graph-lookup", goal_id="g", nodes=[_node("a"), _node("b")], entry_node="a"
+    )
+
+    assert graph.get_node("b").id == "b"
+    assert graph.get_node("missing") is None
+
+    # Appended nodes are found, removed nodes are not
+    graph.nodes.append(_node("c"))
+    assert graph.get_node("c").id == "c"
+    graph.nodes.pop(0)
+    assert graph.get_node("a") is None
+    assert graph.get_node("b") is graph.nodes[0]
+
+    # In-place replacement returns the new object
+    replacement = _node("b")
+    graph.nodes[0] = replacement
+    assert graph.get_node("b") is replacement
@@ -0,0 +1,329 @@
+"""Tests for LocalCredentialRegistry (named local API key accounts)."""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from cryptography.fernet import Fernet
+
+from framework.credentials.local import LocalCredentialRegistry
+from framework.credentials.models import CredentialObject
+from framework.credentials.storage import EncryptedFileStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return EncryptedFileStorage(base_path=tmp_path, encryption_key=Fernet.generate_key())
+
+
+@pytest.fixture
+def registry(storage):
+    return LocalCredentialRegistry(storage)
+
+
+def _save_flat(storage, credential_id, api_key):
+    cred = CredentialObject(id=credential_id)
+    cred.set_key("api_key", api_key)
+    storage.save(cred)
+
+
+def _sidecar(storage):
+    return storage.base_path / "metadata" / "local_accounts.json"
+
+
+class TestListing:
+    def test_list_accounts_sorted(self, registry):
+        registry.save_account("github", "personal", "ghp-1", run_health_check=False)
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        registry.save_account("brave_search", "home", "BSA-2", run_health_check=False)
+
+        accounts = registry.list_accounts()
+        assert [(a.credential_id, a.alias) for a in accounts] == [
+            ("brave_search", "home"),
+            ("brave_search", "work"),
+            ("github", "personal"),
+        ]
+
+    def test_list_accounts_filtered(self, registry):
+        registry.save_account("github", "personal", "ghp-1", run_health_check=False)
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+
+        accounts = registry.list_accounts("github")
+        assert [a.alias for a in accounts] == ["personal"]
+
+    def test_list_all_with_flats(self, registry, storage):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        _save_flat(storage, "serpapi", "serp-1")
+
+        accounts, flat_ids = registry.list_all_with_flats()
+        assert [a.storage_id for a in accounts] == ["brave_search/work"]
+        assert flat_ids == {"serpapi"}
+
+    def test_iter_accounts_stops_early(self, registry, storage, monkeypatch):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        registry.save_account("brave_search", "home", "BSA-2", run_health_check=False)
+        registry.clear_cache()
+        _sidecar(storage).unlink()
+        loads = []
+        original_load = storage.load
+        monkeypatch.setattr(storage, "load", lambda sid: loads.append(sid) or original_load(sid))
+
+        first = next(registry.iter_accounts("brave_search"))
+        assert first.credential_id == "brave_search"
+        assert len(loads) == 1
+
+    def test_unreadable_entry_skipped(self, registry, storage, monkeypatch):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        registry.save_account("github", "personal", "ghp-1", run_health_check=False)
+        registry.clear_cache()
+        _sidecar(storage).unlink()
+        original_load = storage.load
+
+        def flaky_load(storage_id):
+            if storage_id == "github/personal":
+                raise ValueError("corrupt")
+            return original_load(storage_id)
+
+        monkeypatch.setattr(storage, "load", flaky_load)
+        assert [a.storage_id for a in registry.list_accounts()] == ["brave_search/work"]
+
+    def test_malformed_file_skipped(self, registry, storage):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        registry.save_account("github", "personal", "ghp-1", run_health_check=False)
+        registry.clear_cache()
+        _sidecar(storage).unlink()
+        storage._cred_path("github/personal").write_bytes(b"truncated")
+
+        assert [a.storage_id for a in registry.list_accounts()] == ["brave_search/work"]
+
+
+class TestBulkSave:
+    def test_saves_all_with_one_index_write(self, registry, storage, monkeypatch):
+        writes = []
+        write_index = storage._write_index
+        monkeypatch.setattr(storage, "_write_index", lambda i: writes.append(i) or write_index(i))
+
+        results = registry.save_accounts_bulk(
+            [
+                ("brave_search", "work", "BSA-1", None),
+                ("google_custom_search", "", "AIza-1", {"cse_id": "cse-1"}),
+            ],
+            run_health_check=False,
+        )
+
+        assert [info.storage_id for info, _ in results] == [
+            "brave_search/work",
+            "google_custom_search/default",
+        ]
+        assert len(writes) == 1
+        assert registry.get_key("google_custom_search", "default", "cse_id") == "cse-1"
+        assert len(registry.list_accounts()) == 2
+
+    def test_empty(self, registry):
+        assert registry.save_accounts_bulk([]) == []
+
+
+class TestSidecar:
+    def test_listing_skips_decryption(self, registry, storage, monkeypatch):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        registry.clear_cache()
+        monkeypatch.setattr(storage, "load", lambda _: pytest.fail("decrypted on listing"))
+
+        [info] = registry.list_accounts()
+        assert (info.storage_id, info.status) == ("brave_search/work", "active")
+
+    def test_sidecar_has_no_secrets(self, registry, storage):
+        registry.save_account("brave_search", "work", "BSA-secret", run_health_check=False)
+        assert "BSA-secret" not in _sidecar(storage).read_text()
+
+    def test_missing_entries_backfilled(self, registry, storage):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        _sidecar(storage).unlink()
+
+        assert [a.storage_id for a in registry.list_accounts()] == ["brave_search/work"]
+        assert "brave_search/work" in json.loads(_sidecar(storage).read_text())["accounts"]
+
+    def test_entry_for_rewritten_file_is_ignored(self, registry, storage):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        cred = storage.load("brave_search/work")
+        cred.set_key("_status", "failed")
+        # Bypasses the registry, as another process or CredentialStore would
+        storage.save(cred)
+
+        [info] = LocalCredentialRegistry(storage).list_accounts()
+        assert info.status == "failed"
+        entry = json.loads(_sidecar(storage).read_text())["accounts"]["brave_search/work"]
+        assert entry["status"] == "failed"
+
+    def test_delete_removes_entry(self, registry, storage):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        registry.delete_account("brave_search", "work")
+        assert json.loads(_sidecar(storage).read_text())["accounts"] == {}
+
+
+class TestGet:
+    def test_get_account_returns_copy(self, registry):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        cred = registry.get_account("brave_search", "work")
+        cred.set_key("api_key", "tampered")
+
+        assert registry.get_account("brave_search", "work").get_key("api_key") == "BSA-1"
+        assert registry.get_key("brave_search", "work") == "BSA-1"
+
+    def test_get_key(self, registry):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        assert registry.get_key("brave_search", "work") == "BSA-1"
+        assert registry.get_key("brave_search", "missing") is None
+
+    def test_get_key_skips_model_validation(self, registry, storage, monkeypatch):
+        registry.save_account(
+            "google_custom_search",
+            "work",
+            "AIza-1",
+            run_health_check=False,
+            extra_keys={"cse_id": "cse-1"},
+        )
+        registry.clear_cache()
+        monkeypatch.setattr(storage, "load", lambda _: pytest.fail("built a CredentialObject"))
+        assert registry.get_key("google_custom_search", "work", "cse_id") == "cse-1"
+        assert registry.get_key("google_custom_search", "work", "missing") is None
+
+    def test_get_account_info(self, registry):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        info = registry.get_account_info("brave_search", "work")
+        assert info is not None
+        assert info.status == "active"
+        assert info.to_account_dict()["source"] == "local"
+
+    def test_delete_account(self, registry):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        assert registry.delete_account("brave_search", "work") is True
+        assert registry.list_accounts() == []
+        assert registry.delete_account("brave_search", "work") is False
+
+
+class TestCache:
+    def test_repeat_reads_skip_decryption(self, registry, storage, monkeypatch):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        loads = []
+        original_load = storage.load
+        monkeypatch.setattr(storage, "load", lambda sid: loads.append(sid) or original_load(sid))
+
+        registry.get_account("brave_search", "work")
+        registry.get_account_info("brave_search", "work")
+        assert registry.get_key("brave_search", "work") == "BSA-1"
+        assert loads == ["brave_search/work"]
+
+    def test_save_invalidates(self, registry):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        assert registry.get_key("brave_search", "work") == "BSA-1"
+        registry.save_account("brave_search", "work", "BSA-2", run_health_check=False)
+        assert registry.get_key("brave_search", "work") == "BSA-2"
+
+    def test_delete_invalidates(self, registry):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        assert registry.get_key("brave_search", "work") == "BSA-1"
+        registry.delete_account("brave_search", "work")
+        assert registry.get_key("brave_search", "work") is None
+
+    def test_ttl_expiry(self, storage):
+        registry = LocalCredentialRegistry(storage, cache_ttl_seconds=0)
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        assert registry.get_key("brave_search", "work") == "BSA-1"
+        storage.delete("brave_search/work")
+        assert registry.get_key("brave_search", "work") is None
+
+    def test_preload(self, storage, monkeypatch):
+        seed = LocalCredentialRegistry(storage)
+        seed.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        seed.save_account("github", "personal", "ghp-1", run_health_check=False)
+        _save_flat(storage, "serpapi", "serp-1")
+
+        registry = LocalCredentialRegistry(storage, preload=True)
+        monkeypatch.setattr(storage, "load", lambda _: pytest.fail("decrypted after preload"))
+        assert registry.get_account("github", "personal").get_key("api_key") == "ghp-1"
+        assert registry.get_key("brave_search", "work") == "BSA-1"
+
+    def test_default_passes_cache_ttl(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        registry = LocalCredentialRegistry.default(preload=True, cache_ttl_seconds=600.0)
+        assert registry._cache_ttl == 600.0
+
+
+class TestValidate:
+    @pytest.fixture
+    def checks(self, monkeypatch):
+        from aden_tools.credentials import health_check
+
+        checks = []
+
+        def fake_check(credential_id, api_key, **kwargs):
+            checks.append(api_key)
+            time.sleep(0.05)
+            return health_check.HealthCheckResult(
+                valid=True, message="ok", details={"identity": {"username": "acme"}}
+            )
+
+        monkeypatch.setattr(health_check, "check_credential_health", fake_check)
+        return checks
+
+    def test_updates_status_and_identity(self, registry, checks):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        assert registry.validate_account("brave_search", "work").valid
+
+        info = registry.get_account_info("brave_search", "work")
+        assert info.identity.username == "acme"
+        assert info.last_validated is not None
+
+    def test_result_reused_within_ttl(self, registry, checks):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        first = registry.validate_account("brave_search", "work")
+        assert registry.validate_account("brave_search", "work") is first
+        assert checks == ["BSA-1"]
+
+    def test_concurrent_calls_coalesce(self, registry, checks):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(registry.validate_account, "brave_search", "work") for _ in range(4)
+            ]
+            results = [f.result() for f in futures]
+        assert all(r is results[0] for r in results)
+        assert checks == ["BSA-1"]
+
+    def test_save_resets_cached_result(self, registry, checks):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        registry.validate_account("brave_search", "work")
+        registry.save_account("brave_search", "work", "BSA-2", run_health_check=False)
+        registry.validate_account("brave_search", "work")
+        assert checks == ["BSA-1", "BSA-2"]
+
+    def test_unchanged_result_not_resaved(self, storage, checks, monkeypatch):
+        registry = LocalCredentialRegistry(storage, health_ttl_seconds=0)
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        saves = []
+        original_save = storage.save
+        monkeypatch.setattr(storage, "save", lambda c: saves.append(c.id) or original_save(c))
+
+        registry.validate_account("brave_search", "work")
+        registry.validate_account("brave_search", "work")
+        assert checks == ["BSA-1", "BSA-1"]
+        assert saves == ["brave_search/work"]
+
+        [info] = registry.list_accounts()
+        assert info.last_validated == registry.get_account("brave_search", "work").last_refreshed
+
+    def test_validate_all(self, registry, checks):
+        registry.save_account("brave_search", "work", "BSA-1", run_health_check=False)
+        registry.save_account("brave_search", "home", "BSA-2", run_health_check=False)
+        registry.save_account("github", "personal", "ghp-1", run_health_check=False)
+
+        results = registry.validate_all("brave_search")
+        assert sorted(results) == ["brave_search/home", "brave_search/work"]
+        assert all(r.valid for r in results.values())
+        assert sorted(checks) == ["BSA-1", "BSA-2"]
+
+    def test_missing_account_raises(self, registry):
+        with pytest.raises(KeyError):
+            registry.validate_account("brave_search", "missing")
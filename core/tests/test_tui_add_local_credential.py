@@ -0,0 +1,79 @@
+"""Tests for the AddLocalCredentialScreen modal."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from textual.app import App
+from textual.widgets import Input, OptionList
+
+from framework.credentials.local.registry import LocalCredentialRegistry
+from framework.tui.screens import add_local_credential
+from framework.tui.screens.add_local_credential import AddLocalCredentialScreen
+
+
+def test_specs_filtered_once_across_opens():
+    add_local_credential._direct_api_key_specs.cache_clear()
+    first = AddLocalCredentialScreen()._specs
+    second = AddLocalCredentialScreen()._specs
+
+    assert first == second
+    assert add_local_credential._direct_api_key_specs.cache_info().misses == 1
+    from aden_tools.credentials import CREDENTIAL_SPECS
+
+    assert all(CREDENTIAL_SPECS[cid].direct_api_key_supported for cid, _, _ in first)
+
+
+@pytest.mark.asyncio
+async def test_type_list_built_from_cached_prompts():
+    screen = AddLocalCredentialScreen()
+    async with App().run_test() as pilot:
+        await pilot.app.push_screen(screen)
+        type_list = screen.query_one("#alc-type-list", OptionList)
+
+        assert type_list.option_count == len(screen._specs)
+        cid = screen._specs[0][0]
+        assert type_list.get_option_at_index(0).id == f"type-{cid}"
+
+
+@pytest.mark.asyncio
+async def test_save_runs_health_check_off_ui_thread(monkeypatch):
+    save_threads = []
+
+    def fake_save_account(**kwargs):
+        save_threads.append(threading.get_ident())
+        return MagicMock(), MagicMock(valid=False, message="bad key")
+
+    registry = MagicMock(save_account=fake_save_account)
+    monkeypatch.setattr(LocalCredentialRegistry, "default", classmethod(lambda cls: registry))
+
+    screen = AddLocalCredentialScreen()
+    async with App().run_test() as pilot:
+        await pilot.app.push_screen(screen)
+        screen._selected_id = screen._specs[0][0]
+        screen.query_one("#alc-key", Input).value = "sk-test"
+        await screen._do_save().wait()
+        assert "failed health check" in str(screen._status.render())
+
+    assert save_threads and save_threads[0] != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_selecting_type_opens_form_for_that_spec():
+    screen = AddLocalCredentialScreen()
+    cid, description, _ = screen._specs[-1]
+    async with App().run_test() as pilot:
+        await pilot.app.push_screen(screen)
+        type_list = screen.query_one("#alc-type-list", OptionList)
+        type_list.highlighted = len(screen._specs) - 1
+        type_list.action_select()
+        await pilot.pause()
+
+        assert screen._phase == 2
+        assert screen._selected_id == cid
+        assert screen._selected_description == (description or cid)
+        assert screen._form.display and not screen._type_list.display
+        assert cid in str(screen._subtitle.render())
+
+        screen._show_phase(1)
+        assert screen._type_list.display and not screen._form.display
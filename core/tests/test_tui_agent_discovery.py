@@ -0,0 +1,35 @@
+"""Tests for AdenTUI's cached agent discovery."""
+
+import pytest
+
+from framework.tui.app import AdenTUI
+from framework.tui.screens import agent_picker
+
+
+@pytest.fixture
+def walks(monkeypatch):
+    walks = []
+
+    def fake_discover():
+        walks.append(1)
+        return {"Your Agents": []}
+
+    monkeypatch.setattr(agent_picker, "discover_agents", fake_discover)
+    return walks
+
+
+@pytest.mark.asyncio
+async def test_repeat_lookup_reuses_walk(walks):
+    app = AdenTUI()
+    first = await app._get_agents()
+    assert await app._get_agents() is first
+    assert len(walks) == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_cache_walks_again(walks, monkeypatch):
+    app = AdenTUI()
+    await app._get_agents()
+    monkeypatch.setattr(AdenTUI, "_AGENTS_CACHE_TTL", 0.0)
+    await app._get_agents()
+    assert len(walks) == 2
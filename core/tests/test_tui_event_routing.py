@@ -0,0 +1,169 @@
+"""Tests for AdenTUI runtime event routing to its widgets."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from framework.runtime.event_bus import AgentEvent, EventType
+from framework.tui.app import AdenTUI
+
+
+@pytest.fixture
+def app():
+    app = AdenTUI()
+    app.runtime = MagicMock()
+    app.runtime.active_graph_id = "main"
+    app.chat_repl = MagicMock()
+    app.graph_view = MagicMock()
+    app.status_bar = MagicMock()
+    app.is_ready = True
+    return app
+
+
+def _event(event_type: EventType, graph_id: str | None = "main", **data) -> AgentEvent:
+    return AgentEvent(type=event_type, stream_id="s", node_id="n1", data=data, graph_id=graph_id)
+
+
+def _route(app: AdenTUI, event: AgentEvent) -> None:
+    """Route an event and apply the batched graph view / status bar updates."""
+    app._route_event(event)
+    app._drain_widget_ops()
+
+
+def test_tool_started_reaches_every_widget(app):
+    _route(app, _event(EventType.TOOL_CALL_STARTED, tool_name="search", tool_input={}))
+
+    app.chat_repl.handle_tool_started.assert_called_once_with("search", {})
+    app.graph_view.handle_tool_call.assert_called_once_with("n1", "search", started=True)
+    app.status_bar.set_node_detail.assert_called_once_with("search...")
+    app.chat_repl.write_log_event.assert_called_once()
+
+
+def test_text_delta_skips_log_pane(app):
+    _route(app, _event(EventType.LLM_TEXT_DELTA, content="hi", snapshot="hi"))
+
+    app.chat_repl.handle_text_delta.assert_called_once_with("hi", "hi")
+    app.chat_repl.write_log_event.assert_not_called()
+
+
+def test_background_graph_event_dropped(app):
+    _route(app, _event(EventType.TOOL_CALL_STARTED, graph_id="other", tool_name="x"))
+
+    app.chat_repl.handle_tool_started.assert_not_called()
+    app.status_bar.set_node_detail.assert_not_called()
+
+
+def test_missing_graph_view_is_skipped(app):
+    app.graph_view = None
+    _route(app, _event(EventType.NODE_LOOP_ITERATION, iteration=3))
+
+    app.chat_repl.handle_loop_iteration.assert_called_once_with(3)
+    app.status_bar.set_node_detail.assert_called_once_with("step 3")
+
+
+def test_background_failure_notifies(app):
+    app.notify = MagicMock()
+    _route(app, _event(EventType.EXECUTION_FAILED, graph_id="other", error="boom"))
+
+    assert "failed: boom" in app.notify.call_args.args[0]
+    app.chat_repl.handle_execution_failed.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cross_thread_deltas_coalesce(app):
+    app._loop = asyncio.get_running_loop()
+    app._thread_id = -1  # pretend events come from the agent thread
+
+    app._handle_event(_event(EventType.LLM_TEXT_DELTA, content="a", snapshot="a"))
+    app._handle_event(_event(EventType.LLM_TEXT_DELTA, content="b", snapshot="ab"))
+    app.chat_repl.handle_text_delta.assert_not_called()
+
+    await asyncio.sleep(0)
+    app.chat_repl.handle_text_delta.assert_called_once_with("ab", "ab")
+
+    app._handle_event(_event(EventType.LLM_TEXT_DELTA, content="c", snapshot="abc"))
+    await asyncio.sleep(0)
+    app.chat_repl.handle_text_delta.assert_called_with("c", "abc")
+
+
+@pytest.mark.asyncio
+async def test_background_noise_dropped_before_hop(app):
+    app._thread_id = -1
+    app._call_from_thread = MagicMock()
+
+    app._handle_event(_event(EventType.TOOL_CALL_STARTED, graph_id="other"))
+    app._call_from_thread.assert_not_called()
+
+    app._handle_event(_event(EventType.EXECUTION_FAILED, graph_id="other"))
+    app._call_from_thread.assert_called_once()
+
+
+def test_failing_handler_does_not_block_others(app):
+    app.chat_repl.handle_tool_started.side_effect = RuntimeError("boom")
+    _route(app, _event(EventType.TOOL_CALL_STARTED, tool_name="search", tool_input={}))
+
+    app.graph_view.handle_tool_call.assert_called_once()
+    app.status_bar.set_node_detail.assert_called_once_with("search...")
+
+
+def test_node_name_looked_up_once(app):
+    app.runtime.graph.get_node.return_value.name = "Researcher"
+    for _ in range(3):
+        _route(app, _event(EventType.NODE_LOOP_STARTED))
+
+    app.runtime.graph.get_node.assert_called_once_with("n1")
+    app.status_bar.set_active_node.assert_called_with("Researcher", "thinking...")
+
+
+def test_widget_updates_batched_until_drain(app):
+    for i in range(3):
+        app._route_event(_event(EventType.NODE_LOOP_ITERATION, iteration=i))
+    app.status_bar.set_node_detail.assert_not_called()
+    app.chat_repl.handle_loop_iteration.assert_called_with(2)
+
+    app._drain_widget_ops()
+    assert app.status_bar.set_node_detail.call_count == 3
+    assert app.graph_view.handle_node_loop_iteration.call_count == 3
+
+
+def test_pause_cancels_active_graph_task_first(app):
+    task = MagicMock()
+    task.done.return_value = False
+    active = MagicMock()
+    active.streams = {"s": MagicMock(_execution_tasks={"exec-1": task})}
+    app.runtime.get_graph_registration.return_value = active
+    app.runtime.list_graphs.return_value = ["main", "other"]
+    app.chat_repl._current_exec_id = "exec-1"
+    app.notify = MagicMock()
+
+    app.action_pause_execution()
+
+    task.cancel.assert_called_once()
+    app.runtime.get_graph_registration.assert_called_once_with("main")
+
+
+def test_blank_internal_output_ignored(app):
+    _route(app, _event(EventType.NODE_INTERNAL_OUTPUT, content=" \n\t"))
+    app.chat_repl.handle_internal_output.assert_not_called()
+
+    _route(app, _event(EventType.NODE_INTERNAL_OUTPUT, content=" ok"))
+    app.chat_repl.handle_internal_output.assert_called_once_with("n1", " ok")
+
+
+def test_status_templates_fill_missing_fields(app):
+    _route(app, _event(EventType.NODE_RETRY, retry_count=2, max_retries=5))
+    app.status_bar.set_node_detail.assert_called_with("retry 2/5")
+
+    _route(app, _event(EventType.NODE_RETRY, retry_count=2))
+    app.status_bar.set_node_detail.assert_called_with("retry 2/?")
+
+    _route(app, _event(EventType.TOOL_CALL_STARTED))
+    app.status_bar.set_node_detail.assert_called_with("...")
+
+
+def test_unrouted_event_type_ignored(app):
+    _route(app, _event(EventType.CUSTOM, foo="bar"))
+
+    app.chat_repl.write_log_event.assert_not_called()
+    app.status_bar.set_node_detail.assert_not_called()
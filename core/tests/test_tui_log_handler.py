@@ -0,0 +1,53 @@
+"""Tests for the push-based TUI log handler."""
+
+import asyncio
+import logging
+import threading
+
+import pytest
+
+from framework.tui.app import TuiLogHandler
+
+
+class _FakeApp:
+    """Just the attributes TuiLogHandler reads from AdenTUI."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self.batches: list[tuple[list[str], int]] = []
+
+    def _deliver_logs(self, records: list[logging.LogRecord]) -> None:
+        self.batches.append(([r.getMessage() for r in records], threading.get_ident()))
+
+
+def _record(msg: str) -> logging.LogRecord:
+    return logging.LogRecord("agent", logging.INFO, __file__, 0, msg, None, None)
+
+
+@pytest.mark.asyncio
+async def test_burst_delivered_as_one_batch():
+    app = _FakeApp(asyncio.get_running_loop())
+    handler = TuiLogHandler(app)
+    for i in range(3):
+        handler.emit(_record(f"line {i}"))
+    assert app.batches == []
+
+    await asyncio.sleep(0)
+    assert app.batches == [(["line 0", "line 1", "line 2"], threading.get_ident())]
+
+
+@pytest.mark.asyncio
+async def test_worker_thread_delivers_on_app_loop():
+    app = _FakeApp(asyncio.get_running_loop())
+    handler = TuiLogHandler(app)
+
+    worker = threading.Thread(target=handler.emit, args=(_record("from worker"),))
+    worker.start()
+    worker.join()
+    assert app.batches == []
+
+    await asyncio.sleep(0)
+    assert app.batches == [(["from worker"], threading.get_ident())]
+    handler.emit(_record("next"))
+    await asyncio.sleep(0)
+    assert app.batches[-1][0] == ["next"]
@@ -0,0 +1,65 @@
+"""Tests for the TUI StatusBar (coalesced refreshes and clock timer)."""
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets import Label
+
+from framework.tui.app import StatusBar
+
+
+class StatusBarApp(App):
+    """Minimal app that mounts a StatusBar for testing."""
+
+    def compose(self) -> ComposeResult:
+        yield StatusBar(graph_id="demo")
+
+
+def _content(app: App) -> str:
+    return str(app.query_one("#status-content", Label).content)
+
+
+@pytest.mark.asyncio
+async def test_setter_burst_renders_once():
+    app = StatusBarApp()
+    async with app.run_test() as pilot:
+        bar = app.query_one(StatusBar)
+        label = app.query_one("#status-content", Label)
+        updates = []
+        original_update = label.update
+        label.update = lambda content="": updates.append(content) or original_update(content)
+
+        bar.set_running("intake")
+        for step in range(10):
+            bar.set_node_detail(f"step {step}")
+        await pilot.pause(0.1)
+
+        assert len(updates) == 1
+        assert "step 9" in _content(app)
+
+
+@pytest.mark.asyncio
+async def test_clock_timer_runs_only_while_running():
+    app = StatusBarApp()
+    async with app.run_test() as pilot:
+        bar = app.query_one(StatusBar)
+        assert not bar._clock_timer._active.is_set()
+
+        bar.set_running("intake")
+        assert bar._clock_timer._active.is_set()
+
+        bar.set_completed()
+        await pilot.pause(0.1)
+        assert not bar._clock_timer._active.is_set()
+        assert "done" in _content(app)
+
+
+@pytest.mark.asyncio
+async def test_repeated_detail_schedules_nothing():
+    app = StatusBarApp()
+    async with app.run_test() as pilot:
+        bar = app.query_one(StatusBar)
+        bar.set_node_detail("search...")
+        await pilot.pause(0.1)
+
+        bar.set_node_detail("search...")
+        assert not bar._refresh_pending
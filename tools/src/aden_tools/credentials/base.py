@@ -18,9 +18,12 @@
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CredentialSpec:
-    """Specification for a single credential."""
+    """Specification for a single credential.
+
+    Specs are static declarations, so instances are immutable and slotted.
+    """
 
     env_var: str
     """Environment variable name (e.g., 'BRAVE_SEARCH_API_KEY')"""
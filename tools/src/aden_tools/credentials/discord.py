@@ -14,6 +14,7 @@
             "discord_list_channels",
             "discord_send_message",
             "discord_get_messages",
+            "discord_bulk_get_messages",
         ],
         required=True,
         startup_required=False,
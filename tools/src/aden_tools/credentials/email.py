@@ -9,7 +9,7 @@
 EMAIL_CREDENTIALS = {
     "resend": CredentialSpec(
         env_var="RESEND_API_KEY",
-        tools=["send_email"],
+        tools=["send_email", "send_email_batch"],
         node_types=[],
         required=False,
         startup_required=False,
@@ -17,9 +17,11 @@
             "google_docs_insert_image",
             "google_docs_format_text",
             "google_docs_batch_update",
+            "google_docs_compose",
             "google_docs_create_list",
             "google_docs_add_comment",
             "google_docs_list_comments",
+            "google_docs_list_all_comments",
             "google_docs_export_content",
         ],
         required=True,
@@ -0,0 +1,62 @@
+"""
+Shared HTTP client for async tools.
+
+Tools that talk to remote APIs from async handlers use one pooled
+``httpx.AsyncClient`` so keep-alive connections and TLS sessions are reused
+across tools and calls instead of per module. ``dumps_json`` and
+``decode_json`` encode request bodies and decode responses with orjson when
+it is installed, falling back to the standard library.
+
+Usage:
+    from aden_tools.http import decode_json, dumps_json, get_shared_client
+
+    response = await get_shared_client().post(url, headers=headers, content=dumps_json(body))
+    data = decode_json(response)
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import httpx
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON for large payloads
+    orjson = None
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the process-wide async client, creating it on first use (or after close)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=30),
+        )
+    return _client
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def decode_json(response: httpx.Response) -> Any:
+    """Decode a response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+async def aclose_shared_client() -> None:
+    """Close the shared client's pooled connections; the next call builds a new one."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -9,22 +9,61 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
+import random
 import time
 from typing import TYPE_CHECKING, Any
 
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http import decode_json, dumps_json, get_shared_client
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
 DISCORD_API_BASE = "https://discord.com/api/v10"
+# Endpoint URLs: the base is joined once here rather than on every call
+_GUILDS_URL = f"{DISCORD_API_BASE}/users/@me/guilds"
+_guild_channels_url = f"{DISCORD_API_BASE}/guilds/{{}}/channels".format
+_channel_messages_url = f"{DISCORD_API_BASE}/channels/{{}}/messages".format
 MAX_MESSAGE_LENGTH = 2000  # Discord API limit
-# Channel types: 0 = GUILD_TEXT, 5 = GUILD_ANNOUNCEMENT (both support messages)
-TEXT_CHANNEL_TYPES = (0, 5)
-MAX_RETRIES = 2  # 3 total attempts on 429
+# Text-like channel types: 0 = GUILD_TEXT, 5 = GUILD_ANNOUNCEMENT,
+# 10/11/12 = announcement/public/private threads, 15 = GUILD_FORUM
+TEXT_CHANNEL_TYPES = frozenset((0, 5, 10, 11, 12, 15))
+MAX_RETRIES = 2  # 3 total attempts on 429 or transient 5xx
+RETRY_BASE_WAIT = 1.0  # first backoff step, also the jitter range
 MAX_RETRY_WAIT = 60  # cap wait at 60s
+RETRYABLE_STATUSES = frozenset((429, 500, 502, 503, 504))
+# A 500/502 on a POST may have been applied, so only retry statuses that were not
+WRITE_RETRYABLE_STATUSES = frozenset((429, 503, 504))
+MESSAGES_PAGE_SIZE = 100  # Discord API limit per messages request
+MAX_BULK_MESSAGES = 1000  # cap for multi-page history reads
+MAX_BULK_CHANNELS = 25  # cap for concurrent multi-channel reads
+MAX_CONCURRENT_READS = 8  # channels read at once; keeps well under the 50 req/s global limit
+TOPOLOGY_CACHE_TTL = 60.0  # seconds guild and channel lists are reused
+
+# Guild and channel lists change on human timescales:
+# (kind, token hash, *scope) -> (result, expiry deadline)
+_TOPOLOGY_CACHE: dict[tuple[str, ...], tuple[Any, float]] = {}
+
+
+def _message_length(content: str) -> int:
+    """Length as Discord counts it: UTF-16 code units, so most emoji count twice."""
+    if len(content) <= MAX_MESSAGE_LENGTH // 2:
+        return len(content)  # Fits even if every character is a surrogate pair
+    return len(content.encode("utf-16-le", "surrogatepass")) // 2
+
+
+def _retry_wait(body: Any, attempt: int) -> float:
+    """Seconds before retrying: a 429's retry_after if usable, else jittered backoff."""
+    try:
+        return min(float(body["retry_after"]), MAX_RETRY_WAIT)
+    except Exception:
+        backoff = min(RETRY_BASE_WAIT * 2**attempt, MAX_RETRY_WAIT)
+        return backoff + random.uniform(0, RETRY_BASE_WAIT)
 
 
 class _DiscordClient:
@@ -32,78 +71,113 @@ class _DiscordClient:
 
     def __init__(self, bot_token: str):
         self._token = bot_token
-
-    @property
-    def _headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bot {self._token}",
+        self._token_hash = hashlib.sha256(bot_token.encode()).hexdigest()
+        # The token is fixed for the client's lifetime, so build the headers once
+        self._headers = {
+            "Authorization": f"Bot {bot_token}",
             "Content-Type": "application/json",
         }
 
-    def _request_with_retry(
+    async def _request_with_retry(
         self,
         method: str,
         url: str,
         **kwargs: Any,
     ) -> dict[str, Any]:
-        """Make HTTP request with retry on 429 rate limit."""
-        request_kwargs = {"headers": self._headers, "timeout": 30.0, **kwargs}
+        """Make HTTP request with retry on 429 rate limit and transient 5xx errors."""
+        if "json" in kwargs:
+            # Serialized once, not once per attempt; Content-Type is in the headers
+            kwargs["content"] = dumps_json(kwargs.pop("json"))
+        client = get_shared_client()
+        request_kwargs = {"headers": self._headers, **kwargs}
+        statuses = RETRYABLE_STATUSES if method == "GET" else WRITE_RETRYABLE_STATUSES
         for attempt in range(MAX_RETRIES + 1):
-            response = httpx.request(method, url, **request_kwargs)
-            if response.status_code == 429 and attempt < MAX_RETRIES:
+            response = await client.request(method, url, **request_kwargs)
+            status = response.status_code
+            if status not in statuses:
+                return self._handle_response(response)
+            body = None
+            if status == 429:
+                # Parsed once: feeds both the wait and, after the last attempt, the error
                 try:
-                    data = response.json()
-                    wait = min(float(data.get("retry_after", 1)), MAX_RETRY_WAIT)
+                    body = decode_json(response)
                 except Exception:
-                    wait = min(2**attempt, MAX_RETRY_WAIT)
-                time.sleep(wait)
-                continue
-            return self._handle_response(response)
+                    pass
+            if attempt < MAX_RETRIES:
+                await asyncio.sleep(_retry_wait(body, attempt))
+        if status == 429:
+            return self._handle_429(body)
         return self._handle_response(response)
 
     def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
         """Handle Discord API response format."""
-        if response.status_code == 204:
+        status = response.status_code
+        # Success first: it is nearly every call
+        if status == 200:
+            return decode_json(response)
+        if status == 204:
             return {"success": True}
 
-        if response.status_code == 429:
-            try:
-                data = response.json()
-                retry_after = data.get("retry_after", 60)
-                message = data.get("message", "Rate limit exceeded")
-            except Exception:
-                retry_after = 60
-                message = "Rate limit exceeded"
-            return {
-                "error": f"Discord rate limit exceeded. Retry after {retry_after}s",
-                "retry_after": retry_after,
-                "message": message,
-            }
-
-        if response.status_code != 200:
-            try:
-                data = response.json()
-                message = data.get("message", response.text)
-            except Exception:
-                message = response.text
-            return {"error": f"HTTP {response.status_code}: {message}"}
+        try:
+            body = decode_json(response)
+        except Exception:
+            body = None
+        if status == 429:
+            return self._handle_429(body)
+        try:
+            message = body.get("message", response.text)
+        except AttributeError:
+            message = response.text
+        return {"error": f"HTTP {status}: {message}"}
+
+    @staticmethod
+    def _handle_429(body: Any) -> dict[str, Any]:
+        """Build the rate-limit error from an already-parsed 429 body (None if unparseable)."""
+        try:
+            retry_after = body.get("retry_after", 60)
+            message = body.get("message", "Rate limit exceeded")
+        except AttributeError:
+            retry_after = 60
+            message = "Rate limit exceeded"
+        return {
+            "error": f"Discord rate limit exceeded. Retry after {retry_after}s",
+            "retry_after": retry_after,
+            "message": message,
+        }
 
-        return response.json()
+    async def _cached_get(self, key: tuple[str, ...], url: str, refresh: bool) -> Any:
+        """GET ``url``, reusing a successful result for TOPOLOGY_CACHE_TTL seconds."""
+        key = (key[0], self._token_hash, *key[1:])
+        cached = _TOPOLOGY_CACHE.get(key)
+        if not refresh and cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+        result = await self._request_with_retry("GET", url)
+        if isinstance(result, dict) and "error" in result:
+            # Never serve a stale list once the API has started rejecting it
+            _TOPOLOGY_CACHE.pop(key, None)
+        else:
+            _TOPOLOGY_CACHE[key] = (result, time.monotonic() + TOPOLOGY_CACHE_TTL)
+        return result
 
-    def list_guilds(self) -> dict[str, Any]:
+    async def list_guilds(self, refresh: bool = False) -> dict[str, Any]:
         """List guilds (servers) the bot is a member of."""
-        return self._request_with_retry("GET", f"{DISCORD_API_BASE}/users/@me/guilds")
+        return await self._cached_get(("guilds",), _GUILDS_URL, refresh)
 
-    def list_channels(self, guild_id: str, text_only: bool = True) -> dict[str, Any]:
+    async def list_channels(
+        self, guild_id: str, text_only: bool = True, refresh: bool = False
+    ) -> dict[str, Any]:
         """List channels for a guild. Optionally filter to text channels only."""
-        result = self._request_with_retry("GET", f"{DISCORD_API_BASE}/guilds/{guild_id}/channels")
+        # Cache the unfiltered list so both text_only modes share one entry
+        result = await self._cached_get(
+            ("channels", guild_id), _guild_channels_url(guild_id), refresh
+        )
         if isinstance(result, dict) and "error" in result:
             return result
         if text_only:
             result = [c for c in result if c.get("type") in TEXT_CHANNEL_TYPES]
         return result
 
-    def send_message(
+    async def send_message(
         self,
         channel_id: str,
         content: str,
@@ -112,13 +186,13 @@ def send_message(
     ) -> dict[str, Any]:
         """Send a message to a channel."""
         body: dict[str, Any] = {"content": content, "tts": tts}
-        return self._request_with_retry(
+        return await self._request_with_retry(
             "POST",
-            f"{DISCORD_API_BASE}/channels/{channel_id}/messages",
+            _channel_messages_url(channel_id),
             json=body,
         )
 
-    def get_messages(
+    async def get_messages(
         self,
         channel_id: str,
         limit: int = 50,
@@ -126,17 +200,73 @@ def get_messages(
         after: str | None = None,
     ) -> dict[str, Any]:
         """Get recent messages from a channel."""
-        params: dict[str, Any] = {"limit": min(limit, 100)}
+        params: dict[str, Any] = {"limit": min(limit, MESSAGES_PAGE_SIZE)}
         if before:
             params["before"] = before
         if after:
             params["after"] = after
-        return self._request_with_retry(
+        return await self._request_with_retry(
             "GET",
-            f"{DISCORD_API_BASE}/channels/{channel_id}/messages",
+            _channel_messages_url(channel_id),
             params=params,
         )
 
+    async def get_messages_bulk(
+        self,
+        channel_id: str,
+        total: int,
+        before: str | None = None,
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        """Page backwards through a channel's history until ``total`` messages or its start.
+
+        Each page's oldest message ID is the next page's ``before`` cursor, so pages
+        within one channel are necessarily fetched in sequence.
+        """
+        messages: list[dict[str, Any]] = []
+        while len(messages) < total:
+            page_limit = min(total - len(messages), MESSAGES_PAGE_SIZE)
+            page = await self.get_messages(channel_id, limit=page_limit, before=before)
+            if isinstance(page, dict):
+                return page  # API error
+            messages.extend(page)
+            if len(page) < page_limit:
+                break  # Reached the start of the channel
+            before = page[-1]["id"]
+        return messages
+
+    async def get_messages_many(
+        self,
+        channel_ids: list[str],
+        limit: int = 50,
+    ) -> dict[str, Any]:
+        """Get recent messages from several channels concurrently.
+
+        Channels are independent, so up to MAX_CONCURRENT_READS of them are read
+        at once; limits above one page page back through each channel's history.
+        Returns a mapping of channel ID to its messages or error.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_READS)
+
+        async def read(channel_id: str) -> Any:
+            async with semaphore:
+                if limit > MESSAGES_PAGE_SIZE:
+                    return await self.get_messages_bulk(channel_id, min(limit, MAX_BULK_MESSAGES))
+                return await self.get_messages(channel_id, limit=limit)
+
+        results = await asyncio.gather(
+            *(read(channel_id) for channel_id in channel_ids), return_exceptions=True
+        )
+        by_channel: dict[str, Any] = {}
+        for channel_id, result in zip(channel_ids, results, strict=True):
+            if isinstance(result, httpx.TimeoutException):
+                result = {"error": "Request timed out"}
+            elif isinstance(result, httpx.RequestError):
+                result = {"error": f"Network error: {result}"}
+            elif isinstance(result, BaseException):
+                raise result
+            by_channel[channel_id] = result
+        return by_channel
+
 
 def register_tools(
     mcp: FastMCP,
@@ -170,12 +300,15 @@ def _get_client(account: str = "") -> _DiscordClient | dict[str, str]:
         return _DiscordClient(token)
 
     @mcp.tool()
-    def discord_list_guilds(account: str = "") -> dict:
+    async def discord_list_guilds(refresh: bool = False, account: str = "") -> dict:
         """
         List Discord guilds (servers) the bot is a member of.
 
         Returns guild IDs and names. Use guild IDs with discord_list_channels.
 
+        Args:
+            refresh: If True, bypass the 60-second guild list cache
+
         Returns:
             Dict with list of guilds or error
         """
@@ -183,7 +316,7 @@ def discord_list_guilds(account: str = "") -> dict:
         if isinstance(client, dict):
             return client
         try:
-            result = client.list_guilds()
+            result = await client.list_guilds(refresh=refresh)
             if "error" in result:
                 return result
             return {"guilds": result, "success": True}
@@ -193,15 +326,19 @@ def discord_list_guilds(account: str = "") -> dict:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def discord_list_channels(guild_id: str, text_only: bool = True, account: str = "") -> dict:
+    async def discord_list_channels(
+        guild_id: str, text_only: bool = True, refresh: bool = False, account: str = ""
+    ) -> dict:
         """
         List channels for a Discord guild (server).
 
         Args:
             guild_id: Guild (server) ID. Enable Developer Mode in Discord and
                        right-click the server to copy ID. Or use discord_list_guilds.
-            text_only: If True (default), return only text channels (type 0 and 5).
+            text_only: If True (default), return only text-like channels (text,
+                       announcement, thread and forum types).
                        Set False to include voice, category, and other channel types.
+            refresh: If True, bypass the 60-second channel list cache
 
         Returns:
             Dict with list of channels or error
@@ -210,7 +347,7 @@ def discord_list_channels(guild_id: str, text_only: bool = True, account: str =
         if isinstance(client, dict):
             return client
         try:
-            result = client.list_channels(guild_id, text_only=text_only)
+            result = await client.list_channels(guild_id, text_only=text_only, refresh=refresh)
             if "error" in result:
                 return result
             return {"channels": result, "success": True}
@@ -220,7 +357,7 @@ def discord_list_channels(guild_id: str, text_only: bool = True, account: str =
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def discord_send_message(
+    async def discord_send_message(
         channel_id: str,
         content: str,
         tts: bool = False,
@@ -237,17 +374,18 @@ def discord_send_message(
         Returns:
             Dict with message details or error
         """
-        if len(content) > MAX_MESSAGE_LENGTH:
+        length = _message_length(content)
+        if length > MAX_MESSAGE_LENGTH:
             return {
                 "error": f"Message exceeds {MAX_MESSAGE_LENGTH} character limit",
                 "max_length": MAX_MESSAGE_LENGTH,
-                "provided": len(content),
+                "provided": length,
             }
         client = _get_client(account)
         if isinstance(client, dict):
             return client
         try:
-            result = client.send_message(channel_id, content, tts=tts)
+            result = await client.send_message(channel_id, content, tts=tts)
             if "error" in result:
                 return result
             return {"success": True, "message": result}
@@ -257,7 +395,7 @@ def discord_send_message(
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def discord_get_messages(
+    async def discord_get_messages(
         channel_id: str,
         limit: int = 50,
         before: str | None = None,
@@ -269,7 +407,8 @@ def discord_get_messages(
 
         Args:
             channel_id: Channel ID
-            limit: Max messages to return (1-100, default 50)
+            limit: Max messages to return (default 50). Above 100 (up to 1000),
+                   older pages are fetched automatically; not combinable with after.
             before: Message ID to get messages before (for pagination)
             after: Message ID to get messages after (for pagination)
 
@@ -280,7 +419,14 @@ def discord_get_messages(
         if isinstance(client, dict):
             return client
         try:
-            result = client.get_messages(channel_id, limit=limit, before=before, after=after)
+            if limit > MESSAGES_PAGE_SIZE and not after:
+                result = await client.get_messages_bulk(
+                    channel_id, min(limit, MAX_BULK_MESSAGES), before=before
+                )
+            else:
+                result = await client.get_messages(
+                    channel_id, limit=limit, before=before, after=after
+                )
             if "error" in result:
                 return result
             return {"messages": result, "success": True}
@@ -288,3 +434,32 @@ def discord_get_messages(
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
+
+    @mcp.tool()
+    async def discord_bulk_get_messages(
+        channel_ids: list[str],
+        limit: int = 50,
+        account: str = "",
+    ) -> dict:
+        """
+        Get recent messages from several Discord channels at once.
+
+        Args:
+            channel_ids: Channel IDs to read (max 25)
+            limit: Max messages per channel (default 50, up to 1000; above 100,
+                   older pages are fetched automatically)
+
+        Returns:
+            Dict mapping each channel ID to its messages, or an error entry
+            for channels that could not be read
+        """
+        if len(channel_ids) > MAX_BULK_CHANNELS:
+            return {
+                "error": f"At most {MAX_BULK_CHANNELS} channels per call",
+                "provided": len(channel_ids),
+            }
+        client = _get_client(account)
+        if isinstance(client, dict):
+            return client
+        channels = await client.get_messages_many(list(dict.fromkeys(channel_ids)), limit=limit)
+        return {"channels": channels, "success": True}
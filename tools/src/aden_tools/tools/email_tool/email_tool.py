@@ -8,8 +8,10 @@
 
 from __future__ import annotations
 
+import functools
 import os
-from typing import TYPE_CHECKING, Literal
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Literal
 
 import httpx
 import resend
@@ -18,6 +20,39 @@
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
+MAX_BATCH_EMAILS = 100  # Resend batch API limit per request
+MAX_SUBJECT_LENGTH = 998  # RFC 2822 line limit
+
+
+class _PooledResendClient(resend.HTTPClient):
+    """Resend transport over one keep-alive httpx.Client.
+
+    The SDK's default client calls ``requests.request`` per send, opening a new
+    TLS connection every time; this one reuses pooled connections across sends.
+    """
+
+    def __init__(self, timeout: float = 30.0):
+        self._client = httpx.Client(timeout=timeout)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        json: dict[str, Any] | list[Any] | None = None,
+    ) -> tuple[bytes, int, Mapping[str, str]]:
+        # Transport errors propagate; the SDK wraps them in a ResendError
+        response = self._client.request(method, url, headers=headers, json=json)
+        return response.content, response.status_code, response.headers
+
+
+@functools.cache
+def _resend_http_client() -> _PooledResendClient:
+    """Return the process-wide Resend transport, installing it as the SDK default once."""
+    client = _PooledResendClient()
+    resend.default_http_client = client
+    return client
+
 
 def register_tools(
     mcp: FastMCP,
@@ -25,6 +60,27 @@ def register_tools(
 ) -> None:
     """Register email tools with the MCP server."""
 
+    def _resend_payload(
+        to: list[str],
+        subject: str,
+        html: str,
+        from_email: str,
+        cc: list[str] | None = None,
+        bcc: list[str] | None = None,
+    ) -> dict:
+        """Build a Resend send payload, omitting empty cc/bcc."""
+        payload: dict = {
+            "from": from_email,
+            "to": to,
+            "subject": subject,
+            "html": html,
+        }
+        if cc:
+            payload["cc"] = cc
+        if bcc:
+            payload["bcc"] = bcc
+        return payload
+
     def _send_via_resend(
         api_key: str,
         to: list[str],
@@ -36,17 +92,9 @@ def _send_via_resend(
     ) -> dict:
         """Send email using Resend API."""
         resend.api_key = api_key
+        _resend_http_client()
         try:
-            payload: dict = {
-                "from": from_email,
-                "to": to,
-                "subject": subject,
-                "html": html,
-            }
-            if cc:
-                payload["cc"] = cc
-            if bcc:
-                payload["bcc"] = bcc
+            payload = _resend_payload(to, subject, html, from_email, cc, bcc)
             email = resend.Emails.send(payload)
             return {
                 "success": True,
@@ -147,24 +195,19 @@ def _normalize_recipients(
         filtered = [v for v in value if isinstance(v, str) and v.strip()]
         return filtered if filtered else None
 
-    def _send_email_impl(
+    def _prepare_message(
         to: str | list[str],
         subject: str,
         html: str,
-        provider: Literal["resend", "gmail"],
-        from_email: str | None = None,
         cc: str | list[str] | None = None,
         bcc: str | list[str] | None = None,
-        account: str = "",
     ) -> dict:
-        """Core email sending logic, callable by other tools."""
-        from_email = _resolve_from_email(from_email)
-
+        """Validate one message and normalize its recipients, or return an error dict."""
         to_list = _normalize_recipients(to)
         if not to_list:
             return {"error": "At least one recipient email is required"}
-        if not subject or len(subject) > 998:
-            return {"error": "Subject must be 1-998 characters"}
+        if not subject or len(subject) > MAX_SUBJECT_LENGTH:
+            return {"error": f"Subject must be 1-{MAX_SUBJECT_LENGTH} characters"}
         if not html:
             return {"error": "Email body (html) is required"}
 
@@ -180,6 +223,28 @@ def _send_email_impl(
             cc_list = None
             bcc_list = None
             subject = f"[TEST -> {', '.join(original_to)}] {subject}"
+        return {"to": to_list, "subject": subject, "cc": cc_list, "bcc": bcc_list}
+
+    def _send_email_impl(
+        to: str | list[str],
+        subject: str,
+        html: str,
+        provider: Literal["resend", "gmail"],
+        from_email: str | None = None,
+        cc: str | list[str] | None = None,
+        bcc: str | list[str] | None = None,
+        account: str = "",
+    ) -> dict:
+        """Core email sending logic, callable by other tools."""
+        from_email = _resolve_from_email(from_email)
+
+        message = _prepare_message(to, subject, html, cc, bcc)
+        if "error" in message:
+            return message
+        to_list = message["to"]
+        subject = message["subject"]
+        cc_list = message["cc"]
+        bcc_list = message["bcc"]
 
         # Resend always requires from_email; Gmail defaults to authenticated user.
         if provider == "resend" and not from_email:
@@ -248,6 +313,90 @@ def send_email(
         """
         return _send_email_impl(to, subject, html, provider, from_email, cc, bcc, account)
 
+    @mcp.tool()
+    def send_email_batch(
+        emails: list[dict],
+        from_email: str | None = None,
+    ) -> dict:
+        """
+        Send several emails with one Resend API request.
+
+        Use this instead of repeated send_email calls when sending many separate
+        messages (e.g. one notification per recipient). All-or-nothing: if any
+        message is invalid, nothing is sent.
+
+        Args:
+            emails: Up to 100 messages, each a dict with "to", "subject" and "html",
+                    and optionally "cc", "bcc" and "from_email" (same formats as
+                    send_email).
+            from_email: Default sender for messages without their own from_email.
+                        Falls back to EMAIL_FROM env var if not provided.
+
+        Returns:
+            Dict with the message IDs in input order, or error dict with "error"
+            and optional "help" keys.
+        """
+        if not emails:
+            return {"error": "At least one email is required"}
+        if len(emails) > MAX_BATCH_EMAILS:
+            return {
+                "error": f"At most {MAX_BATCH_EMAILS} emails per batch",
+                "provided": len(emails),
+            }
+        api_key = _get_credential("resend")
+        if not api_key:
+            return {
+                "error": "Resend credentials not configured",
+                "help": "Set RESEND_API_KEY environment variable. "
+                "Get a key at https://resend.com/api-keys",
+            }
+        default_from = _resolve_from_email(from_email)
+
+        payloads = []
+        for i, email in enumerate(emails):
+            if not isinstance(email, dict):
+                return {"error": f"Email {i}: expected a dict with to, subject and html"}
+            sender = email.get("from_email") or default_from
+            if not sender:
+                return {
+                    "error": f"Email {i}: Sender email is required",
+                    "help": "Pass from_email or set EMAIL_FROM environment variable",
+                }
+            message = _prepare_message(
+                email.get("to"),
+                email.get("subject", ""),
+                email.get("html", ""),
+                email.get("cc"),
+                email.get("bcc"),
+            )
+            if "error" in message:
+                return {"error": f"Email {i}: {message['error']}"}
+            payloads.append(
+                _resend_payload(
+                    message["to"],
+                    message["subject"],
+                    email["html"],
+                    sender,
+                    message["cc"],
+                    message["bcc"],
+                )
+            )
+
+        resend.api_key = api_key
+        _resend_http_client()
+        try:
+            response = resend.Batch.send(payloads)
+        except resend.exceptions.ResendError as e:
+            return {"error": f"Resend API error: {e}"}
+        except Exception as e:
+            return {"error": f"Email send failed: {e}"}
+        return {
+            "success": True,
+            "provider": "resend",
+            "ids": [sent.get("id", "") for sent in response.get("data", [])],
+            "count": len(payloads),
+        }
+
     def _fetch_original_message(access_token: str, message_id: str) -> dict:
         """Fetch the original message to extract threading info."""
         response = httpx.get(
@@ -14,17 +14,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import functools
 import json
 import os
-import re
+import random
+import string
 import time
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+from itertools import combinations
+from typing import TYPE_CHECKING, Any, NamedTuple
 from urllib.parse import urlparse
 
 import httpx
 from fastmcp import FastMCP
 
+from aden_tools.http import decode_json, dumps_json, get_shared_client
+
+from ..file_system_toolkits.security import get_secure_path
+
 if TYPE_CHECKING:
     from aden_tools.credentials import CredentialStoreAdapter
 
@@ -32,18 +41,68 @@
 GOOGLE_DRIVE_API_BASE = "https://www.googleapis.com/drive/v3"
 GOOGLE_OAUTH_TOKEN_URL = "https://oauth2.googleapis.com/token"
 
-# Allowed URL schemes for image insertion
-ALLOWED_IMAGE_SCHEMES = {"https", "http"}
-# Regex pattern for valid URLs
-URL_PATTERN = re.compile(
-    r"^https?://"  # http:// or https://
-    r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain
-    r"localhost|"  # localhost
-    r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # or ip
-    r"(?::\d+)?"  # optional port
-    r"(?:/?|[/?]\S+)$",
-    re.IGNORECASE,
+MAX_RETRIES = 4  # 5 total attempts on transient errors
+RETRY_BASE_WAIT = 0.5  # first backoff step, also the jitter range
+MAX_RETRY_WAIT = 30.0  # cap wait at 30s
+# Transient statuses Google asks clients to retry. Writes skip 500/502, which
+# do not guarantee the request was not applied.
+RETRYABLE_STATUSES = frozenset((429, 500, 502, 503, 504))
+WRITE_RETRYABLE_STATUSES = frozenset((429, 503, 504))
+DEFAULT_REQUESTS_PER_SECOND = 8.0  # stays under Google's per-user quota
+# Comment fields agents use; "*" would also return HTML content, photos and more
+COMMENT_FIELDS = (
+    "id,content,author/displayName,createdTime,modifiedTime,resolved,"
+    "quotedFileContent/value,replies(id,content,author/displayName,createdTime)"
 )
+COMMENTS_PAGE_SIZE = 100  # Drive API limit per comments request
+MAX_BULK_COMMENTS = 1000  # cap for google_docs_list_all_comments
+EXPORT_CHUNK_SIZE = 64 * 1024  # bytes written per chunk when exporting to a file
+INLINE_ENCODE_THRESHOLD = 256 * 1024  # larger inline exports are base64-encoded off the loop
+TOKEN_REFRESH_MARGIN = 60  # refresh cached tokens this many seconds before expiry
+
+# Errors with a fixed message; other 4xx/5xx statuses report the API's own message
+_STATUS_ERRORS: dict[int, str] = {
+    401: "Invalid or expired Google access token",
+    403: (
+        "Insufficient permissions. Check your Google API scopes. "
+        "Required scopes: https://www.googleapis.com/auth/documents"
+    ),
+    404: "Document not found",
+    429: "Google API rate limit exceeded. Try again later.",
+}
+
+SERVICE_ACCOUNT_SCOPES = (
+    "https://www.googleapis.com/auth/documents",
+    "https://www.googleapis.com/auth/drive.file",
+    "https://www.googleapis.com/auth/drive",
+)
+
+# Exchanged service-account tokens: service account JSON -> (token, refresh deadline)
+_TOKEN_CACHE: dict[str, tuple[str, float]] = {}
+# google-auth credentials (which cache their own token): service account JSON -> creds
+_GOOGLE_AUTH_CREDENTIALS: dict[str, Any] = {}
+
+DEFAULT_BULLET_PRESET = "BULLET_DISC_CIRCLE_SQUARE"
+# google_docs_create_list list_type -> Docs API bullet preset
+BULLET_PRESETS = {
+    "bullet": DEFAULT_BULLET_PRESET,
+    "numbered": "NUMBERED_DECIMAL_ALPHA_ROMAN",
+}
+# google_docs_export_content format -> Drive export MIME type
+EXPORT_MIME_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "txt": "text/plain",
+    "html": "text/html",
+    "odt": "application/vnd.oasis.opendocument.text",
+    "rtf": "application/rtf",
+    "epub": "application/epub+zip",
+}
+
+# Allowed URL schemes for image insertion
+ALLOWED_IMAGE_SCHEMES = frozenset(("https", "http"))
+# Characters allowed in an image URI host (urlparse lowercases the hostname)
+_HOST_CHARS = frozenset(string.ascii_lowercase + string.digits + ".-:")
 
 
 def _validate_image_uri(uri: str) -> dict[str, str] | None:
@@ -70,39 +129,275 @@ def _validate_image_uri(uri: str) -> dict[str, str] | None:
             f"Only {', '.join(ALLOWED_IMAGE_SCHEMES)} are allowed."
         }
 
-    # Check for valid URL format
-    if not URL_PATTERN.match(uri):
-        return {"error": f"Invalid image URI format: '{uri}'"}
-
     # Check netloc (domain)
-    if not parsed.netloc:
+    hostname = parsed.hostname
+    if not hostname:
         return {"error": "Invalid image URI: missing domain"}
 
+    # Scheme and netloc already give the structure; only the characters need checking
+    if not _HOST_CHARS.issuperset(hostname) or any(ch.isspace() for ch in uri):
+        return {"error": f"Invalid image URI format: '{uri}'"}
+
     return None
 
 
-def _get_document_end_index(doc: dict[str, Any]) -> int:
-    """Extract the end index from a document for appending text.
+class _DocURLs(NamedTuple):
+    """Pre-parsed Docs and Drive endpoints for one document."""
 
-    Args:
-        doc: The document response from the API
+    document: httpx.URL
+    batch_update: httpx.URL
+    comments: httpx.URL
+    export: httpx.URL
 
-    Returns:
-        The index to insert at for appending to end of document
-    """
-    body = doc.get("body", {})
-    content = body.get("content", [])
-    if content:
-        last_element = content[-1]
-        end_index = last_element.get("endIndex", 1)
-        return end_index - 1  # Insert before the final newline
-    return 1
 
+@functools.lru_cache(maxsize=128)
+def _doc_urls(document_id: str) -> _DocURLs:
+    """Build a document's endpoint URLs once; agents usually edit one doc repeatedly."""
+    document = f"{GOOGLE_DOCS_API_BASE}/documents/{document_id}"
+    return _DocURLs(
+        document=httpx.URL(document),
+        batch_update=httpx.URL(f"{document}:batchUpdate"),
+        comments=httpx.URL(f"{GOOGLE_DRIVE_API_BASE}/files/{document_id}/comments"),
+        export=httpx.URL(f"{GOOGLE_DRIVE_API_BASE}/files/{document_id}/export"),
+    )
+
+
+class _TokenBucket:
+    """Client-side rate limiter: ``rate`` requests per second, bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping until it is due.
+
+        The token is reserved before sleeping (the balance may go negative), so
+        concurrent callers on the event loop queue up in order without a lock.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+def _requests_per_second() -> float:
+    """Request rate from GOOGLE_DOCS_RPS, falling back to the default if unset or invalid."""
+    try:
+        rate = float(os.getenv("GOOGLE_DOCS_RPS", DEFAULT_REQUESTS_PER_SECOND))
+    except ValueError:
+        return DEFAULT_REQUESTS_PER_SECOND
+    return rate if rate > 0 else DEFAULT_REQUESTS_PER_SECOND
+
+
+# Shared by every client so concurrent tool calls draw from one quota
+_rate = _requests_per_second()
+_DOCS_LIMITER = _TokenBucket(rate=_rate, capacity=2 * _rate)
+
+
+def _retry_wait(response: httpx.Response | None, attempt: int) -> float:
+    """Seconds to wait before retrying: Retry-After if sent, else jittered backoff."""
+    if response is not None:
+        try:
+            return min(float(response.headers["Retry-After"]), MAX_RETRY_WAIT)
+        except (KeyError, ValueError):
+            pass
+    backoff = min(RETRY_BASE_WAIT * 2**attempt, MAX_RETRY_WAIT)
+    return backoff + random.uniform(0, RETRY_BASE_WAIT)
+
+
+def _insert_text_request(
+    text: str, index: int | None = None, segment_id: str | None = None
+) -> dict[str, Any]:
+    """Build an insertText request at ``index``, or at the end of the segment if None."""
+    location: dict[str, Any] = {}
+    if segment_id:
+        location["segmentId"] = segment_id
+    if index is None:
+        # Appends without fetching the document to find its end index
+        return {"insertText": {"endOfSegmentLocation": location, "text": text}}
+    location["index"] = index
+    return {"insertText": {"location": location, "text": text}}
+
+
+def _replace_all_text_request(
+    find_text: str, replace_text: str, match_case: bool = True
+) -> dict[str, Any]:
+    """Build a replaceAllText request, or an error dict."""
+    if not find_text:
+        return {"error": "find_text cannot be empty"}
+    return {
+        "replaceAllText": {
+            "containsText": {
+                "text": find_text,
+                "matchCase": match_case,
+            },
+            "replaceText": replace_text,
+        }
+    }
+
+
+def _insert_image_request(
+    image_uri: str,
+    index: int,
+    width_pt: float | None = None,
+    height_pt: float | None = None,
+) -> dict[str, Any]:
+    """Build an insertInlineImage request, or an error dict for an invalid URI."""
+    # Validate image URI before making API call
+    validation_error = _validate_image_uri(image_uri)
+    if validation_error:
+        return validation_error
+
+    request: dict[str, Any] = {
+        "insertInlineImage": {
+            "location": {"index": index},
+            "uri": image_uri,
+        }
+    }
+    if width_pt is not None or height_pt is not None:
+        object_size: dict[str, Any] = {}
+        if width_pt is not None:
+            object_size["width"] = {"magnitude": width_pt, "unit": "PT"}
+        if height_pt is not None:
+            object_size["height"] = {"magnitude": height_pt, "unit": "PT"}
+        request["insertInlineImage"]["objectSize"] = object_size
+    return request
+
+
+def _rgb_color(
+    red: float | None, green: float | None, blue: float | None
+) -> dict[str, float] | None:
+    """Build an rgbColor from optional channels (unset ones are 0.0), or None if all unset."""
+    if red is None and green is None and blue is None:
+        return None
+    return {
+        "red": 0.0 if red is None else red,
+        "green": 0.0 if green is None else green,
+        "blue": 0.0 if blue is None else blue,
+    }
+
+
+_TEXT_STYLE_FIELDS = ("bold", "italic", "underline", "fontSize", "foregroundColor")
+# Every non-empty set of style fields -> its updateTextStyle "fields" mask
+_TEXT_STYLE_MASKS: dict[frozenset[str], str] = {
+    frozenset(combo): ",".join(combo)
+    for size in range(1, len(_TEXT_STYLE_FIELDS) + 1)
+    for combo in combinations(_TEXT_STYLE_FIELDS, size)
+}
+
+
+def _format_text_request(
+    start_index: int,
+    end_index: int,
+    bold: bool | None = None,
+    italic: bool | None = None,
+    underline: bool | None = None,
+    font_size_pt: float | None = None,
+    foreground_color: dict[str, float] | None = None,
+) -> dict[str, Any]:
+    """Build an updateTextStyle request, or an error dict if no style is set."""
+    # Keys double as the field names for the "fields" mask
+    text_style: dict[str, Any] = {}
+
+    if bold is not None:
+        text_style["bold"] = bold
+    if italic is not None:
+        text_style["italic"] = italic
+    if underline is not None:
+        text_style["underline"] = underline
+    if font_size_pt is not None:
+        text_style["fontSize"] = {"magnitude": font_size_pt, "unit": "PT"}
+    if foreground_color is not None:
+        text_style["foregroundColor"] = {"color": {"rgbColor": foreground_color}}
+
+    if not text_style:
+        return {"error": "No formatting options specified"}
+
+    return {
+        "updateTextStyle": {
+            "range": {
+                "startIndex": start_index,
+                "endIndex": end_index,
+            },
+            "textStyle": text_style,
+            "fields": _TEXT_STYLE_MASKS[frozenset(text_style)],
+        }
+    }
+
+
+def _create_list_request(
+    start_index: int, end_index: int, bullet_preset: str = DEFAULT_BULLET_PRESET
+) -> dict[str, Any]:
+    """Build a createParagraphBullets request."""
+    return {
+        "createParagraphBullets": {
+            "range": {
+                "startIndex": start_index,
+                "endIndex": end_index,
+            },
+            "bulletPreset": bullet_preset,
+        }
+    }
 
-def _create_service_account_token(service_account_json: str) -> str | None:
+
+# Ops accepted by google_docs_compose, keyed by the matching client method name
+_OP_REQUEST_BUILDERS: dict[str, Callable[..., dict[str, Any]]] = {
+    "insert_text": _insert_text_request,
+    "replace_all_text": _replace_all_text_request,
+    "insert_image": _insert_image_request,
+    "format_text": _format_text_request,
+    "create_list": _create_list_request,
+}
+
+
+@functools.cache
+def _google_auth_available() -> bool:
+    """Whether google-auth (installed e.g. with the bigquery extra) can be imported."""
+    try:
+        import google.auth.transport.requests  # noqa: F401
+        import google.oauth2.service_account  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _google_auth_token(service_account_json: str, sa_data: dict[str, Any]) -> str | None:
+    """Get a token from cached google-auth credentials, refreshing only once expired."""
+    from google.auth.transport.requests import Request
+    from google.oauth2 import service_account
+
+    creds = _GOOGLE_AUTH_CREDENTIALS.get(service_account_json)
+    if creds is None:
+        creds = service_account.Credentials.from_service_account_info(
+            sa_data, scopes=SERVICE_ACCOUNT_SCOPES
+        )
+        _GOOGLE_AUTH_CREDENTIALS[service_account_json] = creds
+    if not creds.valid:
+        creds.refresh(Request())
+    return creds.token
+
+
+@functools.lru_cache(maxsize=8)
+def _load_private_key(private_key_pem: str) -> Any:
+    """Parse a PEM private key once; later JWTs are signed with the same key object."""
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import serialization
+
+    return serialization.load_pem_private_key(
+        private_key_pem.encode(), password=None, backend=default_backend()
+    )
+
+
+async def _create_service_account_token(service_account_json: str) -> str | None:
     """Create an access token from a service account JSON using JWT.
 
-    This implements the OAuth 2.0 service account flow:
+    Uses google-auth when it is installed. Otherwise this implements the
+    OAuth 2.0 service account flow:
     1. Create a signed JWT
     2. Exchange it for an access token
 
@@ -112,6 +407,10 @@ def _create_service_account_token(service_account_json: str) -> str | None:
     Returns:
         Access token string, or None if token creation failed
     """
+    cached = _TOKEN_CACHE.get(service_account_json)
+    if cached is not None and time.monotonic() < cached[1]:
+        return cached[0]
+
     try:
         sa_data = json.loads(service_account_json)
     except json.JSONDecodeError:
@@ -130,6 +429,13 @@ def _create_service_account_token(service_account_json: str) -> str | None:
     if not private_key or not client_email:
         return None
 
+    if _google_auth_available():
+        # google-auth keeps the parsed key and token; refresh() is blocking I/O
+        try:
+            return await asyncio.to_thread(_google_auth_token, service_account_json, sa_data)
+        except Exception:
+            return None
+
     # Create JWT header and claims
     now = int(time.time())
     header = {"alg": "RS256", "typ": "JWT"}
@@ -139,32 +445,24 @@ def _create_service_account_token(service_account_json: str) -> str | None:
         "aud": token_uri,
         "iat": now,
         "exp": now + 3600,  # 1 hour expiry
-        "scope": (
-            "https://www.googleapis.com/auth/documents "
-            "https://www.googleapis.com/auth/drive.file "
-            "https://www.googleapis.com/auth/drive"
-        ),
+        "scope": " ".join(SERVICE_ACCOUNT_SCOPES),
     }
 
     try:
         # Try using cryptography library for RSA signing
-        from cryptography.hazmat.backends import default_backend
-        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives import hashes
         from cryptography.hazmat.primitives.asymmetric import padding
 
         # Encode header and claims
         def _b64url_encode(data: bytes) -> str:
             return base64.urlsafe_b64encode(data).rstrip(b"=").decode("utf-8")
 
-        header_b64 = _b64url_encode(json.dumps(header).encode())
-        claims_b64 = _b64url_encode(json.dumps(claims).encode())
+        header_b64 = _b64url_encode(dumps_json(header))
+        claims_b64 = _b64url_encode(dumps_json(claims))
         signing_input = f"{header_b64}.{claims_b64}"
 
-        # Load private key and sign
-        private_key_obj = serialization.load_pem_private_key(
-            private_key.encode(), password=None, backend=default_backend()
-        )
-        signature = private_key_obj.sign(
+        # Load private key (parsed once per key) and sign
+        signature = _load_private_key(private_key).sign(
             signing_input.encode(),
             padding.PKCS1v15(),
             hashes.SHA256(),
@@ -174,7 +472,7 @@ def _b64url_encode(data: bytes) -> str:
         jwt_token = f"{signing_input}.{signature_b64}"
 
         # Exchange JWT for access token
-        response = httpx.post(
+        response = await get_shared_client().post(
             token_uri,
             data={
                 "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
@@ -184,8 +482,16 @@ def _b64url_encode(data: bytes) -> str:
         )
 
         if response.status_code == 200:
-            token_data = response.json()
-            return token_data.get("access_token")
+            token_data = decode_json(response)
+            access_token = token_data.get("access_token")
+            if access_token:
+                # Reuse the token for its lifetime instead of re-signing per tool call
+                expires_in = token_data.get("expires_in", 3600)
+                _TOKEN_CACHE[service_account_json] = (
+                    access_token,
+                    time.monotonic() + expires_in - TOKEN_REFRESH_MARGIN,
+                )
+            return access_token
 
         return None
 
@@ -203,67 +509,92 @@ class _GoogleDocsClient:
 
     def __init__(self, access_token: str):
         self._token = access_token
-
-    @property
-    def _headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self._token}",
+        self._headers = {
+            "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
 
+    async def _request_with_retry(
+        self, method: str, url: str | httpx.URL, **kwargs: Any
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures with jittered exponential backoff.
+
+        Reads also retry on read timeouts; writes only retry statuses where
+        Google has not applied the request.
+        """
+        if "json" in kwargs:
+            kwargs["content"] = dumps_json(kwargs.pop("json"))
+        is_read = method == "GET"
+        statuses = RETRYABLE_STATUSES if is_read else WRITE_RETRYABLE_STATUSES
+        client = get_shared_client()
+        for attempt in range(MAX_RETRIES):
+            await _DOCS_LIMITER.acquire()
+            try:
+                response = await client.request(method, url, headers=self._headers, **kwargs)
+            except httpx.ReadTimeout:
+                if not is_read:
+                    raise
+                response = None
+            else:
+                if response.status_code not in statuses:
+                    return response
+            await asyncio.sleep(_retry_wait(response, attempt))
+        await _DOCS_LIMITER.acquire()
+        return await client.request(method, url, headers=self._headers, **kwargs)
+
     def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
         """Handle common HTTP error codes."""
-        if response.status_code == 401:
-            return {"error": "Invalid or expired Google access token"}
-        if response.status_code == 403:
-            return {
-                "error": "Insufficient permissions. Check your Google API scopes. "
-                "Required scopes: https://www.googleapis.com/auth/documents"
-            }
-        if response.status_code == 404:
-            return {"error": "Document not found"}
-        if response.status_code == 429:
-            return {"error": "Google API rate limit exceeded. Try again later."}
-        if response.status_code >= 400:
-            try:
-                error_data = response.json()
-                detail = error_data.get("error", {}).get("message", response.text)
-            except Exception:
-                detail = response.text
-            return {"error": f"Google Docs API error (HTTP {response.status_code}): {detail}"}
-        return response.json()
-
-    def create_document(self, title: str) -> dict[str, Any]:
+        status = response.status_code
+        if status < 400:
+            if not response.content:
+                return {"success": True}
+            return decode_json(response)
+        message = _STATUS_ERRORS.get(status)
+        if message is not None:
+            return {"error": message}
+        try:
+            error_data = decode_json(response)
+            detail = error_data.get("error", {}).get("message", response.text)
+        except Exception:
+            detail = response.text
+        return {"error": f"Google Docs API error (HTTP {status}): {detail}"}
+
+    async def create_document(self, title: str) -> dict[str, Any]:
         """Create a new blank document with a specified title."""
-        response = httpx.post(
+        response = await self._request_with_retry(
+            "POST",
             f"{GOOGLE_DOCS_API_BASE}/documents",
-            headers=self._headers,
+            # Only the ID and title are used; skip echoing the empty body back
+            params={"fields": "documentId,title"},
             json={"title": title},
             timeout=30.0,
         )
         return self._handle_response(response)
 
-    def get_document(self, document_id: str) -> dict[str, Any]:
-        """Retrieve the full structural content, metadata, and elements of a document."""
-        response = httpx.get(
-            f"{GOOGLE_DOCS_API_BASE}/documents/{document_id}",
-            headers=self._headers,
+    async def get_document(self, document_id: str, fields: str | None = None) -> dict[str, Any]:
+        """Retrieve a document: all of it, or only the parts named by a ``fields`` mask."""
+        response = await self._request_with_retry(
+            "GET",
+            _doc_urls(document_id).document,
+            params={"fields": fields} if fields else None,
             timeout=30.0,
         )
         return self._handle_response(response)
 
-    def batch_update(self, document_id: str, requests: list[dict[str, Any]]) -> dict[str, Any]:
+    async def batch_update(
+        self, document_id: str, requests: list[dict[str, Any]]
+    ) -> dict[str, Any]:
         """Execute multiple requests in a single atomic operation."""
-        response = httpx.post(
-            f"{GOOGLE_DOCS_API_BASE}/documents/{document_id}:batchUpdate",
-            headers=self._headers,
+        response = await self._request_with_retry(
+            "POST",
+            _doc_urls(document_id).batch_update,
             json={"requests": requests},
             timeout=60.0,
         )
         return self._handle_response(response)
 
-    def insert_text(
+    async def insert_text(
         self,
         document_id: str,
         text: str,
@@ -271,27 +602,10 @@ def insert_text(
         segment_id: str | None = None,
     ) -> dict[str, Any]:
         """Insert text at a specific index or at the end of the document."""
-        location: dict[str, Any] = {}
-        if segment_id:
-            location["segmentId"] = segment_id
-        if index is not None:
-            location["index"] = index
-        else:
-            # Insert at end - we need to get doc first to find the end index
-            doc = self.get_document(document_id)
-            if "error" in doc:
-                return doc
-            location["index"] = _get_document_end_index(doc)
-
-        request = {
-            "insertText": {
-                "location": location,
-                "text": text,
-            }
-        }
-        return self.batch_update(document_id, [request])
+        request = _insert_text_request(text, index, segment_id)
+        return await self.batch_update(document_id, [request])
 
-    def replace_all_text(
+    async def replace_all_text(
         self,
         document_id: str,
         find_text: str,
@@ -299,21 +613,12 @@ def replace_all_text(
         match_case: bool = True,
     ) -> dict[str, Any]:
         """Global find-and-replace (ideal for populating templates with dynamic data)."""
-        if not find_text:
-            return {"error": "find_text cannot be empty"}
-
-        request = {
-            "replaceAllText": {
-                "containsText": {
-                    "text": find_text,
-                    "matchCase": match_case,
-                },
-                "replaceText": replace_text,
-            }
-        }
-        return self.batch_update(document_id, [request])
+        request = _replace_all_text_request(find_text, replace_text, match_case)
+        if "error" in request:
+            return request
+        return await self.batch_update(document_id, [request])
 
-    def insert_image(
+    async def insert_image(
         self,
         document_id: str,
         image_uri: str,
@@ -322,28 +627,12 @@ def insert_image(
         height_pt: float | None = None,
     ) -> dict[str, Any]:
         """Insert an image into the document body via URI."""
-        # Validate image URI before making API call
-        validation_error = _validate_image_uri(image_uri)
-        if validation_error:
-            return validation_error
-
-        request: dict[str, Any] = {
-            "insertInlineImage": {
-                "location": {"index": index},
-                "uri": image_uri,
-            }
-        }
-        if width_pt is not None or height_pt is not None:
-            object_size: dict[str, Any] = {}
-            if width_pt is not None:
-                object_size["width"] = {"magnitude": width_pt, "unit": "PT"}
-            if height_pt is not None:
-                object_size["height"] = {"magnitude": height_pt, "unit": "PT"}
-            request["insertInlineImage"]["objectSize"] = object_size
+        request = _insert_image_request(image_uri, index, width_pt, height_pt)
+        if "error" in request:
+            return request
+        return await self.batch_update(document_id, [request])
 
-        return self.batch_update(document_id, [request])
-
-    def format_text(
+    async def format_text(
         self,
         document_id: str,
         start_index: int,
@@ -355,60 +644,60 @@ def format_text(
         foreground_color: dict[str, float] | None = None,
     ) -> dict[str, Any]:
         """Apply styling (bold, italic, font size, colors) to specific text ranges."""
-        text_style: dict[str, Any] = {}
-        fields: list[str] = []
-
-        if bold is not None:
-            text_style["bold"] = bold
-            fields.append("bold")
-        if italic is not None:
-            text_style["italic"] = italic
-            fields.append("italic")
-        if underline is not None:
-            text_style["underline"] = underline
-            fields.append("underline")
-        if font_size_pt is not None:
-            text_style["fontSize"] = {"magnitude": font_size_pt, "unit": "PT"}
-            fields.append("fontSize")
-        if foreground_color is not None:
-            text_style["foregroundColor"] = {"color": {"rgbColor": foreground_color}}
-            fields.append("foregroundColor")
-
-        if not fields:
-            return {"error": "No formatting options specified"}
-
-        request = {
-            "updateTextStyle": {
-                "range": {
-                    "startIndex": start_index,
-                    "endIndex": end_index,
-                },
-                "textStyle": text_style,
-                "fields": ",".join(fields),
-            }
-        }
-        return self.batch_update(document_id, [request])
+        request = _format_text_request(
+            start_index,
+            end_index,
+            bold=bold,
+            italic=italic,
+            underline=underline,
+            font_size_pt=font_size_pt,
+            foreground_color=foreground_color,
+        )
+        if "error" in request:
+            return request
+        return await self.batch_update(document_id, [request])
 
-    def create_list(
+    async def create_list(
         self,
         document_id: str,
         start_index: int,
         end_index: int,
-        bullet_preset: str = "BULLET_DISC_CIRCLE_SQUARE",
+        bullet_preset: str = DEFAULT_BULLET_PRESET,
     ) -> dict[str, Any]:
         """Create or modify bulleted and numbered lists within the document."""
-        request = {
-            "createParagraphBullets": {
-                "range": {
-                    "startIndex": start_index,
-                    "endIndex": end_index,
-                },
-                "bulletPreset": bullet_preset,
-            }
-        }
-        return self.batch_update(document_id, [request])
+        request = _create_list_request(start_index, end_index, bullet_preset)
+        return await self.batch_update(document_id, [request])
+
+    async def compose(self, document_id: str, ops: list[dict[str, Any]]) -> dict[str, Any]:
+        """Apply several high-level operations in one atomic batchUpdate call.
 
-    def add_comment(
+        Each op is ``{"op": <name>, **params}`` where the name and params match
+        insert_text, replace_all_text, insert_image, format_text or create_list.
+        """
+        requests: list[dict[str, Any]] = []
+        for position, op in enumerate(ops):
+            if not isinstance(op, dict):
+                return {"error": f"Op {position} must be an object"}
+            params = dict(op)
+            name = params.pop("op", None)
+            builder = _OP_REQUEST_BUILDERS.get(name)
+            if builder is None:
+                return {
+                    "error": f"Op {position}: unknown op {name!r}. "
+                    f"Supported: {', '.join(_OP_REQUEST_BUILDERS)}"
+                }
+            try:
+                request = builder(**params)
+            except TypeError as e:
+                return {"error": f"Op {position} ({name}): invalid parameters: {e}"}
+            if "error" in request:
+                return {"error": f"Op {position} ({name}): {request['error']}"}
+            requests.append(request)
+        if not requests:
+            return {"error": "No operations specified"}
+        return await self.batch_update(document_id, requests)
+
+    async def add_comment(
         self,
         document_id: str,
         content: str,
@@ -419,60 +708,129 @@ def add_comment(
         if quoted_text:
             body["quotedFileContent"] = {"value": quoted_text}
 
-        response = httpx.post(
-            f"{GOOGLE_DRIVE_API_BASE}/files/{document_id}/comments",
-            headers=self._headers,
-            params={"fields": "*"},
+        response = await self._request_with_retry(
+            "POST",
+            _doc_urls(document_id).comments,
+            params={"fields": COMMENT_FIELDS},
             json=body,
             timeout=30.0,
         )
         return self._handle_response(response)
 
-    def list_comments(
+    async def list_comments(
         self,
         document_id: str,
         page_size: int = 20,
         page_token: str | None = None,
         include_deleted: bool = False,
+        fields: str | None = None,
     ) -> dict[str, Any]:
-        """List comments on a document (via Drive API)."""
+        """List comments on a document (via Drive API), with COMMENT_FIELDS by default."""
         params: dict[str, Any] = {
-            "fields": "comments(*),nextPageToken",
-            "pageSize": max(1, min(page_size, 100)),
+            "fields": f"comments({fields or COMMENT_FIELDS}),nextPageToken",
+            "pageSize": max(1, min(page_size, COMMENTS_PAGE_SIZE)),
             "includeDeleted": str(include_deleted).lower(),
         }
         if page_token:
             params["pageToken"] = page_token
 
-        response = httpx.get(
-            f"{GOOGLE_DRIVE_API_BASE}/files/{document_id}/comments",
-            headers=self._headers,
+        response = await self._request_with_retry(
+            "GET",
+            _doc_urls(document_id).comments,
             params=params,
             timeout=30.0,
         )
         return self._handle_response(response)
 
-    def export_document(
+    async def list_all_comments(
+        self,
+        document_id: str,
+        max_total: int,
+        include_deleted: bool = False,
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        """Follow nextPageToken until ``max_total`` comments or the last page.
+
+        Drive only exposes page tokens, not offsets, so pages are fetched in sequence.
+        """
+        comments: list[dict[str, Any]] = []
+        page_token: str | None = None
+        while len(comments) < max_total:
+            page = await self.list_comments(
+                document_id,
+                page_size=min(max_total - len(comments), COMMENTS_PAGE_SIZE),
+                page_token=page_token,
+                include_deleted=include_deleted,
+            )
+            if "error" in page:
+                return page
+            comments.extend(page.get("comments", []))
+            page_token = page.get("nextPageToken")
+            if not page_token:
+                break
+        return comments
+
+    async def export_document(
         self,
         document_id: str,
         mime_type: str = "application/pdf",
     ) -> dict[str, Any]:
         """Export the document to different formats (PDF, DOCX, TXT)."""
-        response = httpx.get(
-            f"{GOOGLE_DRIVE_API_BASE}/files/{document_id}/export",
-            headers=self._headers,
+        response = await self._request_with_retry(
+            "GET",
+            _doc_urls(document_id).export,
             params={"mimeType": mime_type},
             timeout=60.0,
         )
-        if response.status_code == 200:
-            # Return base64-encoded content for binary formats
-            return {
-                "document_id": document_id,
-                "mime_type": mime_type,
-                "content_base64": base64.b64encode(response.content).decode("utf-8"),
-                "size_bytes": len(response.content),
-            }
-        return self._handle_response(response)
+        if response.status_code != 200:
+            return self._handle_response(response)
+        # Return base64-encoded content for binary formats
+        content = response.content
+        if len(content) > INLINE_ENCODE_THRESHOLD:
+            encoded = await asyncio.to_thread(base64.b64encode, content)
+        else:
+            encoded = base64.b64encode(content)
+        return {
+            "document_id": document_id,
+            "mime_type": mime_type,
+            "content_base64": encoded.decode("ascii"),
+            "size_bytes": len(content),
+        }
+
+    async def export_document_to_file(
+        self,
+        document_id: str,
+        path: str,
+        mime_type: str = "application/pdf",
+    ) -> dict[str, Any]:
+        """Stream an export straight to ``path`` instead of holding it in memory."""
+        await _DOCS_LIMITER.acquire()
+        async with get_shared_client().stream(
+            "GET",
+            _doc_urls(document_id).export,
+            headers=self._headers,
+            params={"mimeType": mime_type},
+            timeout=60.0,
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
+                return self._handle_response(response)
+            size = 0
+            with open(path, "wb") as f:
+                async for chunk in response.aiter_bytes(EXPORT_CHUNK_SIZE):
+                    f.write(chunk)
+                    size += len(chunk)
+        return {
+            "document_id": document_id,
+            "mime_type": mime_type,
+            "path": path,
+            "size_bytes": size,
+        }
+
+
+@functools.lru_cache(maxsize=16)
+def _client_for_token(access_token: str) -> _GoogleDocsClient:
+    """Reuse one client per access token across tool calls; rotated tokens age out."""
+    return _GoogleDocsClient(access_token)
 
 
 def register_tools(
@@ -481,7 +839,7 @@ def register_tools(
 ) -> None:
     """Register Google Docs tools with the MCP server."""
 
-    def _get_token(account: str = "") -> str | None:
+    async def _get_token(account: str = "") -> str | None:
         """Get Google access token from credential manager or environment."""
         if credentials is not None:
             if account:
@@ -503,12 +861,12 @@ def _get_token(account: str = "") -> str | None:
         # Try service account JSON with proper JWT token exchange
         service_account = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON")
         if service_account:
-            return _create_service_account_token(service_account)
+            return await _create_service_account_token(service_account)
         return None
 
-    def _get_client(account: str = "") -> _GoogleDocsClient | dict[str, str]:
+    async def _get_client(account: str = "") -> _GoogleDocsClient | dict[str, str]:
         """Get a Google Docs client, or return an error dict if no credentials."""
-        token = _get_token(account)
+        token = await _get_token(account)
         if not token:
             return {
                 "error": "Google Docs credentials not configured",
@@ -518,12 +876,12 @@ def _get_client(account: str = "") -> _GoogleDocsClient | dict[str, str]:
                     "Get credentials at: https://console.cloud.google.com/apis/credentials"
                 ),
             }
-        return _GoogleDocsClient(token)
+        return _client_for_token(token)
 
     # --- Document Management ---
 
     @mcp.tool()
-    def google_docs_create_document(title: str, account: str = "") -> dict:
+    async def google_docs_create_document(title: str, account: str = "") -> dict:
         """
         Create a new blank Google Docs document with a specified title.
 
@@ -533,11 +891,11 @@ def google_docs_create_document(title: str, account: str = "") -> dict:
         Returns:
             Dict with document ID and metadata, or error
         """
-        client = _get_client(account)
+        client = await _get_client(account)
         if isinstance(client, dict):
             return client
         try:
-            result = client.create_document(title)
+            result = await client.create_document(title)
             if "error" not in result:
                 return {
                     "document_id": result.get("documentId"),
@@ -551,28 +909,33 @@ def google_docs_create_document(title: str, account: str = "") -> dict:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_get_document(document_id: str, account: str = "") -> dict:
+    async def google_docs_get_document(
+        document_id: str, fields: str | None = None, account: str = ""
+    ) -> dict:
         """
         Retrieve the full structural content, metadata, and elements of a document.
 
         Args:
             document_id: The ID of the Google Docs document
+            fields: Optional partial-response mask to fetch only what is needed,
+                    e.g. "title,revisionId" or "body(content(endIndex))".
+                    Large documents return much less data. Omit for the full document.
 
         Returns:
             Dict with document content and structure, or error
         """
-        client = _get_client(account)
+        client = await _get_client(account)
         if isinstance(client, dict):
             return client
         try:
-            return client.get_document(document_id)
+            return await client.get_document(document_id, fields)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_insert_text(
+    async def google_docs_insert_text(
         document_id: str,
         text: str,
         index: int | None = None,
@@ -591,18 +954,18 @@ def google_docs_insert_text(
         Returns:
             Dict with update result, or error
         """
-        client = _get_client(account)
+        client = await _get_client(account)
         if isinstance(client, dict):
             return client
         try:
-            return client.insert_text(document_id, text, index)
+            return await client.insert_text(document_id, text, index)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_replace_all_text(
+    async def google_docs_replace_all_text(
         document_id: str,
         find_text: str,
         replace_text: str,
@@ -623,11 +986,11 @@ def google_docs_replace_all_text(
         Returns:
             Dict with number of replacements made, or error
         """
-        client = _get_client(account)
+        client = await _get_client(account)
         if isinstance(client, dict):
             return client
         try:
-            result = client.replace_all_text(document_id, find_text, replace_text, match_case)
+            result = await client.replace_all_text(document_id, find_text, replace_text, match_case)
             if "error" not in result:
                 # Extract replacement count from response
                 replies = result.get("replies", [])
@@ -648,7 +1011,7 @@ def google_docs_replace_all_text(
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_insert_image(
+    async def google_docs_insert_image(
         document_id: str,
         image_uri: str,
         index: int,
@@ -671,18 +1034,18 @@ def google_docs_insert_image(
         Returns:
             Dict with update result, or error
         """
-        client = _get_client(account)
+        client = await _get_client(account)
         if isinstance(client, dict):
             return client
         try:
-            return client.insert_image(document_id, image_uri, index, width_pt, height_pt)
+            return await client.insert_image(document_id, image_uri, index, width_pt, height_pt)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_format_text(
+    async def google_docs_format_text(
         document_id: str,
         start_index: int,
         end_index: int,
@@ -713,23 +1076,16 @@ def google_docs_format_text(
         Returns:
             Dict with update result, or error
         """
-        client = _get_client(account)
+        client = await _get_client(account)
         if isinstance(client, dict):
             return client
 
-        foreground_color = None
-        if any(
-            c is not None
-            for c in [foreground_color_red, foreground_color_green, foreground_color_blue]
-        ):
-            foreground_color = {
-                "red": foreground_color_red or 0.0,
-                "green": foreground_color_green or 0.0,
-                "blue": foreground_color_blue or 0.0,
-            }
+        foreground_color = _rgb_color(
+            foreground_color_red, foreground_color_green, foreground_color_blue
+        )
 
         try:
-            return client.format_text(
+            return await client.format_text(
                 document_id,
                 start_index,
                 end_index,
@@ -745,7 +1101,7 @@ def google_docs_format_text(
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_batch_update(
+    async def google_docs_batch_update(
         document_id: str,
         requests_json: str,
         account: str = "",
@@ -763,14 +1119,55 @@ def google_docs_batch_update(
         Returns:
             Dict with batch update result, or error
         """
-        client = _get_client(account)
+        client = await _get_client(account)
         if isinstance(client, dict):
             return client
         try:
             requests = json.loads(requests_json)
             if not isinstance(requests, list):
                 return {"error": "requests_json must be a JSON array of request objects"}
-            return client.batch_update(document_id, requests)
+            return await client.batch_update(document_id, requests)
+        except json.JSONDecodeError as e:
+            return {"error": f"Invalid JSON: {e}"}
+        except httpx.TimeoutException:
+            return {"error": "Request timed out"}
+        except httpx.RequestError as e:
+            return {"error": f"Network error: {e}"}
+
+    @mcp.tool()
+    async def google_docs_compose(
+        document_id: str,
+        ops_json: str,
+        account: str = "",
+    ) -> dict:
+        """
+        Apply several edits (insert, replace, image, format, list) in one atomic request.
+
+        Cheaper than calling the single-edit tools one by one: all ops are sent as a
+        single batchUpdate. Ops run in order, so later indices must account for
+        earlier inserts.
+
+        Args:
+            document_id: The ID of the Google Docs document
+            ops_json: JSON array of ops, each {"op": <name>, ...params}. Supported:
+                insert_text (text, index; omit index to append),
+                replace_all_text (find_text, replace_text, match_case),
+                insert_image (image_uri, index, width_pt, height_pt),
+                format_text (start_index, end_index, bold, italic, underline,
+                font_size_pt, foreground_color {red, green, blue}),
+                create_list (start_index, end_index, bullet_preset)
+
+        Returns:
+            Dict with batch update result, or error
+        """
+        client = await _get_client(account)
+        if isinstance(client, dict):
+            return client
+        try:
+            ops = json.loads(ops_json)
+            if not isinstance(ops, list):
+                return {"error": "ops_json must be a JSON array of op objects"}
+            return await client.compose(document_id, ops)
         except json.JSONDecodeError as e:
             return {"error": f"Invalid JSON: {e}"}
         except httpx.TimeoutException:
@@ -779,7 +1176,7 @@ def google_docs_batch_update(
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_create_list(
+    async def google_docs_create_list(
         document_id: str,
         start_index: int,
         end_index: int,
@@ -798,25 +1195,21 @@ def google_docs_create_list(
         Returns:
             Dict with update result, or error
         """
-        client = _get_client(account)
+        client = await _get_client(account)
         if isinstance(client, dict):
             return client
 
-        bullet_presets = {
-            "bullet": "BULLET_DISC_CIRCLE_SQUARE",
-            "numbered": "NUMBERED_DECIMAL_ALPHA_ROMAN",
-        }
-        preset = bullet_presets.get(list_type.lower(), "BULLET_DISC_CIRCLE_SQUARE")
+        preset = BULLET_PRESETS.get(list_type.lower(), DEFAULT_BULLET_PRESET)
 
         try:
-            return client.create_list(document_id, start_index, end_index, preset)
+            return await client.create_list(document_id, start_index, end_index, preset)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_add_comment(
+    async def google_docs_add_comment(
         document_id: str,
         content: str,
         quoted_text: str | None = None,
@@ -835,22 +1228,23 @@ def google_docs_add_comment(
         Returns:
             Dict with comment details, or error
         """
-        client = _get_client(account)
+        client = await _get_client(account)
         if isinstance(client, dict):
             return client
         try:
-            return client.add_comment(document_id, content, quoted_text)
+            return await client.add_comment(document_id, content, quoted_text)
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_list_comments(
+    async def google_docs_list_comments(
         document_id: str,
         page_size: int = 20,
         page_token: str | None = None,
         include_deleted: bool = False,
+        fields: str | None = None,
         account: str = "",
     ) -> dict:
         """
@@ -863,15 +1257,20 @@ def google_docs_list_comments(
             page_size: Number of comments to return (1-100, default: 20)
             page_token: Optional pagination token from a previous response
             include_deleted: Whether to include deleted comments
+            fields: Optional comment fields to return, e.g. "id,content,htmlContent".
+                    Defaults to id, content, author, times, resolved state,
+                    quoted text and replies.
 
         Returns:
             Dict containing comments list and optional next_page_token, or error
         """
-        client = _get_client(account)
+        client = await _get_client(account)
         if isinstance(client, dict):
             return client
         try:
-            result = client.list_comments(document_id, page_size, page_token, include_deleted)
+            result = await client.list_comments(
+                document_id, page_size, page_token, include_deleted, fields
+            )
             if "error" in result:
                 return result
             return {
@@ -885,9 +1284,50 @@ def google_docs_list_comments(
             return {"error": f"Network error: {e}"}
 
     @mcp.tool()
-    def google_docs_export_content(
+    async def google_docs_list_all_comments(
+        document_id: str,
+        max_comments: int = 500,
+        include_deleted: bool = False,
+        account: str = "",
+    ) -> dict:
+        """
+        Retrieve all comments for a document, following pagination internally.
+
+        Note: This uses the Google Drive API for comments.
+
+        Args:
+            document_id: The ID of the Google Docs document
+            max_comments: Maximum number of comments to return (1-1000, default: 500)
+            include_deleted: Whether to include deleted comments
+
+        Returns:
+            Dict containing the comments list, or error
+        """
+        client = await _get_client(account)
+        if isinstance(client, dict):
+            return client
+        try:
+            result = await client.list_all_comments(
+                document_id,
+                max(1, min(max_comments, MAX_BULK_COMMENTS)),
+                include_deleted,
+            )
+            if isinstance(result, dict):
+                return result
+            return {"document_id": document_id, "comments": result}
+        except httpx.TimeoutException:
+            return {"error": "Request timed out"}
+        except httpx.RequestError as e:
+            return {"error": f"Network error: {e}"}
+
+    @mcp.tool()
+    async def google_docs_export_content(
         document_id: str,
         format: str = "pdf",
+        output_path: str | None = None,
+        workspace_id: str = "",
+        agent_id: str = "",
+        session_id: str = "",
         account: str = "",
     ) -> dict:
         """
@@ -896,27 +1336,35 @@ def google_docs_export_content(
         Args:
             document_id: The ID of the Google Docs document
             format: Export format - "pdf", "docx", "txt", "html", "odt", "rtf", "epub"
+            output_path: Optional file path (relative to the session sandbox) to stream
+                         the export to instead of returning it base64-encoded.
+                         Recommended for large documents. Requires workspace_id,
+                         agent_id and session_id.
+            workspace_id: Workspace identifier (with output_path)
+            agent_id: Agent identifier (with output_path)
+            session_id: Session identifier (with output_path)
 
         Returns:
-            Dict with base64-encoded content and metadata, or error
+            Dict with base64-encoded content (or the written path) and metadata, or error
         """
-        client = _get_client(account)
+        client = await _get_client(account)
         if isinstance(client, dict):
             return client
 
-        mime_types = {
-            "pdf": "application/pdf",
-            "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            "txt": "text/plain",
-            "html": "text/html",
-            "odt": "application/vnd.oasis.opendocument.text",
-            "rtf": "application/rtf",
-            "epub": "application/epub+zip",
-        }
-        mime_type = mime_types.get(format.lower(), "application/pdf")
+        mime_type = EXPORT_MIME_TYPES.get(format.lower(), "application/pdf")
 
         try:
-            return client.export_document(document_id, mime_type)
+            if output_path:
+                secure_path = get_secure_path(output_path, workspace_id, agent_id, session_id)
+                result = await client.export_document_to_file(document_id, secure_path, mime_type)
+                if "error" not in result:
+                    result["path"] = output_path
+                return result
+            return await client.export_document(document_id, mime_type)
+        except ValueError as e:
+            return {"error": str(e)}
+        except OSError as e:
+            return {"error": f"Failed to write export: {e}"}
         except httpx.TimeoutException:
             return {"error": "Request timed out"}
         except httpx.RequestError as e:
@@ -1 +0,0 @@
-"""Tests for Google Docs tool."""
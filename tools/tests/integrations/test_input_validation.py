@@ -7,6 +7,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import importlib
 import inspect
 
@@ -113,6 +114,9 @@ def test_missing_credentials_returns_error_and_help(
         args = get_minimal_args(fn)
 
         result = fn(**args)
+        if inspect.isawaitable(result):
+            # Async tools (e.g. Discord) are awaited the way FastMCP would
+            result = asyncio.run(result)
 
         assert isinstance(result, dict), (
             f"Tool '{tool_name}' should return a dict, got {type(result)}"
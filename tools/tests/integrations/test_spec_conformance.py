@@ -26,7 +26,7 @@
     SEARCH_CREDENTIALS,
     SLACK_CREDENTIALS,
 )
-from aden_tools.tools import register_all_tools
+from aden_tools.tools import _TOOL_REGISTRY, register_all_tools
 
 from .conftest import (
     CREDENTIAL_STORE_META_MODULES,
@@ -254,6 +254,27 @@ def test_spec_tools_in_return_list(self, spec_name: str, all_tools_return: list[
                 f"not in register_all_tools() return list"
             )
 
+    @pytest.mark.parametrize(
+        "import_path,short_name",
+        TOOL_MODULES,
+        ids=TOOL_MODULE_IDS,
+    )
+    def test_module_in_tool_registry(self, import_path: str, short_name: str):
+        """Every tool module is registered, with the right credentials flag."""
+        registry = dict(_TOOL_REGISTRY)
+        module_name = import_path.removeprefix("aden_tools.tools.")
+        assert module_name in registry, f"{module_name} missing from _TOOL_REGISTRY"
+
+        mod = importlib.import_module(import_path)
+        takes_credentials = "credentials" in inspect.signature(mod.register_tools).parameters
+        assert registry[module_name] == takes_credentials
+
+    def test_include_registers_only_named_modules(self):
+        mcp = FastMCP("include-check")
+        tools = register_all_tools(mcp, include=["time_tool", "discord_tool"])
+        assert "discord_send_message" in tools
+        assert not any(name.startswith("github_") for name in tools)
+
 
 # ---------------------------------------------------------------------------
 # 1a-7: Credential coverage - tools accepting credentials must have specs
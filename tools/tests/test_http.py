@@ -0,0 +1,39 @@
+"""Tests for the shared async HTTP client."""
+
+import json
+
+import httpx
+import pytest
+
+from aden_tools import http
+from aden_tools.http import aclose_shared_client, decode_json, dumps_json, get_shared_client
+
+
+class TestSharedClient:
+    """Tests for get_shared_client / aclose_shared_client."""
+
+    def test_returns_same_client(self):
+        """Repeated calls share one pooled client."""
+        assert get_shared_client() is get_shared_client()
+
+    @pytest.mark.asyncio
+    async def test_close_then_rebuild(self):
+        """A closed client is replaced on the next call."""
+        client = get_shared_client()
+        await aclose_shared_client()
+
+        assert client.is_closed
+        assert get_shared_client() is not client
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_helpers_match_stdlib(monkeypatch, use_orjson):
+    """dumps_json/decode_json round-trip the same as the stdlib, with or without orjson."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(http, "orjson", None)
+    payload = {"content": "héllo ✓", "requests": [{"insertText": {"text": "x"}}], "tts": False}
+
+    assert json.loads(dumps_json(payload)) == payload
+    assert decode_json(httpx.Response(200, json=payload)) == payload
@@ -5,22 +5,53 @@
 - _DiscordClient methods (list_guilds, list_channels, send_message, get_messages)
 - Error handling (401, 403, 404, timeout)
 - Credential retrieval (CredentialStoreAdapter vs env var)
-- All 4 MCP tool functions
+- All 5 MCP tool functions
 """
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
+from aden_tools.http import decode_json
+from aden_tools.tools.discord_tool import discord_tool
 from aden_tools.tools.discord_tool.discord_tool import (
+    MAX_BULK_CHANNELS,
     MAX_MESSAGE_LENGTH,
     MAX_RETRIES,
     _DiscordClient,
     register_tools,
 )
 
+_REQUEST = "aden_tools.tools.discord_tool.discord_tool.httpx.AsyncClient.request"
+_DECODE = "aden_tools.tools.discord_tool.discord_tool.decode_json"
+
+
+class _RecordingMCP:
+    """Minimal FastMCP stand-in that records the functions passed to ``tool()``."""
+
+    def __init__(self):
+        self.fns: list[Any] = []
+
+    def tool(self):
+        def register(fn):
+            self.fns.append(fn)
+            return fn
+
+        return register
+
+
+@pytest.fixture(autouse=True)
+def _empty_topology_cache(monkeypatch):
+    """Keep guild and channel lists cached by one test out of the next."""
+    monkeypatch.setattr(discord_tool, "_TOPOLOGY_CACHE", {})
+
+
 # --- _DiscordClient tests ---
 
 
@@ -34,22 +65,16 @@ def test_headers(self):
         assert headers["Authorization"] == "Bot test-bot-token"
 
     def test_handle_response_success(self):
-        response = MagicMock()
-        response.status_code = 200
-        response.json.return_value = {"id": "123", "username": "test-bot"}
+        response = httpx.Response(200, json={"id": "123", "username": "test-bot"})
         assert self.client._handle_response(response) == {"id": "123", "username": "test-bot"}
 
     def test_handle_response_204(self):
-        response = MagicMock()
-        response.status_code = 204
+        response = httpx.Response(204)
         result = self.client._handle_response(response)
         assert result == {"success": True}
 
     def test_handle_response_rate_limit_429(self):
-        response = MagicMock()
-        response.status_code = 429
-        response.json.return_value = {"message": "Rate limit", "retry_after": 2.5}
-        response.text = '{"message": "Rate limit", "retry_after": 2.5}'
+        response = httpx.Response(429, json={"message": "Rate limit", "retry_after": 2.5})
         result = self.client._handle_response(response)
         assert "error" in result
         assert "rate limit" in result["error"].lower()
@@ -60,144 +85,229 @@ def test_handle_response_rate_limit_429(self):
         [401, 403, 404, 500],
     )
     def test_handle_response_errors(self, status_code):
-        response = MagicMock()
-        response.status_code = status_code
-        response.json.return_value = {"message": "Test error"}
-        response.text = "Test error"
+        response = httpx.Response(status_code, json={"message": "Test error"})
         result = self.client._handle_response(response)
         assert "error" in result
         assert str(status_code) in result["error"]
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
-    def test_list_guilds(self, mock_request):
-        mock_request.return_value = MagicMock(
-            status_code=200,
-            json=MagicMock(
-                return_value=[
-                    {"id": "g1", "name": "Test Server"},
-                    {"id": "g2", "name": "Another Server"},
-                ]
-            ),
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_list_guilds(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            200,
+            json=[
+                {"id": "g1", "name": "Test Server"},
+                {"id": "g2", "name": "Another Server"},
+            ],
         )
-        result = self.client.list_guilds()
+        result = await self.client.list_guilds()
         mock_request.assert_called_once()
         assert mock_request.call_args[0][0] == "GET"
         assert "users/@me/guilds" in mock_request.call_args[0][1]
         assert len(result) == 2
         assert result[0]["name"] == "Test Server"
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
-    def test_list_channels_text_only_default(self, mock_request):
-        mock_request.return_value = MagicMock(
-            status_code=200,
-            json=MagicMock(
-                return_value=[
-                    {"id": "c1", "name": "general", "type": 0},
-                    {"id": "c2", "name": "incidents", "type": 0},
-                    {"id": "c3", "name": "voice-chat", "type": 2},
-                ]
-            ),
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_list_channels_text_only_default(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            200,
+            json=[
+                {"id": "c1", "name": "general", "type": 0},
+                {"id": "c2", "name": "incidents", "type": 0},
+                {"id": "c3", "name": "voice-chat", "type": 2},
+                {"id": "c4", "name": "triage-thread", "type": 11},
+                {"id": "c5", "name": "category", "type": 4},
+            ],
         )
-        result = self.client.list_channels("guild-123")
-        assert len(result) == 2
-        assert result[0]["name"] == "general"
-        assert result[1]["name"] == "incidents"
-        assert not any(c["type"] == 2 for c in result)
-
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
-    def test_list_channels_all_types(self, mock_request):
-        mock_request.return_value = MagicMock(
-            status_code=200,
-            json=MagicMock(
-                return_value=[
-                    {"id": "c1", "name": "general", "type": 0},
-                    {"id": "c2", "name": "voice-chat", "type": 2},
-                ]
-            ),
+        result = await self.client.list_channels("guild-123")
+        assert [c["name"] for c in result] == ["general", "incidents", "triage-thread"]
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_list_channels_all_types(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            200,
+            json=[
+                {"id": "c1", "name": "general", "type": 0},
+                {"id": "c2", "name": "voice-chat", "type": 2},
+            ],
         )
-        result = self.client.list_channels("guild-123", text_only=False)
+        result = await self.client.list_channels("guild-123", text_only=False)
         assert len(result) == 2
         assert result[0]["type"] == 0
         assert result[1]["type"] == 2
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
-    def test_send_message(self, mock_request):
-        mock_request.return_value = MagicMock(
-            status_code=200,
-            json=MagicMock(
-                return_value={
-                    "id": "m123",
-                    "channel_id": "c1",
-                    "content": "Hello world",
-                }
-            ),
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_send_message(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            200,
+            json={
+                "id": "m123",
+                "channel_id": "c1",
+                "content": "Hello world",
+            },
         )
-        result = self.client.send_message("c1", "Hello world")
+        result = await self.client.send_message("c1", "Hello world")
         mock_request.assert_called_once()
         assert mock_request.call_args[0][0] == "POST"
         assert "channels/c1/messages" in mock_request.call_args[0][1]
+        sent = json.loads(mock_request.call_args.kwargs["content"])
+        assert sent == {"content": "Hello world", "tts": False}
         assert result["content"] == "Hello world"
         assert result["channel_id"] == "c1"
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
-    def test_get_messages(self, mock_request):
-        mock_request.return_value = MagicMock(
-            status_code=200,
-            json=MagicMock(
-                return_value=[
-                    {"id": "m1", "content": "First"},
-                    {"id": "m2", "content": "Second"},
-                ]
-            ),
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_get_messages(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            200,
+            json=[
+                {"id": "m1", "content": "First"},
+                {"id": "m2", "content": "Second"},
+            ],
         )
-        result = self.client.get_messages("c1", limit=10)
+        result = await self.client.get_messages("c1", limit=10)
         mock_request.assert_called_once()
         assert mock_request.call_args[1]["params"] == {"limit": 10}
         assert len(result) == 2
         assert result[0]["content"] == "First"
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.time.sleep")
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
-    def test_retry_on_429_then_success(self, mock_request, mock_sleep):
+    @pytest.mark.asyncio
+    @patch("aden_tools.tools.discord_tool.discord_tool.asyncio.sleep", new_callable=AsyncMock)
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_retry_on_429_then_success(self, mock_request, mock_sleep):
         mock_request.side_effect = [
-            MagicMock(
-                status_code=429,
-                json=MagicMock(return_value={"retry_after": 0.01}),
-                text="{}",
-            ),
-            MagicMock(
-                status_code=200,
-                json=MagicMock(return_value=[{"id": "g1", "name": "Server"}]),
-            ),
+            httpx.Response(429, json={"retry_after": 0.01}),
+            httpx.Response(200, json=[{"id": "g1", "name": "Server"}]),
         ]
-        result = self.client.list_guilds()
+        result = await self.client.list_guilds()
         assert len(result) == 1
         assert result[0]["name"] == "Server"
         assert mock_request.call_count == 2
-        mock_sleep.assert_called_once_with(0.01)
-
-    @patch("aden_tools.tools.discord_tool.discord_tool.time.sleep")
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
-    def test_retry_exhausted_returns_error(self, mock_request, mock_sleep):
-        mock_request.return_value = MagicMock(
-            status_code=429,
-            json=MagicMock(return_value={"retry_after": 0.01}),
-            text="{}",
-        )
-        result = self.client.list_guilds()
+        mock_sleep.assert_awaited_once_with(0.01)
+
+    @pytest.mark.asyncio
+    @patch("aden_tools.tools.discord_tool.discord_tool.asyncio.sleep", new_callable=AsyncMock)
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_retry_exhausted_returns_error(self, mock_request, mock_sleep):
+        mock_request.return_value = httpx.Response(429, json={"retry_after": 0.01})
+        result = await self.client.list_guilds()
         assert "error" in result
         assert "rate limit" in result["error"].lower()
         assert mock_request.call_count == MAX_RETRIES + 1
 
+    @pytest.mark.asyncio
+    @patch("aden_tools.tools.discord_tool.discord_tool.asyncio.sleep", new_callable=AsyncMock)
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_429_body_parsed_once_per_response(self, mock_request, mock_sleep):
+        mock_request.return_value = httpx.Response(
+            429, json={"retry_after": 0.01, "message": "Slow down"}
+        )
+        with patch(_DECODE, wraps=decode_json) as decode:
+            result = await self.client.list_guilds()
+        assert result["message"] == "Slow down"
+        assert decode.call_count == MAX_RETRIES + 1
+
+    @pytest.mark.asyncio
+    @patch("aden_tools.tools.discord_tool.discord_tool.asyncio.sleep", new_callable=AsyncMock)
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_429_unparseable_body_falls_back(self, mock_request, mock_sleep):
+        mock_request.return_value = httpx.Response(429, content=b"not json")
+        result = await self.client.list_guilds()
+        assert result["retry_after"] == 60
+        # Jittered backoff: base * 2**attempt plus up to one base step
+        waits = [call.args[0] for call in mock_sleep.await_args_list]
+        assert 1 <= waits[0] <= 2
+        assert 2 <= waits[1] <= 3
+
+    @pytest.mark.asyncio
+    @patch("aden_tools.tools.discord_tool.discord_tool.asyncio.sleep", new_callable=AsyncMock)
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_retry_on_transient_5xx_for_reads(self, mock_request, mock_sleep):
+        mock_request.side_effect = [
+            httpx.Response(502),
+            httpx.Response(503, json={"message": "Service Unavailable"}),
+            httpx.Response(200, json=[{"id": "g1"}]),
+        ]
+        assert await self.client.list_guilds() == [{"id": "g1"}]
+        assert mock_sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    @patch("aden_tools.tools.discord_tool.discord_tool.asyncio.sleep", new_callable=AsyncMock)
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_5xx_retries_exhausted_returns_error(self, mock_request, mock_sleep):
+        mock_request.return_value = httpx.Response(500, json={"message": "Internal Server Error"})
+        result = await self.client.get_messages("c1")
+        assert result == {"error": "HTTP 500: Internal Server Error"}
+        assert mock_request.call_count == MAX_RETRIES + 1
+
+    @pytest.mark.asyncio
+    @patch("aden_tools.tools.discord_tool.discord_tool.asyncio.sleep", new_callable=AsyncMock)
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_send_message_not_retried_on_500(self, mock_request, mock_sleep):
+        mock_request.return_value = httpx.Response(500, json={"message": "Internal Server Error"})
+        result = await self.client.send_message("c1", "Hello")
+        assert "500" in result["error"]
+        mock_request.assert_called_once()
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_list_channels_cached_across_clients_and_filters(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            200, json=[{"id": "c1", "type": 0}, {"id": "c2", "type": 2}]
+        )
+        first = await self.client.list_channels("g1")
+        everything = await _DiscordClient("test-bot-token").list_channels("g1", text_only=False)
+        assert [c["id"] for c in first] == ["c1"]
+        assert [c["id"] for c in everything] == ["c1", "c2"]
+        assert mock_request.call_count == 1
+
+        await self.client.list_channels("g1", refresh=True)
+        await _DiscordClient("other-token").list_channels("g1")
+        assert mock_request.call_count == 3
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_list_guilds_cache_expires_and_skips_errors(self, mock_request):
+        mock_request.side_effect = [
+            httpx.Response(200, json=[{"id": "g1"}]),
+            httpx.Response(401, json={"message": "401: Unauthorized"}),
+            httpx.Response(200, json=[{"id": "g2"}]),
+        ]
+        assert await self.client.list_guilds() == [{"id": "g1"}]
+        assert await self.client.list_guilds() == [{"id": "g1"}]
+
+        # Expire the entry in place
+        cache = discord_tool._TOPOLOGY_CACHE
+        cache.update((key, (value, 0.0)) for key, (value, _) in cache.items())
+        assert "error" in await self.client.list_guilds()
+        assert await self.client.list_guilds() == [{"id": "g2"}]
+        assert mock_request.call_count == 3
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_get_messages_bulk_follows_before_cursor(self, mock_request):
+        full_page = [{"id": f"m{i}"} for i in range(100)]
+        mock_request.side_effect = [
+            httpx.Response(200, json=full_page),
+            httpx.Response(200, json=[{"id": "old"}]),
+        ]
+        result = await self.client.get_messages_bulk("c1", 250)
+        assert len(result) == 101
+        assert mock_request.call_count == 2
+        assert mock_request.call_args_list[1][1]["params"] == {"limit": 100, "before": "m99"}
+
 
 # --- Tool registration tests ---
 
 
 class TestDiscordListGuildsTool:
     def setup_method(self):
-        self.mcp = MagicMock()
-        self.fns = []
-        self.mcp.tool.return_value = lambda fn: self.fns.append(fn) or fn
+        self.mcp = _RecordingMCP()
+        self.fns = self.mcp.fns
         cred = MagicMock()
         cred.get.return_value = "test-token"
         register_tools(self.mcp, credentials=cred)
@@ -205,33 +315,29 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
-    def test_list_guilds_success(self, mock_request):
-        mock_request.return_value = MagicMock(
-            status_code=200,
-            json=MagicMock(return_value=[{"id": "g1", "name": "Test Server"}]),
-        )
-        result = self._fn("discord_list_guilds")()
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_list_guilds_success(self, mock_request):
+        mock_request.return_value = httpx.Response(200, json=[{"id": "g1", "name": "Test Server"}])
+        result = await self._fn("discord_list_guilds")()
         assert result["success"] is True
         assert len(result["guilds"]) == 1
         assert result["guilds"][0]["name"] == "Test Server"
 
-    def test_list_guilds_no_credentials(self):
-        mcp = MagicMock()
-        fns = []
-        mcp.tool.return_value = lambda fn: fns.append(fn) or fn
+    @pytest.mark.asyncio
+    async def test_list_guilds_no_credentials(self):
+        mcp = _RecordingMCP()
         register_tools(mcp, credentials=None)
         with patch.dict("os.environ", {"DISCORD_BOT_TOKEN": ""}, clear=False):
-            result = next(f for f in fns if f.__name__ == "discord_list_guilds")()
+            result = await next(f for f in mcp.fns if f.__name__ == "discord_list_guilds")()
         assert "error" in result
         assert "not configured" in result["error"]
 
 
 class TestDiscordListChannelsTool:
     def setup_method(self):
-        self.mcp = MagicMock()
-        self.fns = []
-        self.mcp.tool.return_value = lambda fn: self.fns.append(fn) or fn
+        self.mcp = _RecordingMCP()
+        self.fns = self.mcp.fns
         cred = MagicMock()
         cred.get.return_value = "test-token"
         register_tools(self.mcp, credentials=cred)
@@ -239,54 +345,48 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
-    def test_list_channels_success(self, mock_request):
-        mock_request.return_value = MagicMock(
-            status_code=200,
-            json=MagicMock(
-                return_value=[
-                    {"id": "c1", "name": "general", "type": 0},
-                ]
-            ),
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_list_channels_success(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            200,
+            json=[
+                {"id": "c1", "name": "general", "type": 0},
+            ],
         )
-        result = self._fn("discord_list_channels")("guild-123")
+        result = await self._fn("discord_list_channels")("guild-123")
         assert result["success"] is True
         assert len(result["channels"]) == 1
         assert result["channels"][0]["name"] == "general"
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
-    def test_list_channels_text_only_filter(self, mock_request):
-        mock_request.return_value = MagicMock(
-            status_code=200,
-            json=MagicMock(
-                return_value=[
-                    {"id": "c1", "name": "general", "type": 0},
-                    {"id": "c2", "name": "voice", "type": 2},
-                ]
-            ),
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_list_channels_text_only_filter(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            200,
+            json=[
+                {"id": "c1", "name": "general", "type": 0},
+                {"id": "c2", "name": "voice", "type": 2},
+            ],
         )
-        result = self._fn("discord_list_channels")("guild-123", text_only=True)
+        result = await self._fn("discord_list_channels")("guild-123", text_only=True)
         assert result["success"] is True
         assert len(result["channels"]) == 1
         assert result["channels"][0]["name"] == "general"
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
-    def test_list_channels_error(self, mock_request):
-        mock_request.return_value = MagicMock(
-            status_code=404,
-            json=MagicMock(return_value={"message": "Unknown Guild"}),
-            text="Unknown Guild",
-        )
-        result = self._fn("discord_list_channels")("bad-guild")
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_list_channels_error(self, mock_request):
+        mock_request.return_value = httpx.Response(404, json={"message": "Unknown Guild"})
+        result = await self._fn("discord_list_channels")("bad-guild")
         assert "error" in result
         assert "404" in result["error"]
 
 
 class TestDiscordSendMessageTool:
     def setup_method(self):
-        self.mcp = MagicMock()
-        self.fns = []
-        self.mcp.tool.return_value = lambda fn: self.fns.append(fn) or fn
+        self.mcp = _RecordingMCP()
+        self.fns = self.mcp.fns
         cred = MagicMock()
         cred.get.return_value = "test-token"
         register_tools(self.mcp, credentials=cred)
@@ -294,67 +394,69 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
-    def test_send_message_success(self, mock_request):
-        mock_request.return_value = MagicMock(
-            status_code=200,
-            json=MagicMock(
-                return_value={
-                    "id": "m123",
-                    "channel_id": "c1",
-                    "content": "Incident resolved",
-                }
-            ),
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_send_message_success(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            200,
+            json={
+                "id": "m123",
+                "channel_id": "c1",
+                "content": "Incident resolved",
+            },
         )
-        result = self._fn("discord_send_message")("c1", "Incident resolved")
+        result = await self._fn("discord_send_message")("c1", "Incident resolved")
         assert result["success"] is True
         assert result["message"]["content"] == "Incident resolved"
 
-    def test_send_message_length_validation(self):
+    @pytest.mark.asyncio
+    async def test_send_message_length_validation(self):
         long_content = "x" * (MAX_MESSAGE_LENGTH + 1)
-        result = self._fn("discord_send_message")("c1", long_content)
+        result = await self._fn("discord_send_message")("c1", long_content)
         assert "error" in result
         assert str(MAX_MESSAGE_LENGTH) in result["error"]
         assert result["max_length"] == MAX_MESSAGE_LENGTH
         assert result["provided"] == MAX_MESSAGE_LENGTH + 1
 
-    def test_send_message_exactly_at_limit(self):
+    @pytest.mark.asyncio
+    async def test_send_message_length_counts_utf16_units(self):
+        content = "\N{GRINNING FACE}" * (MAX_MESSAGE_LENGTH // 2 + 1)
+        assert len(content) < MAX_MESSAGE_LENGTH
+        result = await self._fn("discord_send_message")("c1", content)
+        assert "error" in result
+        assert result["provided"] == MAX_MESSAGE_LENGTH + 2
+
+    @pytest.mark.asyncio
+    async def test_send_message_exactly_at_limit(self):
         content = "x" * MAX_MESSAGE_LENGTH
-        with patch("aden_tools.tools.discord_tool.discord_tool.httpx.request") as mock_request:
-            mock_request.return_value = MagicMock(
-                status_code=200,
-                json=MagicMock(return_value={"id": "m1", "channel_id": "c1", "content": content}),
+        with patch(_REQUEST, new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = httpx.Response(
+                200, json={"id": "m1", "channel_id": "c1", "content": content}
             )
-            result = self._fn("discord_send_message")("c1", content)
+            result = await self._fn("discord_send_message")("c1", content)
         assert result["success"] is True
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
-    def test_send_message_rate_limit_429_exhausted(self, mock_request):
-        mock_request.return_value = MagicMock(
-            status_code=429,
-            json=MagicMock(return_value={"message": "Rate limit", "retry_after": 5}),
-            text='{"message": "Rate limit", "retry_after": 5}',
+    @pytest.mark.asyncio
+    @patch("aden_tools.tools.discord_tool.discord_tool.asyncio.sleep", new_callable=AsyncMock)
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_send_message_rate_limit_429_exhausted(self, mock_request, mock_sleep):
+        mock_request.return_value = httpx.Response(
+            429, json={"message": "Rate limit", "retry_after": 5}
         )
-        result = self._fn("discord_send_message")("c1", "Hello")
+        result = await self._fn("discord_send_message")("c1", "Hello")
         assert "error" in result
         assert "rate limit" in result["error"].lower()
         assert result.get("retry_after") == 5
         assert mock_request.call_count == MAX_RETRIES + 1
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
-    def test_send_message_rate_limit_then_success(self, mock_request):
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_send_message_rate_limit_then_success(self, mock_request):
         mock_request.side_effect = [
-            MagicMock(
-                status_code=429,
-                json=MagicMock(return_value={"retry_after": 0.01}),
-                text="{}",
-            ),
-            MagicMock(
-                status_code=200,
-                json=MagicMock(return_value={"id": "m1", "channel_id": "c1", "content": "Hi"}),
-            ),
+            httpx.Response(429, json={"retry_after": 0.01}),
+            httpx.Response(200, json={"id": "m1", "channel_id": "c1", "content": "Hi"}),
         ]
-        result = self._fn("discord_send_message")("c1", "Hi")
+        result = await self._fn("discord_send_message")("c1", "Hi")
         assert result["success"] is True
         assert result["message"]["content"] == "Hi"
         assert mock_request.call_count == 2
@@ -362,9 +464,8 @@ def test_send_message_rate_limit_then_success(self, mock_request):
 
 class TestDiscordGetMessagesTool:
     def setup_method(self):
-        self.mcp = MagicMock()
-        self.fns = []
-        self.mcp.tool.return_value = lambda fn: self.fns.append(fn) or fn
+        self.mcp = _RecordingMCP()
+        self.fns = self.mcp.fns
         cred = MagicMock()
         cred.get.return_value = "test-token"
         register_tools(self.mcp, credentials=cred)
@@ -372,21 +473,99 @@ def setup_method(self):
     def _fn(self, name):
         return next(f for f in self.fns if f.__name__ == name)
 
-    @patch("aden_tools.tools.discord_tool.discord_tool.httpx.request")
-    def test_get_messages_success(self, mock_request):
-        mock_request.return_value = MagicMock(
-            status_code=200,
-            json=MagicMock(
-                return_value=[
-                    {"id": "m1", "content": "First message"},
-                ]
-            ),
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_get_messages_success(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            200,
+            json=[
+                {"id": "m1", "content": "First message"},
+            ],
         )
-        result = self._fn("discord_get_messages")("c1", limit=10)
+        result = await self._fn("discord_get_messages")("c1", limit=10)
         assert result["success"] is True
         assert len(result["messages"]) == 1
         assert result["messages"][0]["content"] == "First message"
 
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_get_messages_over_page_size_pages(self, mock_request):
+        mock_request.side_effect = [
+            httpx.Response(200, json=[{"id": f"m{i}"} for i in range(n)]) for n in (100, 50)
+        ]
+        result = await self._fn("discord_get_messages")("c1", limit=150)
+        assert result["success"] is True
+        assert len(result["messages"]) == 150
+        assert mock_request.call_args_list[1][1]["params"]["limit"] == 50
+
+
+class TestDiscordBulkGetMessagesTool:
+    def setup_method(self):
+        self.mcp = _RecordingMCP()
+        self.fns = self.mcp.fns
+        cred = MagicMock()
+        cred.get.return_value = "test-token"
+        register_tools(self.mcp, credentials=cred)
+
+    def _fn(self, name):
+        return next(f for f in self.fns if f.__name__ == name)
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_bulk_get_messages_per_channel(self, mock_request):
+        async def by_url(method, url, **kwargs):
+            if "/channels/bad/" in url:
+                return httpx.Response(404, json={"message": "Unknown Channel"})
+            return httpx.Response(200, json=[{"id": "m1", "content": url}])
+
+        mock_request.side_effect = by_url
+        result = await self._fn("discord_bulk_get_messages")(["c1", "c2", "bad", "c1"])
+        assert result["success"] is True
+        assert list(result["channels"]) == ["c1", "c2", "bad"]
+        assert result["channels"]["c2"][0]["content"].endswith("/channels/c2/messages")
+        assert "404" in result["channels"]["bad"]["error"]
+        assert mock_request.call_count == 3
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_bulk_get_messages_network_error_is_per_channel(self, mock_request):
+        async def by_url(method, url, **kwargs):
+            if "/channels/slow/" in url:
+                raise httpx.ReadTimeout("timed out")
+            return httpx.Response(200, json=[])
+
+        mock_request.side_effect = by_url
+        result = await self._fn("discord_bulk_get_messages")(["c1", "slow"])
+        assert result["channels"] == {"c1": [], "slow": {"error": "Request timed out"}}
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_bulk_get_messages_pages_with_bounded_concurrency(self, mock_request):
+        in_flight = peak = 0
+
+        async def page(method, url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            size = kwargs["params"]["limit"]
+            return httpx.Response(200, json=[{"id": f"m{i}"} for i in range(size)])
+
+        mock_request.side_effect = page
+        ids = [f"c{i}" for i in range(MAX_BULK_CHANNELS)]
+        result = await self._fn("discord_bulk_get_messages")(ids, limit=150)
+        assert all(len(messages) == 150 for messages in result["channels"].values())
+        assert mock_request.call_count == 2 * MAX_BULK_CHANNELS
+        assert peak == discord_tool.MAX_CONCURRENT_READS
+
+    @pytest.mark.asyncio
+    async def test_bulk_get_messages_too_many_channels(self):
+        ids = [str(i) for i in range(MAX_BULK_CHANNELS + 1)]
+        result = await self._fn("discord_bulk_get_messages")(ids)
+        assert "error" in result
+        assert result["provided"] == MAX_BULK_CHANNELS + 1
+
 
 # --- Credential spec tests ---
 
@@ -411,4 +590,5 @@ def test_discord_spec_tools(self):
         assert "discord_list_channels" in spec.tools
         assert "discord_send_message" in spec.tools
         assert "discord_get_messages" in spec.tools
-        assert len(spec.tools) == 4
+        assert "discord_bulk_get_messages" in spec.tools
+        assert len(spec.tools) == 5
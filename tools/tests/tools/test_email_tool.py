@@ -2,10 +2,13 @@
 
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
+import resend
 from fastmcp import FastMCP
 
 from aden_tools.tools.email_tool import register_tools
+from aden_tools.tools.email_tool.email_tool import _resend_http_client
 
 
 @pytest.fixture
@@ -22,6 +25,45 @@ def reply_email_fn(mcp: FastMCP):
     return mcp._tool_manager._tools["gmail_reply_email"].fn
 
 
+@pytest.fixture(autouse=True)
+def _no_recipient_override(monkeypatch):
+    """Keep a developer's EMAIL_OVERRIDE_TO from rewriting recipients under test."""
+    monkeypatch.delenv("EMAIL_OVERRIDE_TO", raising=False)
+
+
+@pytest.fixture
+def resend_env(monkeypatch):
+    """Configure Resend with a test key and sender."""
+    monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
+    monkeypatch.setenv("EMAIL_FROM", "test@example.com")
+
+
+class _FakeResend:
+    """In-process stand-in for resend.Emails.send that records each payload."""
+
+    def __init__(self):
+        self.payloads: list[dict] = []
+        self.error: Exception | None = None
+
+    @property
+    def last(self) -> dict:
+        return self.payloads[-1]
+
+    def send(self, payload: dict) -> dict:
+        if self.error is not None:
+            raise self.error
+        self.payloads.append(payload)
+        return {"id": f"email_{len(self.payloads)}"}
+
+
+@pytest.fixture
+def fake_resend(monkeypatch) -> _FakeResend:
+    """Route resend.Emails.send to a recording fake."""
+    fake = _FakeResend()
+    monkeypatch.setattr(resend.Emails, "send", fake.send)
+    return fake
+
+
 class TestSendEmail:
     """Tests for send_email tool."""
 
@@ -67,274 +109,201 @@ def test_missing_from_email_returns_error(self, send_email_fn, monkeypatch):
         assert "Sender email is required" in result["error"]
         assert "help" in result
 
-    def test_from_email_falls_back_to_env_var(self, send_email_fn, monkeypatch):
+    def test_from_email_falls_back_to_env_var(self, send_email_fn, fake_resend, monkeypatch):
         """EMAIL_FROM env var is used when from_email not provided."""
         monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
         monkeypatch.setenv("EMAIL_FROM", "default@company.com")
 
-        with patch("resend.Emails.send") as mock_send:
-            mock_send.return_value = {"id": "email_env"}
-            result = send_email_fn(
-                to="test@example.com", subject="Test", html="<p>Hi</p>", provider="resend"
-            )
+        result = send_email_fn(
+            to="test@example.com", subject="Test", html="<p>Hi</p>", provider="resend"
+        )
 
         assert result["success"] is True
-        call_args = mock_send.call_args[0][0]
+        call_args = fake_resend.last
         assert call_args["from"] == "default@company.com"
 
-    def test_explicit_from_email_overrides_env_var(self, send_email_fn, monkeypatch):
+    def test_explicit_from_email_overrides_env_var(self, send_email_fn, fake_resend, monkeypatch):
         """Explicit from_email overrides EMAIL_FROM env var."""
         monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
         monkeypatch.setenv("EMAIL_FROM", "default@company.com")
 
-        with patch("resend.Emails.send") as mock_send:
-            mock_send.return_value = {"id": "email_override"}
-            result = send_email_fn(
-                to="test@example.com",
-                subject="Test",
-                html="<p>Hi</p>",
-                from_email="custom@other.com",
-                provider="resend",
-            )
+        result = send_email_fn(
+            to="test@example.com",
+            subject="Test",
+            html="<p>Hi</p>",
+            from_email="custom@other.com",
+            provider="resend",
+        )
 
         assert result["success"] is True
-        call_args = mock_send.call_args[0][0]
+        call_args = fake_resend.last
         assert call_args["from"] == "custom@other.com"
 
-    def test_empty_recipient_returns_error(self, send_email_fn, monkeypatch):
+    def test_empty_recipient_returns_error(self, send_email_fn, resend_env):
         """Empty recipient returns error."""
-        monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
-        monkeypatch.setenv("EMAIL_FROM", "test@example.com")
-
         result = send_email_fn(to="", subject="Test", html="<p>Hi</p>", provider="resend")
 
         assert "error" in result
 
-    def test_empty_subject_returns_error(self, send_email_fn, monkeypatch):
+    def test_empty_subject_returns_error(self, send_email_fn, resend_env):
         """Empty subject returns error."""
-        monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
-        monkeypatch.setenv("EMAIL_FROM", "test@example.com")
-
         result = send_email_fn(
             to="test@example.com", subject="", html="<p>Hi</p>", provider="resend"
         )
 
         assert "error" in result
 
-    def test_subject_too_long_returns_error(self, send_email_fn, monkeypatch):
+    def test_subject_too_long_returns_error(self, send_email_fn, resend_env):
         """Subject over 998 chars returns error."""
-        monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
-        monkeypatch.setenv("EMAIL_FROM", "test@example.com")
-
         result = send_email_fn(
             to="test@example.com", subject="x" * 999, html="<p>Hi</p>", provider="resend"
         )
 
         assert "error" in result
 
-    def test_empty_html_returns_error(self, send_email_fn, monkeypatch):
+    def test_empty_html_returns_error(self, send_email_fn, resend_env):
         """Empty HTML body returns error."""
-        monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
-        monkeypatch.setenv("EMAIL_FROM", "test@example.com")
-
         result = send_email_fn(to="test@example.com", subject="Test", html="", provider="resend")
 
         assert "error" in result
 
-    def test_to_string_normalized_to_list(self, send_email_fn, monkeypatch):
+    def test_to_string_normalized_to_list(self, send_email_fn, fake_resend, resend_env):
         """Single string 'to' is accepted and normalized."""
-        monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
-        monkeypatch.setenv("EMAIL_FROM", "test@example.com")
-
-        with patch("resend.Emails.send") as mock_send:
-            mock_send.return_value = {"id": "email_123"}
-            result = send_email_fn(
-                to="test@example.com", subject="Test", html="<p>Hi</p>", provider="resend"
-            )
+        result = send_email_fn(
+            to="test@example.com", subject="Test", html="<p>Hi</p>", provider="resend"
+        )
 
         assert result["success"] is True
-        mock_send.assert_called_once()
+        assert len(fake_resend.payloads) == 1
 
-    def test_to_list_accepted(self, send_email_fn, monkeypatch):
+    def test_to_list_accepted(self, send_email_fn, fake_resend, resend_env):
         """List of recipients is accepted."""
-        monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
-        monkeypatch.setenv("EMAIL_FROM", "test@example.com")
-
-        with patch("resend.Emails.send") as mock_send:
-            mock_send.return_value = {"id": "email_456"}
-            result = send_email_fn(
-                to=["a@example.com", "b@example.com"],
-                subject="Test",
-                html="<p>Hi</p>",
-                provider="resend",
-            )
+        result = send_email_fn(
+            to=["a@example.com", "b@example.com"],
+            subject="Test",
+            html="<p>Hi</p>",
+            provider="resend",
+        )
 
         assert result["success"] is True
         assert result["to"] == ["a@example.com", "b@example.com"]
 
-    def test_cc_string_passed_to_provider(self, send_email_fn, monkeypatch):
+    def test_cc_string_passed_to_provider(self, send_email_fn, fake_resend, resend_env):
         """Single CC string is passed to the provider."""
-        monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
-        monkeypatch.setenv("EMAIL_FROM", "test@example.com")
-
-        with patch("resend.Emails.send") as mock_send:
-            mock_send.return_value = {"id": "email_cc"}
-            result = send_email_fn(
-                to="test@example.com",
-                subject="Test",
-                html="<p>Hi</p>",
-                cc="cc@example.com",
-                provider="resend",
-            )
+        result = send_email_fn(
+            to="test@example.com",
+            subject="Test",
+            html="<p>Hi</p>",
+            cc="cc@example.com",
+            provider="resend",
+        )
 
         assert result["success"] is True
-        call_args = mock_send.call_args[0][0]
+        call_args = fake_resend.last
         assert call_args["cc"] == ["cc@example.com"]
 
-    def test_bcc_string_passed_to_provider(self, send_email_fn, monkeypatch):
+    def test_bcc_string_passed_to_provider(self, send_email_fn, fake_resend, resend_env):
         """Single BCC string is passed to the provider."""
-        monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
-        monkeypatch.setenv("EMAIL_FROM", "test@example.com")
-
-        with patch("resend.Emails.send") as mock_send:
-            mock_send.return_value = {"id": "email_bcc"}
-            result = send_email_fn(
-                to="test@example.com",
-                subject="Test",
-                html="<p>Hi</p>",
-                bcc="bcc@example.com",
-                provider="resend",
-            )
+        result = send_email_fn(
+            to="test@example.com",
+            subject="Test",
+            html="<p>Hi</p>",
+            bcc="bcc@example.com",
+            provider="resend",
+        )
 
         assert result["success"] is True
-        call_args = mock_send.call_args[0][0]
+        call_args = fake_resend.last
         assert call_args["bcc"] == ["bcc@example.com"]
 
-    def test_cc_and_bcc_lists_passed_to_provider(self, send_email_fn, monkeypatch):
+    def test_cc_and_bcc_lists_passed_to_provider(self, send_email_fn, fake_resend, resend_env):
         """CC and BCC lists are passed to the provider."""
-        monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
-        monkeypatch.setenv("EMAIL_FROM", "test@example.com")
-
-        with patch("resend.Emails.send") as mock_send:
-            mock_send.return_value = {"id": "email_cc_bcc"}
-            result = send_email_fn(
-                to="test@example.com",
-                subject="Test",
-                html="<p>Hi</p>",
-                cc=["cc1@example.com", "cc2@example.com"],
-                bcc=["bcc1@example.com"],
-                provider="resend",
-            )
+        result = send_email_fn(
+            to="test@example.com",
+            subject="Test",
+            html="<p>Hi</p>",
+            cc=["cc1@example.com", "cc2@example.com"],
+            bcc=["bcc1@example.com"],
+            provider="resend",
+        )
 
         assert result["success"] is True
-        call_args = mock_send.call_args[0][0]
+        call_args = fake_resend.last
         assert call_args["cc"] == ["cc1@example.com", "cc2@example.com"]
         assert call_args["bcc"] == ["bcc1@example.com"]
 
-    def test_none_cc_bcc_not_included_in_payload(self, send_email_fn, monkeypatch):
+    def test_none_cc_bcc_not_included_in_payload(self, send_email_fn, fake_resend, resend_env):
         """None cc/bcc are not included in the API payload."""
-        monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
-        monkeypatch.setenv("EMAIL_FROM", "test@example.com")
+        send_email_fn(to="test@example.com", subject="Test", html="<p>Hi</p>", provider="resend")
 
-        with patch("resend.Emails.send") as mock_send:
-            mock_send.return_value = {"id": "email_no_cc"}
-            send_email_fn(
-                to="test@example.com", subject="Test", html="<p>Hi</p>", provider="resend"
-            )
-
-        call_args = mock_send.call_args[0][0]
+        call_args = fake_resend.last
         assert "cc" not in call_args
         assert "bcc" not in call_args
 
-    def test_empty_string_cc_not_included(self, send_email_fn, monkeypatch):
+    def test_empty_string_cc_not_included(self, send_email_fn, fake_resend, resend_env):
         """Empty string cc is treated as None and not included."""
-        monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
-        monkeypatch.setenv("EMAIL_FROM", "test@example.com")
-
-        with patch("resend.Emails.send") as mock_send:
-            mock_send.return_value = {"id": "email_empty_cc"}
-            send_email_fn(
-                to="test@example.com",
-                subject="Test",
-                html="<p>Hi</p>",
-                cc="",
-                bcc="",
-                provider="resend",
-            )
+        send_email_fn(
+            to="test@example.com",
+            subject="Test",
+            html="<p>Hi</p>",
+            cc="",
+            bcc="",
+            provider="resend",
+        )
 
-        call_args = mock_send.call_args[0][0]
+        call_args = fake_resend.last
         assert "cc" not in call_args
         assert "bcc" not in call_args
 
-    def test_whitespace_cc_not_included(self, send_email_fn, monkeypatch):
+    def test_whitespace_cc_not_included(self, send_email_fn, fake_resend, resend_env):
         """Whitespace-only cc is treated as None."""
-        monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
-        monkeypatch.setenv("EMAIL_FROM", "test@example.com")
-
-        with patch("resend.Emails.send") as mock_send:
-            mock_send.return_value = {"id": "email_ws_cc"}
-            send_email_fn(
-                to="test@example.com", subject="Test", html="<p>Hi</p>", cc="   ", provider="resend"
-            )
+        send_email_fn(
+            to="test@example.com", subject="Test", html="<p>Hi</p>", cc="   ", provider="resend"
+        )
 
-        call_args = mock_send.call_args[0][0]
+        call_args = fake_resend.last
         assert "cc" not in call_args
 
-    def test_empty_list_cc_not_included(self, send_email_fn, monkeypatch):
+    def test_empty_list_cc_not_included(self, send_email_fn, fake_resend, resend_env):
         """Empty list cc is treated as None."""
-        monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
-        monkeypatch.setenv("EMAIL_FROM", "test@example.com")
-
-        with patch("resend.Emails.send") as mock_send:
-            mock_send.return_value = {"id": "email_empty_list"}
-            send_email_fn(
-                to="test@example.com",
-                subject="Test",
-                html="<p>Hi</p>",
-                cc=[],
-                bcc=[],
-                provider="resend",
-            )
+        send_email_fn(
+            to="test@example.com",
+            subject="Test",
+            html="<p>Hi</p>",
+            cc=[],
+            bcc=[],
+            provider="resend",
+        )
 
-        call_args = mock_send.call_args[0][0]
+        call_args = fake_resend.last
         assert "cc" not in call_args
         assert "bcc" not in call_args
 
-    def test_list_with_empty_strings_filtered(self, send_email_fn, monkeypatch):
+    def test_list_with_empty_strings_filtered(self, send_email_fn, fake_resend, resend_env):
         """List containing empty strings filters them out."""
-        monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
-        monkeypatch.setenv("EMAIL_FROM", "test@example.com")
-
-        with patch("resend.Emails.send") as mock_send:
-            mock_send.return_value = {"id": "email_filtered"}
-            send_email_fn(
-                to="test@example.com",
-                subject="Test",
-                html="<p>Hi</p>",
-                cc=["", "valid@example.com", "  "],
-                provider="resend",
-            )
+        send_email_fn(
+            to="test@example.com",
+            subject="Test",
+            html="<p>Hi</p>",
+            cc=["", "valid@example.com", "  "],
+            provider="resend",
+        )
 
-        call_args = mock_send.call_args[0][0]
+        call_args = fake_resend.last
         assert call_args["cc"] == ["valid@example.com"]
 
-    def test_list_of_only_empty_strings_not_included(self, send_email_fn, monkeypatch):
+    def test_list_of_only_empty_strings_not_included(self, send_email_fn, fake_resend, resend_env):
         """List of only empty/whitespace strings is treated as None."""
-        monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
-        monkeypatch.setenv("EMAIL_FROM", "test@example.com")
-
-        with patch("resend.Emails.send") as mock_send:
-            mock_send.return_value = {"id": "email_all_empty"}
-            send_email_fn(
-                to="test@example.com",
-                subject="Test",
-                html="<p>Hi</p>",
-                cc=["", "  "],
-                bcc=[""],
-                provider="resend",
-            )
+        send_email_fn(
+            to="test@example.com",
+            subject="Test",
+            html="<p>Hi</p>",
+            cc=["", "  "],
+            bcc=[""],
+            provider="resend",
+        )
 
-        call_args = mock_send.call_args[0][0]
+        call_args = fake_resend.last
         assert "cc" not in call_args
         assert "bcc" not in call_args
 
@@ -342,33 +311,152 @@ def test_list_of_only_empty_strings_not_included(self, send_email_fn, monkeypatc
 class TestResendProvider:
     """Tests for Resend email provider."""
 
-    def test_resend_success(self, send_email_fn, monkeypatch):
+    def test_resend_success(self, send_email_fn, fake_resend, resend_env):
         """Successful send returns success dict with message ID."""
-        monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
-        monkeypatch.setenv("EMAIL_FROM", "test@example.com")
-
-        with patch("resend.Emails.send") as mock_send:
-            mock_send.return_value = {"id": "email_789"}
-            result = send_email_fn(
-                to="test@example.com", subject="Test", html="<p>Hi</p>", provider="resend"
-            )
+        result = send_email_fn(
+            to="test@example.com", subject="Test", html="<p>Hi</p>", provider="resend"
+        )
 
         assert result["success"] is True
         assert result["provider"] == "resend"
-        assert result["id"] == "email_789"
+        assert result["id"] == "email_1"
 
-    def test_resend_api_error(self, send_email_fn, monkeypatch):
+    def test_resend_api_error(self, send_email_fn, fake_resend, resend_env):
         """Resend API error returns error dict."""
-        monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
-        monkeypatch.setenv("EMAIL_FROM", "test@example.com")
+        fake_resend.error = Exception("API rate limit exceeded")
+        result = send_email_fn(
+            to="test@example.com", subject="Test", html="<p>Hi</p>", provider="resend"
+        )
 
-        with patch("resend.Emails.send") as mock_send:
-            mock_send.side_effect = Exception("API rate limit exceeded")
+        assert "error" in result
+
+    @pytest.fixture
+    def pooled_transport(self, monkeypatch):
+        """Install the pooled transport fresh and restore the SDK default afterwards."""
+        monkeypatch.setattr(resend, "default_http_client", resend.default_http_client)
+        _resend_http_client.cache_clear()
+        yield
+        _resend_http_client.cache_clear()
+
+    def test_resend_sends_over_pooled_client(self, send_email_fn, resend_env, pooled_transport):
+        """Sends go through one shared keep-alive httpx.Client, not a client per call."""
+
+        with patch.object(httpx.Client, "request") as mock_request:
+            mock_request.return_value = httpx.Response(200, json={"id": "email_pooled"})
+            first = send_email_fn(
+                to="a@example.com", subject="One", html="<p>1</p>", provider="resend"
+            )
+            second = send_email_fn(
+                to="b@example.com", subject="Two", html="<p>2</p>", provider="resend"
+            )
+
+        assert first["id"] == second["id"] == "email_pooled"
+        assert resend.default_http_client is _resend_http_client()
+        assert mock_request.call_count == 2
+        assert {call.args[0] for call in mock_request.call_args_list} == {"post"}
+        assert mock_request.call_args.kwargs["json"]["to"] == ["b@example.com"]
+        assert mock_request.call_args.kwargs["headers"]["Authorization"] == "Bearer re_test_key"
+
+    def test_transport_installed_once(self, pooled_transport, monkeypatch):
+        """The SDK default is set when the transport is created, not on every send."""
+        client = _resend_http_client()
+        other = object()
+        monkeypatch.setattr(resend, "default_http_client", other)
+
+        assert _resend_http_client() is client
+        assert resend.default_http_client is other
+
+    def test_resend_transport_error(self, send_email_fn, resend_env, pooled_transport):
+        """Network failures on the pooled client surface as a Resend API error."""
+
+        with patch.object(httpx.Client, "request", side_effect=httpx.ConnectError("refused")):
             result = send_email_fn(
                 to="test@example.com", subject="Test", html="<p>Hi</p>", provider="resend"
             )
 
+        assert result["error"].startswith("Resend API error")
+
+
+class TestSendEmailBatch:
+    """Tests for send_email_batch tool."""
+
+    @pytest.fixture
+    def send_batch_fn(self, mcp: FastMCP, monkeypatch):
+        monkeypatch.setenv("RESEND_API_KEY", "re_test_key")
+        monkeypatch.setenv("EMAIL_FROM", "default@company.com")
+        register_tools(mcp)
+        return mcp._tool_manager._tools["send_email_batch"].fn
+
+    def test_batch_sends_one_request(self, send_batch_fn):
+        """All messages go out in a single Batch.send call."""
+        with patch("resend.Batch.send") as mock_send:
+            mock_send.return_value = {"data": [{"id": "e1"}, {"id": "e2"}]}
+            result = send_batch_fn(
+                emails=[
+                    {"to": "a@example.com", "subject": "A", "html": "<p>A</p>"},
+                    {
+                        "to": ["b@example.com"],
+                        "subject": "B",
+                        "html": "<p>B</p>",
+                        "cc": "c@example.com",
+                        "from_email": "team@company.com",
+                    },
+                ]
+            )
+
+        assert result == {"success": True, "provider": "resend", "ids": ["e1", "e2"], "count": 2}
+        mock_send.assert_called_once()
+        payloads = mock_send.call_args[0][0]
+        assert payloads[0] == {
+            "from": "default@company.com",
+            "to": ["a@example.com"],
+            "subject": "A",
+            "html": "<p>A</p>",
+        }
+        assert payloads[1]["from"] == "team@company.com"
+        assert payloads[1]["cc"] == ["c@example.com"]
+
+    def test_batch_invalid_message_sends_nothing(self, send_batch_fn):
+        """One invalid message rejects the whole batch, naming its position."""
+        with patch("resend.Batch.send") as mock_send:
+            result = send_batch_fn(
+                emails=[
+                    {"to": "a@example.com", "subject": "A", "html": "<p>A</p>"},
+                    {"to": "b@example.com", "subject": "", "html": "<p>B</p>"},
+                ]
+            )
+
+        assert result["error"] == "Email 1: Subject must be 1-998 characters"
+        mock_send.assert_not_called()
+
+    def test_batch_size_limit(self, send_batch_fn):
+        """More than 100 messages is rejected before sending."""
+        email = {"to": "a@example.com", "subject": "A", "html": "<p>A</p>"}
+        result = send_batch_fn(emails=[email] * 101)
         assert "error" in result
+        assert result["provided"] == 101
+
+    def test_batch_rejects_non_dict_message(self, send_batch_fn):
+        """Each message must be a dict."""
+        result = send_batch_fn(emails=["a@example.com"])
+        assert result["error"] == "Email 0: expected a dict with to, subject and html"
+
+    def test_batch_override_to(self, send_batch_fn, monkeypatch):
+        """EMAIL_OVERRIDE_TO redirects every message in the batch."""
+        monkeypatch.setenv("EMAIL_OVERRIDE_TO", "qa@company.com")
+        with patch("resend.Batch.send") as mock_send:
+            mock_send.return_value = {"data": [{"id": "e1"}]}
+            send_batch_fn(emails=[{"to": "a@example.com", "subject": "A", "html": "<p>A</p>"}])
+
+        payload = mock_send.call_args[0][0][0]
+        assert payload["to"] == ["qa@company.com"]
+        assert payload["subject"] == "[TEST -> a@example.com] A"
+
+    def test_batch_missing_key(self, send_batch_fn, monkeypatch):
+        """No Resend key returns the configuration error."""
+        monkeypatch.delenv("RESEND_API_KEY")
+        result = send_batch_fn(emails=[{"to": "a@example.com", "subject": "A", "html": "<p>A</p>"}])
+        assert "Resend credentials not configured" in result["error"]
 
 
 class TestGmailProvider:
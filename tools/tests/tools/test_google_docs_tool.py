@@ -0,0 +1,678 @@
+"""
+Tests for Google Docs tool.
+
+Covers:
+- Image URI validation
+- _GoogleDocsClient methods and error handling
+- Retry with backoff on transient errors
+- Client-side rate limiting
+- Service-account token caching
+- MCP tool functions
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import gzip
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from aden_tools.tools.google_docs_tool import google_docs_tool
+from aden_tools.tools.google_docs_tool.google_docs_tool import (
+    MAX_RETRIES,
+    _create_service_account_token,
+    _GoogleDocsClient,
+    _TokenBucket,
+    _validate_image_uri,
+    register_tools,
+)
+
+_REQUEST = "aden_tools.tools.google_docs_tool.google_docs_tool.httpx.AsyncClient.request"
+_SLEEP = "aden_tools.tools.google_docs_tool.google_docs_tool.asyncio.sleep"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_limiter(monkeypatch):
+    """Give each test a full bucket so earlier tests never throttle it."""
+    monkeypatch.setattr(google_docs_tool, "_DOCS_LIMITER", _TokenBucket(rate=8.0, capacity=16))
+
+
+def _sent_json(mock_request: AsyncMock) -> Any:
+    """Decode the JSON body of the last request."""
+    return json.loads(mock_request.call_args.kwargs["content"])
+
+
+def test_rgb_color():
+    assert google_docs_tool._rgb_color(None, None, None) is None
+    assert google_docs_tool._rgb_color(None, 0.5, 0.0) == {"red": 0.0, "green": 0.5, "blue": 0.0}
+
+
+# --- Image URI validation ---
+
+
+@pytest.mark.parametrize(
+    "uri",
+    ["https://example.com/a.png", "http://localhost:8080/x.png", "https://10.0.0.1/i.jpg?s=1"],
+)
+def test_valid_image_uri(uri):
+    assert _validate_image_uri(uri) is None
+
+
+@pytest.mark.parametrize(
+    ("uri", "fragment"),
+    [
+        ("", "empty"),
+        ("example.com/a.png", "missing scheme"),
+        ("ftp://example.com/a.png", "scheme"),
+        ("https:///a.png", "missing domain"),
+        ("https://exa_mple.com/a.png", "format"),
+        ("https://example.com/a b.png", "format"),
+    ],
+)
+def test_invalid_image_uri(uri, fragment):
+    assert fragment in _validate_image_uri(uri)["error"]
+
+
+# --- _GoogleDocsClient tests ---
+
+
+class TestGoogleDocsClient:
+    def setup_method(self):
+        self.client = _GoogleDocsClient("test-token")
+
+    def test_headers(self):
+        assert self.client._headers["Authorization"] == "Bearer test-token"
+
+    @pytest.mark.parametrize(
+        ("status_code", "fragment"),
+        [(401, "expired"), (403, "permissions"), (404, "not found"), (429, "rate limit")],
+    )
+    def test_handle_response_errors(self, status_code, fragment):
+        result = self.client._handle_response(httpx.Response(status_code))
+        assert fragment in result["error"].lower()
+
+    def test_handle_response_empty_success(self):
+        assert self.client._handle_response(httpx.Response(204)) == {"success": True}
+
+    def test_handle_response_api_error_detail(self):
+        response = httpx.Response(400, json={"error": {"message": "Invalid range"}})
+        result = self.client._handle_response(response)
+        assert result["error"] == "Google Docs API error (HTTP 400): Invalid range"
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_create_document(self, mock_request):
+        mock_request.return_value = httpx.Response(200, json={"documentId": "d1", "title": "Notes"})
+        result = await self.client.create_document("Notes")
+        assert result["documentId"] == "d1"
+        method, url = mock_request.call_args.args
+        assert method == "POST"
+        assert url.endswith("/documents")
+        assert mock_request.call_args.kwargs["params"] == {"fields": "documentId,title"}
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_get_document_fields_mask(self, mock_request):
+        mock_request.return_value = httpx.Response(200, json={"title": "Notes"})
+        await self.client.get_document("d1", fields="title")
+        assert mock_request.call_args.kwargs["params"] == {"fields": "title"}
+        assert mock_request.call_args.args[1] == "https://docs.googleapis.com/v1/documents/d1"
+
+        await self.client.get_document("d1")
+        assert mock_request.call_args.kwargs["params"] is None
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_format_text_fields_mask(self, mock_request):
+        mock_request.return_value = httpx.Response(200, json={"replies": [{}]})
+        await self.client.format_text("d1", 1, 5, underline=False, bold=True, font_size_pt=12)
+
+        request = _sent_json(mock_request)["requests"][0]["updateTextStyle"]
+        assert request["fields"] == "bold,underline,fontSize"
+        assert request["textStyle"]["fontSize"] == {"magnitude": 12, "unit": "PT"}
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_insert_text_without_index_appends(self, mock_request):
+        mock_request.return_value = httpx.Response(200, json={"replies": [{}]})
+        await self.client.insert_text("d1", "hello")
+
+        assert mock_request.call_count == 1  # no document fetch for the end index
+        request = _sent_json(mock_request)["requests"][0]
+        assert request == {"insertText": {"endOfSegmentLocation": {}, "text": "hello"}}
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_export_document_base64(self, mock_request):
+        mock_request.return_value = httpx.Response(200, content=b"%PDF")
+        result = await self.client.export_document("d1")
+        assert result["content_base64"] == "JVBERg=="
+        assert result["size_bytes"] == 4
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_export_document_large_encodes_off_loop(self, mock_request):
+        content = b"\x00" * (google_docs_tool.INLINE_ENCODE_THRESHOLD + 1)
+        mock_request.return_value = httpx.Response(200, content=content)
+        with patch.object(
+            google_docs_tool.asyncio, "to_thread", wraps=asyncio.to_thread
+        ) as to_thread:
+            result = await self.client.export_document("d1")
+        to_thread.assert_called_once()
+        assert base64.b64decode(result["content_base64"]) == content
+
+    @pytest.mark.asyncio
+    async def test_get_document_negotiates_gzip(self, monkeypatch):
+        doc = {"documentId": "d1", "body": {"content": [{"endIndex": 1}] * 200}}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert "gzip" in request.headers["Accept-Encoding"]
+            body = gzip.compress(json.dumps(doc).encode())
+            return httpx.Response(200, content=body, headers={"Content-Encoding": "gzip"})
+
+        transport = httpx.MockTransport(handler)
+        monkeypatch.setattr(
+            google_docs_tool, "get_shared_client", lambda: httpx.AsyncClient(transport=transport)
+        )
+        assert await self.client.get_document("d1") == doc
+
+
+class TestRetry:
+    def setup_method(self):
+        self.client = _GoogleDocsClient("test-token")
+
+    @pytest.mark.asyncio
+    @patch(_SLEEP, new_callable=AsyncMock)
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_read_retries_transient_status(self, mock_request, mock_sleep):
+        mock_request.side_effect = [
+            httpx.Response(503),
+            httpx.Response(200, json={"documentId": "d1"}),
+        ]
+        result = await self.client.get_document("d1")
+        assert result == {"documentId": "d1"}
+        assert mock_request.call_count == 2
+        mock_sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch(_SLEEP, new_callable=AsyncMock)
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_read_retries_read_timeout(self, mock_request, mock_sleep):
+        mock_request.side_effect = [
+            httpx.ReadTimeout("slow"),
+            httpx.Response(200, json={"comments": []}),
+        ]
+        result = await self.client.list_comments("d1")
+        assert result == {"comments": []}
+
+    @pytest.mark.asyncio
+    @patch(_SLEEP, new_callable=AsyncMock)
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_write_not_retried_on_500(self, mock_request, mock_sleep):
+        mock_request.return_value = httpx.Response(500, json={"error": {"message": "boom"}})
+        result = await self.client.batch_update("d1", [])
+        assert "HTTP 500" in result["error"]
+        assert mock_request.call_count == 1
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @patch(_SLEEP, new_callable=AsyncMock)
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_retry_after_honored_then_gives_up(self, mock_request, mock_sleep):
+        mock_request.return_value = httpx.Response(429, headers={"Retry-After": "2"})
+        result = await self.client.batch_update("d1", [])
+        assert "rate limit" in result["error"]
+        assert mock_request.call_count == MAX_RETRIES + 1
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [2.0] * MAX_RETRIES
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    @patch(_SLEEP, new_callable=AsyncMock)
+    async def test_burst_then_throttle(self, mock_sleep):
+        # A slow rate so refill during the test itself is negligible
+        bucket = _TokenBucket(rate=0.01, capacity=2)
+        for _ in range(2):
+            await bucket.acquire()
+        mock_sleep.assert_not_awaited()
+
+        await bucket.acquire()
+        await bucket.acquire()
+        waits = [c.args[0] for c in mock_sleep.await_args_list]
+        assert waits == pytest.approx([100.0, 200.0], rel=1e-3)
+
+    def test_rate_from_env(self, monkeypatch):
+        monkeypatch.setenv("GOOGLE_DOCS_RPS", "2.5")
+        assert google_docs_tool._requests_per_second() == 2.5
+        monkeypatch.setenv("GOOGLE_DOCS_RPS", "fast")
+        assert google_docs_tool._requests_per_second() == 8.0
+
+
+@pytest.fixture
+def service_account_json():
+    rsa = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.rsa")
+    serialization = pytest.importorskip("cryptography.hazmat.primitives.serialization")
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    return json.dumps(
+        {"type": "service_account", "private_key": pem, "client_email": "sa@example.com"}
+    )
+
+
+class TestServiceAccountToken:
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self, monkeypatch):
+        monkeypatch.setattr(google_docs_tool, "_TOKEN_CACHE", {})
+        monkeypatch.setattr(google_docs_tool, "_GOOGLE_AUTH_CREDENTIALS", {})
+
+    @pytest.fixture
+    def hand_rolled(self, monkeypatch):
+        """Force the JWT fallback even if google-auth is installed."""
+        monkeypatch.setattr(google_docs_tool, "_google_auth_available", lambda: False)
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_token_cached_until_expiry(self, mock_request, service_account_json, hand_rolled):
+        mock_request.return_value = httpx.Response(
+            200, json={"access_token": "t1", "expires_in": 3600}
+        )
+        assert await _create_service_account_token(service_account_json) == "t1"
+        assert await _create_service_account_token(service_account_json) == "t1"
+        assert mock_request.call_count == 1
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_token_refreshed_near_expiry(
+        self, mock_request, service_account_json, hand_rolled
+    ):
+        mock_request.side_effect = [
+            httpx.Response(200, json={"access_token": "t1", "expires_in": 30}),
+            httpx.Response(200, json={"access_token": "t2", "expires_in": 3600}),
+        ]
+        assert await _create_service_account_token(service_account_json) == "t1"
+        assert await _create_service_account_token(service_account_json) == "t2"
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_private_key_parsed_once(self, mock_request, service_account_json, hand_rolled):
+        mock_request.return_value = httpx.Response(
+            200, json={"access_token": "t1", "expires_in": 30}
+        )
+        google_docs_tool._load_private_key.cache_clear()
+        for _ in range(3):
+            await _create_service_account_token(service_account_json)
+
+        assert mock_request.call_count == 3  # each token was too short-lived to cache
+        info = google_docs_tool._load_private_key.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_google_auth_preferred(self, mock_request, monkeypatch, service_account_json):
+        monkeypatch.setattr(google_docs_tool, "_google_auth_available", lambda: True)
+        fetch = MagicMock(return_value="ga-token")
+        monkeypatch.setattr(google_docs_tool, "_google_auth_token", fetch)
+
+        assert await _create_service_account_token(service_account_json) == "ga-token"
+        mock_request.assert_not_called()
+        assert fetch.call_args.args[1]["client_email"] == "sa@example.com"
+
+
+class TestCompose:
+    def setup_method(self):
+        self.client = _GoogleDocsClient("test-token")
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_ops_sent_in_one_batch(self, mock_request):
+        mock_request.return_value = httpx.Response(200, json={"replies": [{}, {}, {}]})
+        ops = [
+            {"op": "insert_text", "text": "Title\n", "index": 1},
+            {"op": "format_text", "start_index": 1, "end_index": 6, "bold": True},
+            {"op": "create_list", "start_index": 1, "end_index": 6},
+        ]
+        await self.client.compose("d1", ops)
+
+        assert mock_request.call_count == 1
+        requests = _sent_json(mock_request)["requests"]
+        assert [next(iter(r)) for r in requests] == [
+            "insertText",
+            "updateTextStyle",
+            "createParagraphBullets",
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("ops", "fragment"),
+        [
+            ([], "No operations"),
+            ([{"op": "delete_everything"}], "unknown op"),
+            ([{"op": "format_text", "start_index": 1, "end_index": 2}], "No formatting"),
+            ([{"op": "insert_text", "text": "x", "colour": "red"}], "invalid parameters"),
+        ],
+    )
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_invalid_ops_rejected_before_request(self, mock_request, ops, fragment):
+        result = await self.client.compose("d1", ops)
+        assert fragment in result["error"]
+        mock_request.assert_not_called()
+
+
+class TestListAllComments:
+    def setup_method(self):
+        self.client = _GoogleDocsClient("test-token")
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_follows_page_tokens(self, mock_request):
+        mock_request.side_effect = [
+            httpx.Response(
+                200, json={"comments": [{"id": "c1"}, {"id": "c2"}], "nextPageToken": "p2"}
+            ),
+            httpx.Response(200, json={"comments": [{"id": "c3"}]}),
+        ]
+        result = await self.client.list_all_comments("d1", max_total=500)
+
+        assert [c["id"] for c in result] == ["c1", "c2", "c3"]
+        second_params = mock_request.call_args_list[1].kwargs["params"]
+        assert second_params["pageToken"] == "p2"
+        assert second_params["fields"].startswith("comments(id,content,author/displayName,")
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_custom_fields(self, mock_request):
+        mock_request.return_value = httpx.Response(200, json={"comments": []})
+        await self.client.list_comments("d1", fields="id,htmlContent")
+        fields = mock_request.call_args.kwargs["params"]["fields"]
+        assert fields == "comments(id,htmlContent),nextPageToken"
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_stops_at_max_total(self, mock_request):
+        def page(size: int) -> httpx.Response:
+            comments = [{"id": str(i)} for i in range(size)]
+            return httpx.Response(200, json={"comments": comments, "nextPageToken": "more"})
+
+        mock_request.side_effect = [page(100), page(50)]
+        result = await self.client.list_all_comments("d1", max_total=150)
+
+        assert len(result) == 150
+        assert mock_request.call_args.kwargs["params"]["pageSize"] == 50
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_error_page_returned(self, mock_request):
+        mock_request.return_value = httpx.Response(404)
+        result = await self.client.list_all_comments("d1", max_total=10)
+        assert result == {"error": "Document not found"}
+
+
+class TestExportToFile:
+    def setup_method(self):
+        self.client = _GoogleDocsClient("test-token")
+
+    @staticmethod
+    def _serve(monkeypatch, response: httpx.Response) -> None:
+        transport = httpx.MockTransport(lambda request: response)
+        monkeypatch.setattr(
+            google_docs_tool, "get_shared_client", lambda: httpx.AsyncClient(transport=transport)
+        )
+
+    @pytest.mark.asyncio
+    async def test_streams_to_file(self, monkeypatch, tmp_path):
+        body = b"%PDF" * 50_000
+        self._serve(monkeypatch, httpx.Response(200, content=body))
+        path = tmp_path / "doc.pdf"
+
+        result = await self.client.export_document_to_file("d1", str(path))
+        assert result["size_bytes"] == len(body)
+        assert "content_base64" not in result
+        assert path.read_bytes() == body
+
+    @pytest.mark.asyncio
+    async def test_error_leaves_no_file(self, monkeypatch, tmp_path):
+        self._serve(monkeypatch, httpx.Response(404))
+        path = tmp_path / "doc.pdf"
+
+        result = await self.client.export_document_to_file("d1", str(path))
+        assert result == {"error": "Document not found"}
+        assert not path.exists()
+
+
+# --- Tool registration tests ---
+
+
+class TestGoogleDocsTools:
+    def setup_method(self):
+        self.mcp = MagicMock()
+        self.fns = []
+        self.mcp.tool.return_value = lambda fn: self.fns.append(fn) or fn
+        cred = MagicMock()
+        cred.get.return_value = "test-token"
+        register_tools(self.mcp, credentials=cred)
+
+    def _fn(self, name):
+        return next(f for f in self.fns if f.__name__ == name)
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_create_document_url(self, mock_request):
+        mock_request.return_value = httpx.Response(200, json={"documentId": "d1", "title": "Notes"})
+        result = await self._fn("google_docs_create_document")("Notes")
+        assert result["document_url"] == "https://docs.google.com/document/d/d1/edit"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("tool", "kwargs", "fragment"),
+        [
+            ("google_docs_create_document", {"title": "Notes"}, "expired"),
+            ("google_docs_get_document", {"document_id": "missing"}, "not found"),
+            ("google_docs_list_comments", {"document_id": "missing"}, "not found"),
+        ],
+    )
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_http_error_mapped(self, mock_request, tool, kwargs, fragment):
+        mock_request.return_value = httpx.Response(401 if fragment == "expired" else 404)
+        result = await self._fn(tool)(**kwargs)
+        assert fragment in result["error"].lower()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("tool", "kwargs"),
+        [
+            ("google_docs_insert_text", {"text": "Hello, World!"}),
+            ("google_docs_insert_text", {"text": "Inserted", "index": 10}),
+            ("google_docs_format_text", {"start_index": 1, "end_index": 10, "bold": True}),
+            ("google_docs_batch_update", {"requests_json": '[{"insertText": {}}]'}),
+            ("google_docs_create_list", {"start_index": 1, "end_index": 50}),
+            (
+                "google_docs_create_list",
+                {"start_index": 1, "end_index": 50, "list_type": "numbered"},
+            ),
+            (
+                "google_docs_insert_image",
+                {"image_uri": "https://example.com/image.png", "index": 1},
+            ),
+        ],
+    )
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_write_tools_succeed(self, mock_request, tool, kwargs):
+        mock_request.return_value = httpx.Response(200, json={"replies": []})
+        result = await self._fn(tool)("d1", **kwargs)
+        assert "error" not in result
+        mock_request.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_get_document(self, mock_request):
+        body = {"documentId": "d1", "title": "Notes", "body": {"content": []}}
+        mock_request.return_value = httpx.Response(200, json=body)
+        result = await self._fn("google_docs_get_document")("d1")
+        assert result["documentId"] == "d1"
+        assert result["title"] == "Notes"
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_replace_all_text_counts_occurrences(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            200, json={"replies": [{"replaceAllText": {"occurrencesChanged": 3}}]}
+        )
+        result = await self._fn("google_docs_replace_all_text")(
+            "d1", find_text="{{placeholder}}", replace_text="actual value"
+        )
+        assert result["occurrences_replaced"] == 3
+        assert result["find_text"] == "{{placeholder}}"
+        assert result["replace_text"] == "actual value"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("fmt", "mime_type"),
+        [
+            ("pdf", "application/pdf"),
+            ("docx", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+        ],
+    )
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_export_inline(self, mock_request, fmt, mime_type):
+        mock_request.return_value = httpx.Response(200, content=b"exported")
+        result = await self._fn("google_docs_export_content")("d1", format=fmt)
+        assert result["document_id"] == "d1"
+        assert result["mime_type"] == mime_type
+        assert base64.b64decode(result["content_base64"]) == b"exported"
+        assert result["size_bytes"] == len(b"exported")
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_add_comment(self, mock_request):
+        mock_request.return_value = httpx.Response(200, json={"id": "c1", "content": "Review this"})
+        result = await self._fn("google_docs_add_comment")("d1", "Review this")
+        assert result["id"] == "c1"
+        assert result["content"] == "Review this"
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_list_comments(self, mock_request):
+        mock_request.return_value = httpx.Response(
+            200, json={"comments": [{"id": "c1"}], "nextPageToken": "next"}
+        )
+        result = await self._fn("google_docs_list_comments")("d1")
+        assert result["document_id"] == "d1"
+        assert result["comments"] == [{"id": "c1"}]
+        assert result["next_page_token"] == "next"
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_timeout(self, mock_request):
+        mock_request.side_effect = httpx.TimeoutException("timed out")
+        result = await self._fn("google_docs_get_document")("d1")
+        assert result == {"error": "Request timed out"}
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_export_output_path_outside_sandbox(self, mock_request):
+        result = await self._fn("google_docs_export_content")(
+            "d1", output_path="../../etc/out.pdf", workspace_id="w", agent_id="a"
+        )
+        assert "error" in result
+        mock_request.assert_not_called()
+
+    def test_doc_urls_built_once(self):
+        urls = google_docs_tool._doc_urls("d1")
+        assert google_docs_tool._doc_urls("d1") is urls
+        assert str(urls.batch_update).endswith("/documents/d1:batchUpdate")
+        assert str(urls.export) == "https://www.googleapis.com/drive/v3/files/d1/export"
+
+    def test_client_reused_for_same_token(self):
+        client = google_docs_tool._client_for_token("t1")
+        assert google_docs_tool._client_for_token("t1") is client
+        assert google_docs_tool._client_for_token("t2") is not client
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("tool", "kwargs", "fragment"),
+        [
+            ("google_docs_format_text", {"start_index": 1, "end_index": 10}, "No formatting"),
+            ("google_docs_batch_update", {"requests_json": "not valid json"}, "Invalid JSON"),
+            ("google_docs_batch_update", {"requests_json": '{"not": "array"}'}, "array"),
+            ("google_docs_insert_image", {"image_uri": "", "index": 1}, "empty"),
+            (
+                "google_docs_insert_image",
+                {"image_uri": "ftp://example.com/image.png", "index": 1},
+                "scheme",
+            ),
+            (
+                "google_docs_insert_image",
+                {"image_uri": "example.com/image.png", "index": 1},
+                "scheme",
+            ),
+            ("google_docs_insert_image", {"image_uri": "javascript:alert('xss')", "index": 1}, ""),
+            (
+                "google_docs_replace_all_text",
+                {"find_text": "", "replace_text": "replacement"},
+                "empty",
+            ),
+        ],
+    )
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_invalid_input_rejected_before_request(
+        self, mock_request, tool, kwargs, fragment
+    ):
+        result = await self._fn(tool)("d1", **kwargs)
+        assert fragment in result["error"]
+        mock_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_service_account_json_without_key_is_not_a_token(self, mock_request):
+        mcp = MagicMock()
+        fns = []
+        mcp.tool.return_value = lambda fn: fns.append(fn) or fn
+        register_tools(mcp, credentials=None)
+        env = {
+            "GOOGLE_DOCS_ACCESS_TOKEN": "",
+            "GOOGLE_SERVICE_ACCOUNT_JSON": '{"type":"service_account"}',
+        }
+        with patch.dict("os.environ", env, clear=False):
+            tool = next(f for f in fns if f.__name__ == "google_docs_create_document")
+            result = await tool("Test Document")
+        assert "not configured" in result["error"]
+        mock_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch(_REQUEST, new_callable=AsyncMock)
+    async def test_pre_exchanged_service_account_token(self, mock_request):
+        mcp = MagicMock()
+        fns = []
+        mcp.tool.return_value = lambda fn: fns.append(fn) or fn
+        register_tools(mcp, credentials=None)
+        mock_request.return_value = httpx.Response(200, json={"documentId": "d1", "title": "Notes"})
+        env = {
+            "GOOGLE_DOCS_ACCESS_TOKEN": "",
+            "GOOGLE_SERVICE_ACCOUNT_JSON": '{"access_token": "pre-exchanged-token"}',
+        }
+        with patch.dict("os.environ", env, clear=False):
+            tool = next(f for f in fns if f.__name__ == "google_docs_create_document")
+            result = await tool("Notes")
+        assert result["document_id"] == "d1"
+        headers = mock_request.call_args.kwargs.get("headers") or {}
+        assert headers.get("Authorization") == "Bearer pre-exchanged-token"
+
+    @pytest.mark.asyncio
+    async def test_no_credentials(self):
+        mcp = MagicMock()
+        fns = []
+        mcp.tool.return_value = lambda fn: fns.append(fn) or fn
+        register_tools(mcp, credentials=None)
+        env = {"GOOGLE_DOCS_ACCESS_TOKEN": "", "GOOGLE_SERVICE_ACCOUNT_JSON": ""}
+        with patch.dict("os.environ", env, clear=False):
+            result = await next(f for f in fns if f.__name__ == "google_docs_get_document")("d1")
+        assert "not configured" in result["error"]